@@ -3,6 +3,7 @@ from django.contrib import admin
 from django.urls import path
 from django.utils.translation import gettext_lazy as _
 
+from dal import autocomplete
 from smart_media.admin import SmartModelAdmin
 
 from ..forms import ArticleAdminForm
@@ -10,6 +11,7 @@ from ..models import Article
 from ..views.admin import ArticleAdminTranslateView
 
 from ..admin_filters import (
+    CategoryAutocompleteFilter,
     LanguageListFilter,
     PublicationFilter,
     TranslationStateListFilter,
@@ -43,7 +45,7 @@ class ArticleAdmin(SmartModelAdmin):
         "pinned",
         "featured",
         "private",
-        "categories",
+        CategoryAutocompleteFilter,
     )
     prepopulated_fields = {
         "slug": ("title",),
@@ -57,9 +59,7 @@ class ArticleAdmin(SmartModelAdmin):
         "content",
     ]
     filter_horizontal = (
-        "categories",
         "authors",
-        "related",
     )
     fieldsets = (
         (
@@ -132,6 +132,21 @@ class ArticleAdmin(SmartModelAdmin):
         css = settings.LOTUS_ADMIN_ARTICLE_ASSETS.get("css", None)
         js = settings.LOTUS_ADMIN_ARTICLE_ASSETS.get("js", None)
 
+    @property
+    def media(self):
+        """
+        Include the autocomplete assets for the category filter.
+        """
+        return super().media + autocomplete.ModelSelect2(
+            url="lotus:category-autocomplete"
+        ).media
+
+    def get_queryset(self, request):
+        """
+        Annotate articles with their publication state.
+        """
+        return super().get_queryset(request).annotate_published()
+
     def language_name(self, obj):
         """
         Return humanized name for object language code.
@@ -153,16 +168,22 @@ class ArticleAdmin(SmartModelAdmin):
     def is_published(self, obj):
         """
         Check for all publication criterias.
+
+        This use the annotation from queryset if any.
         """
+        if hasattr(obj, "published"):
+            return obj.published
+
         return obj.is_published()
     is_published.short_description = _("published")
     is_published.boolean = True
+    is_published.admin_order_field = "published"
 
     def is_original(self, obj):
         """
         Check article is an original or a translation.
         """
-        return obj.original is None
+        return obj.original_id is None
     is_original.short_description = _("original")
     is_original.boolean = True
 
@@ -105,7 +105,7 @@ class CategoryAdmin(SmartModelAdmin):
         """
         Check article is an original or a translation.
         """
-        return obj.original is None
+        return obj.original_id is None
     is_original.short_description = _("original")
     is_original.boolean = True
 
@@ -1,4 +1,5 @@
 from django.contrib import admin
+from django.urls import reverse
 from django.utils.translation import gettext_lazy as _
 
 from .choices import get_language_choices
@@ -71,9 +72,82 @@ class PublicationFilter(admin.SimpleListFilter):
     def queryset(self, request, queryset):
         """
         Filter on published or unpublished article depending value is true or false.
+
+        The publication state annotation is used if queryset have it.
         """
+        if "published" in queryset.query.annotations:
+            if self.value() == "true":
+                return queryset.filter(published=True)
+
+            if self.value() == "false":
+                return queryset.filter(published=False)
+
+            return queryset
+
         if self.value() == "true":
             return queryset.get_published()
 
         if self.value() == "false":
             return queryset.get_unpublished()
+
+
+class CategoryAutocompleteFilter(admin.SimpleListFilter):
+    """
+    Filter articles on a category selected from an autocomplete input.
+
+    Opposed to a common relation filter, this does not list every categories, only the
+    selected one is loaded so it scales to any number of categories.
+    """
+    title = _("category")
+    template = "admin/lotus/category_autocomplete_filter.html"
+
+    # Parameter for the filter that will be used in the URL query.
+    parameter_name = "category"
+
+    def has_output(self):
+        """
+        Filter is always displayed since choices come from the autocomplete.
+        """
+        return True
+
+    def lookups(self, request, model_admin):
+        """
+        Only the selected category is a choice.
+        """
+        from .models import Category
+
+        value = self.value()
+        if not value or not value.isdigit():
+            return ()
+
+        return [
+            (str(item.id), "{} [{}]".format(item.title, item.get_language_display()))
+            for item in Category.objects.filter(id=value).only(
+                "id", "title", "language"
+            )
+        ]
+
+    def choices(self, changelist):
+        """
+        Set the autocomplete URL and the other filter parameters to preserve in the
+        autocomplete form.
+        """
+        self.autocomplete_url = reverse("lotus:category-autocomplete")
+        self.preserved_params = [
+            (key, value)
+            for key, values in changelist.get_filters_params().items()
+            if key != self.parameter_name
+            for value in (values if isinstance(values, list) else [values])
+        ]
+        if changelist.query:
+            self.preserved_params.append(("q", changelist.query))
+
+        yield from super().choices(changelist)
+
+    def queryset(self, request, queryset):
+        """
+        Filter on selected category if any.
+        """
+        value = self.value()
+        if value and value.isdigit():
+            return queryset.filter(categories=value)
@@ -5,7 +5,9 @@ from django.urls import path, include
 
 from rest_framework import routers
 
-from .viewsets import ArticleViewSet, AuthorViewSet, CategoryViewSet
+from .viewsets import (
+    ArticleViewSet, AuthorViewSet, CategoryViewSet, ChangeFeedViewSet,
+)
 
 
 app_name = "lotus-api"
@@ -28,6 +30,11 @@ router.register(
     CategoryViewSet,
     basename="category"
 )
+router.register(
+    r"changes",
+    ChangeFeedViewSet,
+    basename="changes"
+)
 
 
 urlpatterns = [
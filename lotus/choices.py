@@ -75,3 +75,34 @@ def get_category_template_default():
     Callable to get default Category template.
     """
     return settings.LOTUS_CATEGORY_DETAIL_TEMPLATES[0][0]
+
+
+THUMBNAIL_JOB_PENDING = 0
+"""
+Pending thumbnail job status numeric value
+"""
+
+THUMBNAIL_JOB_RUNNING = 10
+"""
+Running thumbnail job status numeric value
+"""
+
+THUMBNAIL_JOB_DONE = 20
+"""
+Done thumbnail job status numeric value
+"""
+
+THUMBNAIL_JOB_FAILED = 30
+"""
+Failed thumbnail job status numeric value
+"""
+
+THUMBNAIL_JOB_STATUS_CHOICES = (
+    (THUMBNAIL_JOB_PENDING, _("pending")),
+    (THUMBNAIL_JOB_RUNNING, _("running")),
+    (THUMBNAIL_JOB_DONE, _("done")),
+    (THUMBNAIL_JOB_FAILED, _("failed")),
+)
+"""
+Thumbnail job status choice list
+"""
@@ -16,7 +16,10 @@ from ..settings import (
     LOTUS_CATEGORY_TREE_TAG_TEMPLATE,
     LOTUS_CRUMBS_TITLES,
     LOTUS_CATEGORY_SHORT_CRUMBS,
+    LOTUS_CATEGORY_INCLUDE_DESCENDANTS,
+    LOTUS_CATEGORY_PARENT_SAME_LANGUAGE,
     LOTUS_ALBUM_TAG_TEMPLATE,
+    LOTUS_ALBUM_CACHE_TIMEOUT,
     LOTUS_ADMIN_ARTICLE_ASSETS,
     LOTUS_ADMIN_CATEGORY_ASSETS,
     LOTUS_ADMIN_ALBUM_ASSETS,
@@ -25,6 +28,25 @@ from ..settings import (
     LOTUS_SITEMAP_CATEGORY_OPTIONS,
     LOTUS_SITEMAP_TAG_OPTIONS,
     LOTUS_API_ALLOW_DETAIL_LANGUAGE_SAFE,
+    LOTUS_THUMBNAIL_PREGENERATION,
+    LOTUS_THUMBNAIL_MAX_ATTEMPTS,
+    LOTUS_THUMBNAIL_JOB_TIMEOUT,
+    LOTUS_THUMBNAIL_JOB_RETENTION,
+    LOTUS_THUMBNAIL_SIZES,
+    LOTUS_READ_REPLICAS,
+    LOTUS_REPLICA_STICKINESS,
+    LOTUS_REPLICA_STICKY_COOKIE,
+    LOTUS_SURROGATE_KEY_PREFIX,
+    LOTUS_SURROGATE_KEY_HEADERS,
+    LOTUS_PURGE_BACKEND,
+    LOTUS_PURGE_BACKEND_OPTIONS,
+    LOTUS_FEED_LIMIT,
+    LOTUS_FEED_CACHE_TIMEOUT,
+    LOTUS_PAGE_CACHE_TIMEOUT,
+    LOTUS_API_CACHE_TIMEOUT,
+    LOTUS_CHANGEFEED_CHUNK_SIZE,
+    LOTUS_CHANGEFEED_SAFETY_MARGIN,
+    LOTUS_API_FAST_JSON,
 )
 
 
@@ -82,8 +104,14 @@ class LotusDefaultSettings:
 
     LOTUS_CATEGORY_SHORT_CRUMBS = LOTUS_CATEGORY_SHORT_CRUMBS
 
+    LOTUS_CATEGORY_INCLUDE_DESCENDANTS = LOTUS_CATEGORY_INCLUDE_DESCENDANTS
+
+    LOTUS_CATEGORY_PARENT_SAME_LANGUAGE = LOTUS_CATEGORY_PARENT_SAME_LANGUAGE
+
     LOTUS_ALBUM_TAG_TEMPLATE = LOTUS_ALBUM_TAG_TEMPLATE
 
+    LOTUS_ALBUM_CACHE_TIMEOUT = LOTUS_ALBUM_CACHE_TIMEOUT
+
     LOTUS_ADMIN_ARTICLE_ASSETS = LOTUS_ADMIN_ARTICLE_ASSETS
 
     LOTUS_ADMIN_CATEGORY_ASSETS = LOTUS_ADMIN_CATEGORY_ASSETS
@@ -99,3 +127,41 @@ class LotusDefaultSettings:
     LOTUS_SITEMAP_TAG_OPTIONS = LOTUS_SITEMAP_TAG_OPTIONS
 
     LOTUS_API_ALLOW_DETAIL_LANGUAGE_SAFE = LOTUS_API_ALLOW_DETAIL_LANGUAGE_SAFE
+
+    LOTUS_THUMBNAIL_PREGENERATION = LOTUS_THUMBNAIL_PREGENERATION
+
+    LOTUS_THUMBNAIL_MAX_ATTEMPTS = LOTUS_THUMBNAIL_MAX_ATTEMPTS
+
+    LOTUS_THUMBNAIL_JOB_TIMEOUT = LOTUS_THUMBNAIL_JOB_TIMEOUT
+
+    LOTUS_THUMBNAIL_JOB_RETENTION = LOTUS_THUMBNAIL_JOB_RETENTION
+
+    LOTUS_THUMBNAIL_SIZES = LOTUS_THUMBNAIL_SIZES
+
+    LOTUS_READ_REPLICAS = LOTUS_READ_REPLICAS
+
+    LOTUS_REPLICA_STICKINESS = LOTUS_REPLICA_STICKINESS
+
+    LOTUS_REPLICA_STICKY_COOKIE = LOTUS_REPLICA_STICKY_COOKIE
+
+    LOTUS_SURROGATE_KEY_PREFIX = LOTUS_SURROGATE_KEY_PREFIX
+
+    LOTUS_SURROGATE_KEY_HEADERS = LOTUS_SURROGATE_KEY_HEADERS
+
+    LOTUS_PURGE_BACKEND = LOTUS_PURGE_BACKEND
+
+    LOTUS_PURGE_BACKEND_OPTIONS = LOTUS_PURGE_BACKEND_OPTIONS
+
+    LOTUS_FEED_LIMIT = LOTUS_FEED_LIMIT
+
+    LOTUS_FEED_CACHE_TIMEOUT = LOTUS_FEED_CACHE_TIMEOUT
+
+    LOTUS_PAGE_CACHE_TIMEOUT = LOTUS_PAGE_CACHE_TIMEOUT
+
+    LOTUS_API_CACHE_TIMEOUT = LOTUS_API_CACHE_TIMEOUT
+
+    LOTUS_CHANGEFEED_CHUNK_SIZE = LOTUS_CHANGEFEED_CHUNK_SIZE
+
+    LOTUS_CHANGEFEED_SAFETY_MARGIN = LOTUS_CHANGEFEED_SAFETY_MARGIN
+
+    LOTUS_API_FAST_JSON = LOTUS_API_FAST_JSON
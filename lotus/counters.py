@@ -0,0 +1,261 @@
+"""
+Denormalized counters of published articles on categories.
+
+Each category stores the number of published articles it contains directly and in its
+whole subtree (an article in many descendants is counted once), for every articles and
+for public articles only. Only articles in the category language are counted.
+
+Counters are maintained from signals on article save and delete, on the article
+categories relation changes and on category move or delete. Only the changed
+categories and their ancestors are computed again. Command ``lotus_category_counts``
+computes them for every categories.
+
+Publication start and end dates depend on the current time, so counters are computed
+for the current date and each category stores in ``counts_expire`` the next
+publication start or end of an article from its subtree. Readers call
+``refresh_expired_counts`` (or check this date) to compute again the expired counters
+before using them.
+"""
+from django.apps import apps
+from django.db import models
+from django.utils import timezone
+
+from .surrogates import build_surrogate_key, purge_keys
+
+
+COUNTER_FIELDS = [
+    "direct_count",
+    "direct_public_count",
+    "subtree_count",
+    "subtree_public_count",
+]
+"""
+Names of the Category counter fields.
+"""
+
+COUNTER_LOADED_FIELDS = ["id", "path", "language", *COUNTER_FIELDS, "counts_expire"]
+"""
+Names of the Category fields to load to compute counters.
+"""
+
+
+def get_ancestor_paths(path, steplen):
+    """
+    Return the tree paths of a node and its ancestors.
+
+    Arguments:
+        path (string): Node tree path.
+        steplen (integer): Length of a tree path step.
+
+    Returns:
+        list: Paths from the root node to the given node.
+    """
+    return [path[:i] for i in range(steplen, len(path) + 1, steplen)]
+
+
+def compute_category_counts(category, target_date=None):
+    """
+    Compute the counters of a category from database.
+
+    Arguments:
+        category (lotus.models.Category): Category to compute.
+
+    Keyword Arguments:
+        target_date (datetime.datetime): Datetime timezone aware to count published
+            articles at, if empty default value will be the current datetime.
+
+    Returns:
+        dict: Counter values indexed on their field name and the next publication
+        start or end from category subtree with item ``counts_expire``.
+    """
+    Article = apps.get_model("lotus", "Article")
+    target_date = target_date or timezone.now()
+
+    public = models.Q(article__private=False)
+    direct = models.Q(category_id=category.pk)
+
+    counts = Article.categories.through.objects.filter(
+        *Article.objects.get_queryset().build_publication_conditions(
+            target_date=target_date,
+            language=category.language,
+            prefix="article__",
+        ),
+        category__path__startswith=category.path,
+    ).aggregate(
+        direct_count=models.Count("article_id", filter=direct),
+        direct_public_count=models.Count("article_id", filter=direct & public),
+        subtree_count=models.Count("article_id", distinct=True),
+        subtree_public_count=models.Count("article_id", distinct=True, filter=public),
+    )
+
+    counts["counts_expire"] = Article.objects.filter(
+        categories__path__startswith=category.path,
+        language=category.language,
+    ).get_next_transition(target_date=target_date)
+
+    return counts
+
+
+def update_categories_counts(categories, target_date=None):
+    """
+    Compute and save the counters of given categories.
+
+    Counters are saved with a queryset update so category signals are not sent and
+    modification date is unchanged, surrogate keys of categories with changed
+    counters are purged.
+
+    Arguments:
+        categories (iterable): Category objects with at least the fields from
+            ``COUNTER_LOADED_FIELDS`` loaded.
+
+    Keyword Arguments:
+        target_date (datetime.datetime): Datetime timezone aware to count published
+            articles at, if empty default value will be the current datetime.
+
+    Returns:
+        list: IDs of categories with changed counters.
+    """
+    Category = apps.get_model("lotus", "Category")
+    updated = []
+
+    for category in categories:
+        counts = compute_category_counts(category, target_date=target_date)
+
+        if any(getattr(category, name) != value for name, value in counts.items()):
+            Category.objects.filter(pk=category.pk).update(**counts)
+
+            if any(getattr(category, name) != counts[name] for name in COUNTER_FIELDS):
+                updated.append(category.pk)
+
+    if updated:
+        purge_keys([build_surrogate_key(Category, pk) for pk in updated])
+
+    return updated
+
+
+def update_counts_for_paths(paths):
+    """
+    Update the counters of categories at given tree paths and of their ancestors.
+
+    Arguments:
+        paths (iterable): Category tree paths.
+
+    Returns:
+        list: IDs of categories with changed counters.
+    """
+    Category = apps.get_model("lotus", "Category")
+
+    targets = set()
+    for path in paths:
+        targets.update(get_ancestor_paths(path, Category.steplen))
+
+    if not targets:
+        return []
+
+    return update_categories_counts(
+        Category.objects.filter(path__in=targets).only(
+            *COUNTER_LOADED_FIELDS
+        ).order_by("path")
+    )
+
+
+def refresh_expired_counts(target_date=None):
+    """
+    Compute again the counters of categories which reached their expiration date.
+
+    This only costs a query on an indexed field when no counters have expired.
+
+    Keyword Arguments:
+        target_date (datetime.datetime): Datetime timezone aware to count published
+            articles at, if empty default value will be the current datetime.
+
+    Returns:
+        list: IDs of categories with changed counters.
+    """
+    Category = apps.get_model("lotus", "Category")
+    target_date = target_date or timezone.now()
+
+    return update_categories_counts(
+        Category.objects.filter(counts_expire__lte=target_date).only(
+            *COUNTER_LOADED_FIELDS
+        ).order_by("path"),
+        target_date=target_date,
+    )
+
+
+def update_counts(category_ids):
+    """
+    Update the counters of given categories and of their ancestors.
+
+    Arguments:
+        category_ids (iterable): Category IDs.
+
+    Returns:
+        list: IDs of categories with changed counters.
+    """
+    Category = apps.get_model("lotus", "Category")
+
+    category_ids = set(category_ids or [])
+    if not category_ids:
+        return []
+
+    return update_counts_for_paths(
+        Category.objects.filter(pk__in=category_ids).values_list("path", flat=True)
+    )
+
+
+def article_counts_on_save(sender, instance, created=False, raw=False, **kwargs):
+    """
+    A ``post_save`` signal receiver to update the counters of article categories.
+
+    A new article has no categories yet, they are counted when they are added.
+    """
+    if raw or created:
+        return
+
+    update_counts(instance.categories.values_list("id", flat=True))
+
+
+def article_counts_on_pre_delete(sender, instance, **kwargs):
+    """
+    A ``pre_delete`` signal receiver to remember article categories before their
+    relations are deleted.
+    """
+    instance._counters_categories = list(
+        instance.categories.values_list("id", flat=True)
+    )
+
+
+def article_counts_on_delete(sender, instance, **kwargs):
+    """
+    A ``post_delete`` signal receiver to update the counters of the categories a
+    deleted article belonged to.
+    """
+    update_counts(getattr(instance, "_counters_categories", []))
+
+
+def categories_counts_on_change(sender, instance, action, reverse, pk_set, **kwargs):
+    """
+    A ``m2m_changed`` signal receiver for the article categories relation.
+
+    It supports changes from both sides of relation.
+    """
+    if action == "pre_clear":
+        instance._counters_categories = (
+            [instance.pk] if reverse else
+            list(instance.categories.values_list("id", flat=True))
+        )
+    elif action == "post_clear":
+        update_counts(getattr(instance, "_counters_categories", []))
+    elif action in ("post_add", "post_remove"):
+        update_counts([instance.pk] if reverse else pk_set)
+
+
+def category_counts_on_delete(sender, instance, **kwargs):
+    """
+    A ``post_delete`` signal receiver to update the counters of the ancestors of a
+    deleted category.
+    """
+    update_counts_for_paths(
+        get_ancestor_paths(instance.path, sender.steplen)[:-1]
+    )
@@ -22,6 +22,13 @@ class LanguageMismatchError(LotusException):
     pass
 
 
+class PrefetchProfileError(LotusException):
+    """
+    Raised when a prefetch profile contains an unknown relation name.
+    """
+    pass
+
+
 class Http500(Exception):
     """
     Raised from a view when a non blocking error (from bad configuration or else, not
@@ -0,0 +1,294 @@
+"""
+Syndication feeds for published articles.
+
+Every feed exists in RSS and Atom formats, for the whole article list and for a
+category, a tag or an author. Feeds only list published public articles and load
+only the article fields they need.
+
+Feed output is cached for ``LOTUS_FEED_CACHE_TIMEOUT`` seconds at most and never after
+the next publication start or end of an article. It is stored with the versions of its
+surrogate keys (see ``lotus.surrogates``), so a cached feed is dropped on the same
+content changes than the lists. Cache key is built from the host, the language, the
+path and only the query parameters a feed reads, so unrelated parameters do not
+create new cache entries. Feeds support conditional requests with
+header ``If-Modified-Since`` against their newest article ``last_update``.
+"""
+import hashlib
+from collections import namedtuple
+
+from django.conf import settings
+from django.contrib.syndication.views import Feed
+from django.http import HttpResponse
+from django.shortcuts import get_object_or_404
+from django.urls import reverse
+from django.utils.cache import get_conditional_response
+from django.utils.feedgenerator import Atom1Feed
+from django.utils.http import parse_http_date_safe, urlencode
+from django.utils.translation import gettext_lazy as _
+
+from taggit.models import Tag
+
+from .models import Article, Author, Category
+from .surrogates import (
+    build_listing_key, get_versioned, set_surrogate_headers, set_versioned,
+)
+from .utils.language import get_language_code
+
+
+FeedSource = namedtuple("FeedSource", ["language", "object"])
+"""
+Object given to feed methods, ``object`` is the category, tag or author the feed is
+for and is ``None`` for the global feed.
+"""
+
+
+class ArticleFeed(Feed):
+    """
+    RSS feed of the latest published articles for the current language.
+    """
+    title = _("Latest articles")
+    description = _("Latest published articles.")
+    source_model = None
+    """
+    Model of the feed source object, used to add its listing surrogate key.
+    """
+    query_parameters = []
+    """
+    Names of the query string parameters which change the feed output, only these
+    parameters are part of the feed cache key.
+    """
+
+    FEED_FIELDS = [
+        "id",
+        "language",
+        "title",
+        "slug",
+        "lead",
+        "introduction",
+        "publish_date",
+        "publish_time",
+        "last_update",
+    ]
+    """
+    Article fields loaded for feed items.
+    """
+
+    def get_object(self, request, *args, **kwargs):
+        return FeedSource(language=get_language_code(request), object=None)
+
+    def link(self, source):
+        return reverse("lotus:article-index")
+
+    def get_queryset(self, source):
+        """
+        Return published public articles for the feed source.
+        """
+        return Article.objects.get_published(
+            language=source.language,
+            private=False,
+        )
+
+    def items(self, source):
+        return self.get_queryset(source).only(*self.FEED_FIELDS).order_by(
+            "-publish_date", "-publish_time", "-id"
+        )[:settings.LOTUS_FEED_LIMIT]
+
+    def item_title(self, item):
+        return item.title
+
+    def item_description(self, item):
+        return item.introduction or item.lead
+
+    def item_pubdate(self, item):
+        return item.publish_datetime()
+
+    def item_updateddate(self, item):
+        return item.last_update
+
+    def get_cache_key(self, request):
+        """
+        Return cache key for a feed request.
+
+        Arguments:
+            request (django.http.request.HttpRequest): The feed request.
+
+        Returns:
+            string: Cache key.
+        """
+        parameters = sorted(
+            (name, value)
+            for name in self.query_parameters
+            for value in request.GET.getlist(name)
+        )
+        path = "{}:{}:{}?{}".format(
+            request.get_host(),
+            get_language_code(request),
+            request.path,
+            urlencode(parameters),
+        )
+
+        return "lotus-feed:{}".format(
+            hashlib.md5(path.encode("utf-8")).hexdigest(),
+        )
+
+    def get_surrogate_keys(self):
+        keys = [build_listing_key(Article)]
+        if self.source_model:
+            keys.append(build_listing_key(self.source_model))
+
+        return keys
+
+    def __call__(self, request, *args, **kwargs):
+        cache_key = self.get_cache_key(request)
+        payload = (
+            get_versioned(cache_key) if settings.LOTUS_FEED_CACHE_TIMEOUT else None
+        )
+
+        if payload is None:
+            response = super().__call__(request, *args, **kwargs)
+            payload = {
+                "content": response.content,
+                "content_type": response["Content-Type"],
+                "last_modified": response.get("Last-Modified"),
+            }
+            timeout = Article.objects.get_cache_timeout(
+                settings.LOTUS_FEED_CACHE_TIMEOUT
+            )
+            if timeout:
+                set_versioned(
+                    cache_key,
+                    payload,
+                    self.get_surrogate_keys(),
+                    timeout,
+                )
+
+        response = HttpResponse(
+            payload["content"],
+            content_type=payload["content_type"],
+        )
+        if payload["last_modified"]:
+            response["Last-Modified"] = payload["last_modified"]
+
+        response = get_conditional_response(
+            request,
+            last_modified=parse_http_date_safe(payload["last_modified"] or ""),
+            response=response,
+        )
+
+        return set_surrogate_headers(response, self.get_surrogate_keys())
+
+
+class CategoryArticleFeed(ArticleFeed):
+    """
+    RSS feed of the latest published articles for a category.
+    """
+    source_model = Category
+
+    def get_object(self, request, slug):
+        return FeedSource(
+            language=get_language_code(request),
+            object=get_object_or_404(
+                Category.objects.get_for_lang(get_language_code(request)),
+                slug=slug,
+            ),
+        )
+
+    def title(self, source):
+        return source.object.title
+
+    def description(self, source):
+        return source.object.lead or source.object.title
+
+    def link(self, source):
+        return source.object.get_absolute_url()
+
+    def get_queryset(self, source):
+        return super().get_queryset(source).filter(categories=source.object)
+
+
+class TagArticleFeed(ArticleFeed):
+    """
+    RSS feed of the latest published articles for a tag.
+    """
+    source_model = Tag
+
+    def get_object(self, request, tag):
+        return FeedSource(
+            language=get_language_code(request),
+            object=get_object_or_404(Tag, slug=tag),
+        )
+
+    def title(self, source):
+        return str(source.object)
+
+    def description(self, source):
+        return _("Latest published articles for tag '{}'.").format(source.object)
+
+    def link(self, source):
+        return reverse("lotus:tag-detail", kwargs={"tag": source.object.slug})
+
+    def get_queryset(self, source):
+        return super().get_queryset(source).filter(tags=source.object)
+
+
+class AuthorArticleFeed(ArticleFeed):
+    """
+    RSS feed of the latest published articles for an author.
+    """
+    source_model = Author
+
+    def get_object(self, request, username):
+        return FeedSource(
+            language=get_language_code(request),
+            object=get_object_or_404(Author, username=username),
+        )
+
+    def title(self, source):
+        return str(source.object)
+
+    def description(self, source):
+        return _("Latest published articles from '{}'.").format(source.object)
+
+    def link(self, source):
+        return source.object.get_absolute_url()
+
+    def get_queryset(self, source):
+        return super().get_queryset(source).filter(authors=source.object)
+
+
+class AtomFeedMixin:
+    """
+    Mixin to turn a RSS feed into an Atom feed.
+    """
+    feed_type = Atom1Feed
+
+    def subtitle(self, source):
+        return self._get_dynamic_attr("description", source)
+
+
+class ArticleAtomFeed(AtomFeedMixin, ArticleFeed):
+    """
+    Atom feed of the latest published articles for the current language.
+    """
+    pass
+
+
+class CategoryArticleAtomFeed(AtomFeedMixin, CategoryArticleFeed):
+    """
+    Atom feed of the latest published articles for a category.
+    """
+    pass
+
+
+class TagArticleAtomFeed(AtomFeedMixin, TagArticleFeed):
+    """
+    Atom feed of the latest published articles for a tag.
+    """
+    pass
+
+
+class AuthorArticleAtomFeed(AtomFeedMixin, AuthorArticleFeed):
+    """
+    Atom feed of the latest published articles for an author.
+    """
+    pass
@@ -2,9 +2,8 @@ from django import forms
 from django.conf import settings
 from django.db import models
 from django.utils.translation import gettext_lazy as _
-from django.contrib.admin.widgets import FilteredSelectMultiple
 
-from dal import autocomplete
+from dal import autocomplete, forward
 
 from ..models import Article, Category
 
@@ -34,9 +33,65 @@ class ArticleAdminForm(autocomplete.FutureModelForm):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
 
+        querysets = self.relation_querysets(
+            self.instance if self.instance.pk else None
+        )
+
+        # Relation widgets only render the selected items, choices are requested from
+        # autocomplete views which apply the same constraints from the edited article
+        forwarded = (
+            (forward.Const(self.instance.pk, "article"),)
+            if self.instance.pk
+            else ()
+        )
+
+        # Use the right model choices fields for translated relations
+        # NOTE: This trick drop the help_text from model
+        self.fields["original"] = TranslatedModelChoiceField(
+            queryset=querysets["original"],
+            widget=autocomplete.ModelSelect2(
+                url="lotus:article-autocomplete",
+                forward=forwarded + (forward.Const("original", "relation"),),
+            ),
+            required=False,
+            blank=True,
+        )
+        self.fields["related"] = TranslatedModelMultipleChoiceField(
+            queryset=querysets["related"],
+            widget=autocomplete.ModelSelect2Multiple(
+                url="lotus:article-autocomplete",
+                forward=forwarded + (forward.Const("related", "relation"),),
+            ),
+            required=False,
+            blank=True,
+        )
+        self.fields["categories"] = TranslatedModelMultipleChoiceField(
+            queryset=querysets["categories"],
+            widget=autocomplete.ModelSelect2Multiple(
+                url="lotus:category-autocomplete",
+                forward=forwarded,
+            ),
+            required=False,
+            blank=True,
+        )
+
+    @staticmethod
+    def relation_querysets(instance=None):
+        """
+        Build the querysets of allowed choices for article relations.
+
+        This is shared with autocomplete views so they apply the same constraints
+        than the form.
+
+        Keyword Arguments:
+            instance (lotus.models.Article): The edited article if any.
+
+        Returns:
+            dict: Querysets for ``original``, ``related`` and ``categories`` relations.
+        """
         # Model choices querysets for create form get all objects since there is no
         # data yet to constraint
-        if not self.instance.pk:
+        if instance is None:
             original_queryset = Article.objects.filter(original__isnull=True)
             related_queryset = Article.objects.all()
             category_queryset = Category.objects.all()
@@ -44,42 +99,26 @@ class ArticleAdminForm(autocomplete.FutureModelForm):
         else:
             # Avoid selecting itself, a translation or object with the same language
             original_queryset = Article.objects.filter(original__isnull=True).exclude(
-                models.Q(id=self.instance.pk) |
-                models.Q(language=self.instance.language)
+                models.Q(id=instance.pk) |
+                models.Q(language=instance.language)
             )
             # Avoid selecting itself or object with the same language
             related_queryset = Article.objects.filter(
-                language=self.instance.language
+                language=instance.language
             ).exclude(
-                id=self.instance.pk
+                id=instance.pk
             )
             # Avoid selecting object with a different language
             category_queryset = Category.objects.filter(
-                language=self.instance.language
+                language=instance.language
             )
 
-        # Enforce the right ordering for flat category list
-        category_queryset = category_queryset.order_by(*Category.COMMON_ORDER_BY)
-
-        # Use the right model choices fields for translated relations
-        # NOTE: This trick drop the help_text from model
-        self.fields["original"] = TranslatedModelChoiceField(
-            queryset=original_queryset,
-            required=False,
-            blank=True,
-        )
-        self.fields["related"] = TranslatedModelMultipleChoiceField(
-            queryset=related_queryset,
-            widget=FilteredSelectMultiple("articles", is_stacked=False),
-            required=False,
-            blank=True,
-        )
-        self.fields["categories"] = TranslatedModelMultipleChoiceField(
-            queryset=category_queryset,
-            widget=FilteredSelectMultiple("categories", is_stacked=False),
-            required=False,
-            blank=True,
-        )
+        return {
+            "original": original_queryset,
+            "related": related_queryset,
+            # Enforce the right ordering for flat category list
+            "categories": category_queryset.order_by(*Category.COMMON_ORDER_BY),
+        }
 
     def clean(self):
         """
@@ -48,52 +48,80 @@ class CategoryNodeAbstractForm(MoveNodeForm):
 
         return ("&nbsp;&nbsp;&nbsp;&nbsp;" * (level - 1)) + "└── "
 
+    @classmethod
+    def build_options(cls, queryset, excluded_path=None):
+        """
+        Build options for the given Category nodes in tree order.
+
+        Arguments:
+            queryset (queryset): Category nodes to list.
+
+        Keyword Arguments:
+            excluded_path (string): If given, nodes with a path starting with it are
+                ignored.
+
+        Returns:
+            list: Options as tuples of node id and label.
+        """
+        language_names = dict(queryset.model._meta.get_field("language").flatchoices)
+
+        options = []
+        for pk, path, depth, title, language in queryset.order_by("path").values_list(
+            "id", "path", "depth", "title", "language"
+        ):
+            # Ignore the edited node and its descendants
+            if excluded_path and path.startswith(excluded_path):
+                continue
+
+            name = "{indent}{name} [{lang}]".format(
+                indent=cls.mk_indent(depth),
+                name=escape(title),
+                lang=language_names.get(language, language),
+            )
+            options.append((pk, mark_safe(name)))
+
+        return options
+
     @classmethod
     def add_subtree(cls, for_node, node, options, excluded=None):
         """
         Build options tree with categories that are not excluded.
 
-        TODO: Right tree order should be applied on queryset
+        This is kept for compatibility since ``mk_dropdown_tree`` does not use it
+        anymore, it builds the options of the node subtree with ``build_options``.
         """
-        excluded = excluded or []
-
-        if cls.is_loop_safe(for_node, node):
-            for item, data in node.get_annotated_list(node):
-                # Ignore excluded items
-                if item.pk in excluded:
-                    continue
-
-                name = "{indent}{name} [{lang}]".format(
-                    indent=cls.mk_indent(item.get_depth()),
-                    name=escape(item),
-                    lang=item.get_language_display(),
-                )
-                options.append(
-                    (
-                        item.pk,
-                        mark_safe(name),
-                    )
-                )
+        if not cls.is_loop_safe(for_node, node):
+            return
+
+        options.extend(
+            cls.build_options(
+                type(node).get_tree(node).exclude(pk__in=excluded or [])
+            )
+        )
 
     @classmethod
     def mk_dropdown_tree(cls, model, for_node=None):
         """
         Build the choice list for available Category nodes.
 
-        The currently edited Category, if any, will be excluded along its descendants.
+        Nodes are retrieved with a single query ordered on their path, which is the
+        tree order. The currently edited Category, if any, will be excluded along its
+        descendants, since they are all the nodes with a path starting with the edited
+        node path.
 
-        TODO: Right tree order should be applied on queryset
+        If setting ``LOTUS_CATEGORY_PARENT_SAME_LANGUAGE`` is enabled, only the nodes
+        in the same language than the edited Category are available.
         """
-        descendants = []
-        if for_node:
-            descendants = list(
-                for_node.get_descendants().values_list("id", flat=True)
-            ) + [for_node.pk]
-
-        options = [(None, cls.PARENT_EMPTY_LABEL)]
-        for node in model.get_root_nodes():
-            cls.add_subtree(for_node, node, options, excluded=descendants)
-        return options
+        queryset = model.objects.all()
+        if for_node and for_node.pk and settings.LOTUS_CATEGORY_PARENT_SAME_LANGUAGE:
+            queryset = queryset.filter(language=for_node.language)
+
+        excluded_path = for_node.path if for_node and for_node.pk else None
+
+        return [(None, cls.PARENT_EMPTY_LABEL)] + cls.build_options(
+            queryset,
+            excluded_path=excluded_path,
+        )
 
 
 CategoryNodeForm = movenodeform_factory(Category, form=CategoryNodeAbstractForm)
@@ -1,3 +1,5 @@
+import datetime
+
 from django.conf import settings
 from django.db import models
 from django.utils import timezone
@@ -54,6 +56,29 @@ class LookupBuilder:
 
         return (
             models.Q(**base_lookups),
+        ) + self.build_window_conditions(target_date, prefix=prefix)
+
+    def build_window_conditions(self, target_date, prefix=None):
+        """
+        Return lookups to select entries which publication period includes a date.
+
+        Contrary to ``build_publication_conditions`` it does not care about status,
+        private or language.
+
+        Arguments:
+            target_date (datetime.datetime): Datetime timezone aware which must be
+                within the publication period.
+
+        Keyword Arguments:
+            prefix (string): Prefix to append on each lookup expression. Commonly used
+                to filter from a relation. Default is empty.
+
+        Returns:
+            tuple: Lookup conditions on publication start and end.
+        """
+        prefix = prefix or ""
+
+        return (
             models.Q(**{prefix + "publish_date__lt": target_date.date()}) |
             models.Q(
                 models.Q(**{prefix + "publish_date": target_date.date()}),
@@ -63,6 +88,55 @@ class LookupBuilder:
             models.Q(**{prefix + "publish_end": None}),
         )
 
+    def build_transition_conditions(self, since, until=None, prefix=None):
+        """
+        Return lookups to select entries with a publication start or end within a
+        period.
+
+        These entries may have changed their publication state during the period
+        without any edition.
+
+        Publication start date and time are stored without timezone and compared to
+        UTC datetimes like the current one from ``timezone.now()``, so period limits
+        are converted to UTC before being split into date and time.
+
+        Arguments:
+            since (datetime.datetime): Datetime timezone aware for the period start,
+                it is excluded from the period.
+
+        Keyword Arguments:
+            until (datetime.datetime): Datetime timezone aware for the period end, it
+                is included in the period. If empty default value will be the current
+                datetime.
+            prefix (string): Prefix to append on each lookup expression. Commonly used
+                to filter from a relation. Default is empty.
+
+        Returns:
+            tuple: Lookup conditions to select entries with a publication transition.
+        """
+        prefix = prefix or ""
+        since = since.astimezone(datetime.timezone.utc)
+        until = (until or timezone.now()).astimezone(datetime.timezone.utc)
+
+        return (
+            models.Q(
+                models.Q(**{prefix + "publish_date__gt": since.date()}) |
+                models.Q(
+                    models.Q(**{prefix + "publish_date": since.date()}),
+                    models.Q(**{prefix + "publish_time__gt": since.time()})
+                ),
+                models.Q(**{prefix + "publish_date__lt": until.date()}) |
+                models.Q(
+                    models.Q(**{prefix + "publish_date": until.date()}),
+                    models.Q(**{prefix + "publish_time__lte": until.time()})
+                ),
+            ) |
+            models.Q(**{
+                prefix + "publish_end__gt": since,
+                prefix + "publish_end__lte": until,
+            }),
+        )
+
     def build_language_conditions(self, language, prefix=None):
         """
         Return simple lookup to filter on language.
@@ -103,8 +177,15 @@ class LookupBuilder:
             will be all of its translations. For a translation article it will be its
             original article and all other original's translation articles.
         """
+        # Saved objects share a translation group key with all their siblings
+        if getattr(source, "translation_group", None):
+            return (
+                models.Q(translation_group=source.translation_group),
+                ~models.Q(id=source.id),
+            )
+
         # Original has just translation relations
-        if source.original is None:
+        if source.original_id is None:
             return (models.Q(original=source),)
 
         # Translations use complex lookups to regroup original and translations.
@@ -0,0 +1,30 @@
+from django.core.management.base import BaseCommand
+
+from lotus.counters import COUNTER_LOADED_FIELDS, update_categories_counts
+from lotus.models import Category
+
+
+class Command(BaseCommand):
+    """
+    Category article counters rebuild.
+    """
+    help = (
+        "Compute published article counters of every categories and save the "
+        "changed ones. Counters are already maintained on changes and computed "
+        "again when reading them after a publication start or end, so this is only "
+        "needed after an import or a migration."
+    )
+
+    def handle(self, *args, **options):
+        updated = update_categories_counts(
+            Category.objects.only(*COUNTER_LOADED_FIELDS).order_by("path").iterator()
+        )
+
+        if options["verbosity"] > 1 and updated:
+            self.stdout.write("  - {}".format(", ".join([str(v) for v in updated])))
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                "* Updated counters for {} category(ies)".format(len(updated))
+            )
+        )
@@ -0,0 +1,221 @@
+import os
+import re
+import subprocess
+import sys
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+
+IMPORTTIME_LINE = re.compile(
+    r"^import time:\s+(?P<self>\d+) \|\s+(?P<cumulative>\d+) \| (?P<name>.+)$"
+)
+"""
+Regular expression to parse a line from ``python -X importtime`` output.
+"""
+
+SETUP_MARKER = "lotus-import-benchmark:setup-done"
+"""
+Marker written once Django is set up so the entry point imports can be told apart.
+"""
+
+SCRIPT = """
+import importlib
+import sys
+
+import django
+from django.conf import settings
+
+excluded = sys.argv[2:]
+if excluded:
+    settings.INSTALLED_APPS = [
+        app for app in settings.INSTALLED_APPS if app not in excluded
+    ]
+
+django.setup()
+sys.stderr.write("{marker}\\n")
+importlib.import_module(sys.argv[1])
+""".format(marker=SETUP_MARKER)
+"""
+Script executed in a new interpreter to measure an entry point.
+"""
+
+
+def parse_importtime(output):
+    """
+    Parse the output of ``python -X importtime`` from the benchmark script.
+
+    Arguments:
+        output (string): Standard error output of the script.
+
+    Returns:
+        dict: The cumulative time of Django setup (``setup``) and of the entry point
+        (``total``) in microseconds, the number of modules imported by the entry
+        point (``modules``) and the time spent in each top level package imported by
+        the entry point (``packages``) in microseconds.
+    """
+    result = {"setup": 0, "total": 0, "modules": 0, "packages": {}}
+    after_setup = False
+
+    for line in output.splitlines():
+        if line.strip() == SETUP_MARKER:
+            after_setup = True
+            continue
+
+        match = IMPORTTIME_LINE.match(line)
+        if match is None:
+            continue
+
+        name = match.group("name")
+        # Only modules imported directly from the script are at top level
+        toplevel = not name.startswith("  ")
+        name = name.strip()
+
+        if not after_setup:
+            if toplevel:
+                result["setup"] += int(match.group("cumulative"))
+            continue
+
+        if toplevel:
+            result["total"] += int(match.group("cumulative"))
+
+        package = name.split(".")[0]
+        result["modules"] += 1
+        result["packages"][package] = (
+            result["packages"].get(package, 0) + int(match.group("self"))
+        )
+
+    return result
+
+
+class Command(BaseCommand):
+    """
+    Import time benchmark of Lotus entry points.
+    """
+    help = (
+        "Measure the import time of Lotus entry points with 'python -X importtime'. "
+        "Each entry point is imported in a new interpreter once Django is set up, "
+        "the heaviest packages it imports are reported."
+    )
+
+    ENTRY_POINTS = [
+        "lotus.models",
+        "lotus.urls",
+        "lotus.templatetags.lotus",
+        "lotus.api_urls",
+    ]
+    """
+    Modules measured when no entry point is given.
+    """
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "entry_points",
+            nargs="*",
+            help="Python paths of modules to measure. Default to the Lotus ones.",
+        )
+        parser.add_argument(
+            "--exclude-app",
+            action="append",
+            default=[],
+            dest="excluded_apps",
+            help=(
+                "Application to remove from setting 'INSTALLED_APPS' before Django "
+                "setup, like 'django.contrib.admin' to measure a deployment without "
+                "admin. Can be given many times."
+            ),
+        )
+        parser.add_argument(
+            "--top",
+            type=int,
+            default=5,
+            help="Number of heaviest packages to report for each entry point.",
+        )
+        parser.add_argument(
+            "--budget",
+            type=float,
+            default=None,
+            help=(
+                "Maximum import time in milliseconds for each entry point. Command "
+                "fails if an entry point is over it."
+            ),
+        )
+
+    def measure(self, entry_point, excluded_apps=None):
+        """
+        Import an entry point from a new interpreter and parse its import times.
+
+        Arguments:
+            entry_point (string): Python path of module to import.
+
+        Keyword Arguments:
+            excluded_apps (list): Applications to remove from installed ones.
+
+        Returns:
+            dict: Measures as returned by ``parse_importtime``.
+        """
+        env = dict(
+            os.environ,
+            DJANGO_SETTINGS_MODULE=settings.SETTINGS_MODULE,
+            PYTHONPATH=os.pathsep.join([path for path in sys.path if path]),
+        )
+
+        process = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", SCRIPT, entry_point] +
+            list(excluded_apps or []),
+            env=env,
+            capture_output=True,
+            text=True,
+        )
+
+        if process.returncode != 0:
+            raise CommandError(
+                "Unable to import '{}':\n{}".format(
+                    entry_point,
+                    process.stderr.strip().splitlines()[-1],
+                )
+            )
+
+        return parse_importtime(process.stderr)
+
+    def handle(self, *args, **options):
+        entry_points = options["entry_points"] or self.ENTRY_POINTS
+        over_budget = []
+
+        for entry_point in entry_points:
+            measures = self.measure(entry_point, options["excluded_apps"])
+            total = measures["total"] / 1000
+
+            self.stdout.write(
+                "* {name}: {total:.1f}ms, {modules} module(s) (setup {setup:.1f}ms)"
+                .format(
+                    name=entry_point,
+                    total=total,
+                    modules=measures["modules"],
+                    setup=measures["setup"] / 1000,
+                )
+            )
+
+            packages = sorted(
+                measures["packages"].items(),
+                key=lambda item: item[1],
+                reverse=True,
+            )
+            for package, elapsed in packages[:options["top"]]:
+                self.stdout.write(
+                    "  - {package}: {elapsed:.1f}ms".format(
+                        package=package,
+                        elapsed=elapsed / 1000,
+                    )
+                )
+
+            if options["budget"] is not None and total > options["budget"]:
+                over_budget.append(entry_point)
+
+        if over_budget:
+            raise CommandError(
+                "Import time budget of {budget}ms exceeded by: {names}".format(
+                    budget=options["budget"],
+                    names=", ".join(over_budget),
+                )
+            )
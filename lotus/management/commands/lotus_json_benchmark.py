@@ -0,0 +1,143 @@
+import json
+import timeit
+from pathlib import Path
+
+from django.core.management.base import BaseCommand, CommandError
+from django.test import RequestFactory
+
+from rest_framework.renderers import JSONRenderer
+from rest_framework.request import Request
+
+from lotus import renderers
+from lotus.models import Article
+from lotus.serializers import ArticleSerializer
+from lotus.utils.jsons import ExtendedJsonEncoder
+
+
+class Command(BaseCommand):
+    """
+    JSON serialization microbenchmark.
+    """
+    help = (
+        "Measure JSON encoding time of article payloads with the DRF JSON renderer, "
+        "the Lotus JSON renderer (with and without orjson) and the extended JSON "
+        "encoder. Payloads are built from existing articles."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--limit",
+            type=int,
+            default=50,
+            help="Number of articles to include in payloads.",
+        )
+        parser.add_argument(
+            "--iterations",
+            type=int,
+            default=100,
+            help="Number of encodings for each measure.",
+        )
+        parser.add_argument(
+            "--host",
+            type=str,
+            default="localhost",
+            help=(
+                "Host name used to build payload URLs, it must be allowed from "
+                "setting 'ALLOWED_HOSTS'."
+            ),
+        )
+
+    def get_payloads(self, limit, host):
+        """
+        Return the API payload and the raw field values of articles.
+        """
+        articles = list(
+            Article.objects.select_related("album").order_by("-pk")[:limit]
+        )
+        if not articles:
+            raise CommandError("There is no article to build payloads from.")
+
+        request = Request(RequestFactory().get("/", HTTP_HOST=host))
+        api_payload = ArticleSerializer(
+            articles,
+            many=True,
+            context={"request": request},
+        ).data
+
+        # Raw values with the extra types supported by the extended encoder
+        raw_payload = [
+            {
+                **values,
+                "cover": Path(values["cover"]),
+                "object": article,
+                "related_ids": {article.pk},
+            }
+            for article, values in zip(
+                articles,
+                Article.objects.filter(
+                    pk__in=[article.pk for article in articles]
+                ).order_by("-pk").values(),
+            )
+        ]
+
+        return api_payload, raw_payload
+
+    def get_measures(self, api_payload, raw_payload):
+        """
+        Return the encoding functions to measure.
+        """
+        renderer = renderers.LotusJSONRenderer()
+
+        def without_orjson(data):
+            orjson = renderers.orjson
+            renderers.orjson = None
+            try:
+                return renderer.render(data)
+            finally:
+                renderers.orjson = orjson
+
+        measures = [
+            ("DRF JSONRenderer", api_payload, JSONRenderer().render),
+            ("LotusJSONRenderer (pure Python)", api_payload, without_orjson),
+        ]
+
+        if renderers.orjson is not None:
+            measures.append(
+                ("LotusJSONRenderer (orjson)", api_payload, renderer.render)
+            )
+
+        measures.append(
+            (
+                "ExtendedJsonEncoder",
+                raw_payload,
+                lambda data: json.dumps(data, cls=ExtendedJsonEncoder),
+            )
+        )
+
+        return measures
+
+    def handle(self, *args, **options):
+        api_payload, raw_payload = self.get_payloads(
+            options["limit"],
+            options["host"],
+        )
+
+        self.stdout.write(
+            "Encoding {} article(s) {} time(s)".format(
+                len(api_payload),
+                options["iterations"],
+            )
+        )
+
+        for name, payload, func in self.get_measures(api_payload, raw_payload):
+            elapsed = timeit.timeit(
+                lambda: func(payload),
+                number=options["iterations"],
+            )
+            self.stdout.write(
+                "* {name}: {total:.4f}s ({each:.1f}µs per payload)".format(
+                    name=name,
+                    total=elapsed,
+                    each=elapsed / options["iterations"] * 1000000,
+                )
+            )
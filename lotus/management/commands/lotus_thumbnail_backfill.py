@@ -0,0 +1,66 @@
+from django.apps import apps
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from lotus.models import ThumbnailJob
+
+
+class Command(BaseCommand):
+    """
+    Thumbnail job backfill.
+    """
+    help = (
+        "Enqueue thumbnail jobs for every existing media from models defined in "
+        "setting 'LOTUS_THUMBNAIL_SIZES'. Jobs are then processed with command "
+        "'lotus_thumbnail_worker'."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--model",
+            type=str,
+            metavar="LABEL",
+            default=[],
+            action="append",
+            help=(
+                "A lowercase model label (like 'lotus.article') to enqueue. This is a "
+                "cumulative argument. By default every model from setting "
+                "'LOTUS_THUMBNAIL_SIZES' is enqueued."
+            ),
+        )
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=500,
+            help="Number of objects to read from database for each chunk.",
+        )
+
+    def handle(self, *args, **options):
+        labels = options["model"] or list(settings.LOTUS_THUMBNAIL_SIZES.keys())
+
+        unknowns = [
+            label for label in labels
+            if label not in settings.LOTUS_THUMBNAIL_SIZES
+        ]
+        if unknowns:
+            raise CommandError(
+                "Model label(s) not defined in 'LOTUS_THUMBNAIL_SIZES': {}".format(
+                    ", ".join(unknowns)
+                )
+            )
+
+        for label in labels:
+            model = apps.get_model(label)
+            field_names = list(settings.LOTUS_THUMBNAIL_SIZES[label].keys())
+
+            queryset = model.objects.only("pk", *field_names).order_by("pk")
+
+            created = 0
+            for instance in queryset.iterator(chunk_size=options["chunk_size"]):
+                created += len(ThumbnailJob.objects.enqueue(instance, field_names))
+
+            self.stdout.write(
+                self.style.SUCCESS(
+                    "* Enqueued {} job(s) for '{}'".format(created, label)
+                )
+            )
@@ -0,0 +1,105 @@
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from lotus.choices import THUMBNAIL_JOB_FAILED
+from lotus.models import ThumbnailJob
+from lotus.thumbnailing import process_jobs
+
+
+class Command(BaseCommand):
+    """
+    Thumbnail job worker.
+    """
+    help = (
+        "Process pending thumbnail jobs to pre-generate thumbnails for Article, "
+        "Category and AlbumItem medias. Jobs are processed by batch in a thread pool. "
+        "On default the command stops once the queue is empty, use the loop option to "
+        "keep polling the queue. Done jobs older than setting "
+        "'LOTUS_THUMBNAIL_JOB_RETENTION' are deleted once the queue is empty."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=4,
+            help=(
+                "Maximum number of concurrent threads. Use 1 to process jobs "
+                "sequentially."
+            ),
+        )
+        parser.add_argument(
+            "--batch",
+            type=int,
+            default=50,
+            help="Number of jobs to claim for each batch.",
+        )
+        parser.add_argument(
+            "--loop",
+            action="store_true",
+            help="Keep polling the queue instead of stopping once it is empty.",
+        )
+        parser.add_argument(
+            "--interval",
+            type=float,
+            default=5.0,
+            help="Delay in seconds to wait between polls in loop mode.",
+        )
+        parser.add_argument(
+            "--retry-failed",
+            action="store_true",
+            help=(
+                "Process also the jobs which have previously failed, until they "
+                "reach the maximum number of attempts from setting "
+                "'LOTUS_THUMBNAIL_MAX_ATTEMPTS'. Without the loop option, a job is "
+                "processed once at most."
+            ),
+        )
+
+    def handle(self, *args, **options):
+        if options["workers"] < 1 or options["batch"] < 1:
+            raise CommandError("Arguments 'workers' and 'batch' must be at least 1.")
+
+        processed = failed = 0
+        # Jobs handled in this run, a run without loop must not retry them
+        handled = []
+        # Prune done jobs on the first empty queue then each time it is drained
+        prune = True
+
+        while True:
+            jobs = ThumbnailJob.objects.claim(
+                limit=options["batch"],
+                retry_failed=options["retry_failed"],
+                exclude=None if options["loop"] else handled,
+            )
+
+            if not jobs:
+                if prune:
+                    pruned = ThumbnailJob.objects.prune()
+                    prune = False
+                    if pruned:
+                        self.stdout.write("* Deleted {} done job(s)".format(pruned))
+
+                if not options["loop"]:
+                    break
+
+                time.sleep(options["interval"])
+                continue
+
+            prune = True
+
+            for job in process_jobs(jobs, workers=options["workers"]):
+                handled.append(job.pk)
+                processed += 1
+                if job.status == THUMBNAIL_JOB_FAILED:
+                    failed += 1
+                    self.stdout.write(
+                        self.style.ERROR("* Failed job {}: {}".format(job, job.error))
+                    )
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                "* Processed {} job(s) with {} failure(s)".format(processed, failed)
+            )
+        )
@@ -0,0 +1,70 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.db.models import F
+from django.db.models.functions import Coalesce
+
+from lotus.models import Article, Category
+
+
+class Command(BaseCommand):
+    """
+    Translation group consistency check.
+    """
+    help = (
+        "Check that every article and category translation group matches its original "
+        "relation. Inconsistent objects are only updated with option '--fix'."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--fix",
+            action="store_true",
+            help="Update inconsistent translation groups.",
+        )
+
+    def handle(self, *args, **options):
+        expected_group = Coalesce(F("original_id"), F("id"))
+        unfixed = 0
+
+        for model in (Article, Category):
+            label = model._meta.label_lower
+            ids = list(
+                model.objects.annotate(expected_group=expected_group).exclude(
+                    translation_group=F("expected_group")
+                ).order_by("id").values_list("id", flat=True)
+            )
+
+            if not ids:
+                self.stdout.write(
+                    self.style.SUCCESS("* No inconsistency for '{}'".format(label))
+                )
+                continue
+
+            if options["verbosity"] > 1:
+                self.stdout.write("  - {}".format(", ".join([str(v) for v in ids])))
+
+            if options["fix"]:
+                model.objects.filter(id__in=ids).update(
+                    translation_group=expected_group
+                )
+                self.stdout.write(
+                    self.style.SUCCESS(
+                        "* Fixed {} inconsistent object(s) for '{}'".format(
+                            len(ids), label
+                        )
+                    )
+                )
+            else:
+                unfixed += len(ids)
+                self.stdout.write(
+                    self.style.WARNING(
+                        "* Found {} inconsistent object(s) for '{}'".format(
+                            len(ids), label
+                        )
+                    )
+                )
+
+        if unfixed:
+            raise CommandError(
+                "There is {} inconsistent object(s), use option '--fix' to update "
+                "them.".format(unfixed)
+            )
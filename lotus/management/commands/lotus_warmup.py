@@ -0,0 +1,260 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.contrib.sites.models import Site
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connections
+from django.test import Client
+from django.urls import reverse
+from django.utils import translation
+
+from lotus.sitemaps import (
+    ArticleSitemap, AuthorSitemap, CategorySitemap, TagSitemap,
+)
+
+
+class Command(BaseCommand):
+    """
+    Cache warm-up of Lotus pages.
+    """
+    help = (
+        "Request the main Lotus pages to warm up caches, typically after a deploy. "
+        "Index pages are requested for each language and detail pages are enumerated "
+        "from Lotus sitemaps. Timings are reported per URL pattern. Requests are "
+        "made from this process, so only a cache backend shared with the site "
+        "processes (like Redis or Memcached) is warmed up, not a local memory one."
+    )
+
+    INDEX_URLNAMES = [
+        "lotus:article-index",
+        "lotus:category-index",
+        "lotus:author-index",
+        "lotus:tag-index",
+    ]
+    """
+    URL names of index pages, they are paginated lists.
+    """
+
+    SITEMAPS = [
+        # Sitemap class and if its detail pages are paginated lists
+        (ArticleSitemap, False),
+        (CategorySitemap, True),
+        (AuthorSitemap, True),
+        (TagSitemap, True),
+    ]
+    """
+    Sitemaps used to enumerate detail pages.
+    """
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--languages",
+            type=str,
+            default="",
+            help=(
+                "Comma separated language codes of index pages to request. Default "
+                "to every languages from setting 'LANGUAGES'."
+            ),
+        )
+        parser.add_argument(
+            "--pages",
+            type=int,
+            default=1,
+            help="Maximum number of pages to request for each list.",
+        )
+        parser.add_argument(
+            "--limit",
+            type=int,
+            default=None,
+            help="Maximum number of detail pages to request from each sitemap.",
+        )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=4,
+            help=(
+                "Number of concurrent requests. With a single worker requests are "
+                "made from the current thread."
+            ),
+        )
+        parser.add_argument(
+            "--host",
+            type=str,
+            default=None,
+            help=(
+                "Host name used for requests, it must be allowed from setting "
+                "'ALLOWED_HOSTS'. Page cache keys include the host so it must be the "
+                "one used by site visitors. Default to the domain of the current Site."
+            ),
+        )
+        parser.add_argument(
+            "--url",
+            action="append",
+            default=[],
+            dest="urls",
+            help=(
+                "Additional URL path to request, like the sitemap. Can be given "
+                "many times."
+            ),
+        )
+
+    def get_languages(self, value):
+        """
+        Return language codes to warm up.
+        """
+        available = [code for code, name in settings.LANGUAGES]
+        if not value:
+            return available
+
+        languages = [item.strip() for item in value.split(",") if item.strip()]
+        unknowns = [item for item in languages if item not in available]
+        if unknowns:
+            raise CommandError(
+                "Unknown language(s): {}".format(", ".join(unknowns))
+            )
+
+        return languages
+
+    def get_targets(self, languages, pages, limit, urls):
+        """
+        Return the URLs to request.
+
+        Returns:
+            list: Tuples of URL path, language code (or ``None``) and maximum number of
+            pages to request.
+        """
+        targets = []
+
+        for language in languages:
+            with translation.override(language):
+                targets.extend([
+                    (reverse(name), language, pages)
+                    for name in self.INDEX_URLNAMES
+                ])
+
+        for sitemap_class, paginated in self.SITEMAPS:
+            sitemap = sitemap_class()
+            # Translations are requested as any other object
+            if hasattr(sitemap, "translations"):
+                sitemap.translations = False
+
+            items = sitemap.items()
+            if limit is not None:
+                items = items[:limit]
+
+            targets.extend([
+                (sitemap.location(item), None, pages if paginated else 1)
+                for item in items
+            ])
+
+        targets.extend([(url, None, 1) for url in urls])
+
+        return targets
+
+    def warm(self, host, url, language, pages):
+        """
+        Request a URL and its next pages until the maximum number of pages or a
+        response which is not successful.
+
+        Returns:
+            list: Tuples of URL pattern name, requested URL, status code and elapsed
+            time in seconds for each request.
+        """
+        client = Client(raise_request_exception=False, HTTP_HOST=host)
+        headers = {"HTTP_ACCEPT_LANGUAGE": language} if language else {}
+        results = []
+
+        for page in range(1, pages + 1):
+            page_url = url if page == 1 else "{}?page={}".format(url, page)
+
+            start = time.perf_counter()
+            response = client.get(page_url, **headers)
+            elapsed = time.perf_counter() - start
+
+            resolver_match = response.wsgi_request.resolver_match
+            results.append((
+                resolver_match.view_name if resolver_match else "(unresolved)",
+                page_url,
+                response.status_code,
+                elapsed,
+            ))
+
+            if response.status_code != 200:
+                break
+
+        return results
+
+    def warm_in_thread(self, host, url, language, pages):
+        """
+        Same as ``warm`` but for a pool thread.
+        """
+        try:
+            return self.warm(host, url, language, pages)
+        finally:
+            # Connections opened from a pool thread are not closed by Django
+            connections.close_all()
+
+    def handle(self, *args, **options):
+        if options["pages"] < 1 or options["workers"] < 1:
+            raise CommandError("Options 'pages' and 'workers' must be at least 1.")
+
+        host = options["host"] or Site.objects.get_current().domain
+
+        targets = self.get_targets(
+            self.get_languages(options["languages"]),
+            options["pages"],
+            options["limit"],
+            options["urls"],
+        )
+
+        self.stdout.write(
+            "Warming up {} URL(s) for host '{}'".format(len(targets), host)
+        )
+
+        start = time.perf_counter()
+        if options["workers"] == 1:
+            chunks = [
+                self.warm(host, *target)
+                for target in targets
+            ]
+        else:
+            with ThreadPoolExecutor(max_workers=options["workers"]) as executor:
+                chunks = list(executor.map(
+                    lambda target: self.warm_in_thread(host, *target),
+                    targets,
+                ))
+        total = time.perf_counter() - start
+
+        patterns = {}
+        failures = []
+        for name, url, status, elapsed in [item for chunk in chunks for item in chunk]:
+            patterns.setdefault(name, []).append(elapsed)
+            # Pages after the last one are expected to be missing
+            if status != 200 and not (status == 404 and "?page=" in url):
+                failures.append((url, status))
+
+        for name, timings in sorted(patterns.items()):
+            self.stdout.write(
+                "* {name}: {count} request(s), {avg:.1f}ms average, "
+                "{max:.1f}ms max".format(
+                    name=name,
+                    count=len(timings),
+                    avg=sum(timings) / len(timings) * 1000,
+                    max=max(timings) * 1000,
+                )
+            )
+
+        for url, status in failures:
+            self.stdout.write(
+                self.style.WARNING("  - {url}: status {status}".format(
+                    url=url,
+                    status=status,
+                ))
+            )
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                "Done in {:.2f}s with {} failure(s)".format(total, len(failures))
+            )
+        )
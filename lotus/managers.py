@@ -1,11 +1,50 @@
+import datetime
+import math
+
+from django.conf import settings
 from django.db import models
+from django.utils import timezone
 
 from treebeard.mp_tree import MP_NodeManager, MP_NodeQuerySet
 
+from .choices import (
+    STATUS_PUBLISHED,
+    THUMBNAIL_JOB_DONE,
+    THUMBNAIL_JOB_FAILED,
+    THUMBNAIL_JOB_PENDING,
+    THUMBNAIL_JOB_RUNNING,
+)
 from .lookups import LookupBuilder
+from .routers import pick_replica
+
+
+class ReplicaQuerySetMixin:
+    """
+    Mixin to add the read replica hook to querysets.
+    """
+    def using_replica(self, alias=None):
+        """
+        Return a queryset reading from a replica.
+
+        This is commonly used by code running outside of a request where the replica
+        middleware is not involved. Queryset is left unchanged if there is no enabled
+        replica from setting ``LOTUS_READ_REPLICAS``.
+
+        Keyword Arguments:
+            alias (string): Replica alias to use. If not given, a replica is picked
+                from setting ``LOTUS_READ_REPLICAS``.
+
+        Returns:
+            queryset: Queryset to read from a replica.
+        """
+        alias = alias or pick_replica()
+        if alias is None:
+            return self
+
+        return self.using(alias)
 
 
-class BasePublishedQuerySet(LookupBuilder, models.QuerySet):
+class BasePublishedQuerySet(ReplicaQuerySetMixin, LookupBuilder, models.QuerySet):
     """
     Base queryset for publication methods.
     """
@@ -38,6 +77,125 @@ class BasePublishedQuerySet(LookupBuilder, models.QuerySet):
             )
         )
 
+    def annotate_published(self, target_date=None, name="published"):
+        """
+        Annotate entries with their publication state computed from SQL.
+
+        The annotation can be used to sort or filter entries and avoid to compute
+        publication state for each object in Python.
+
+        Keyword Arguments:
+            target_date (datetime.datetime): Datetime timezone aware for
+                publication target, if empty default value will be the current
+                datetime.
+            name (string): Annotation name. Default to ``published``.
+
+        Returns:
+            queryset: Queryset with a boolean annotation, True for published entries
+            else False.
+        """
+        return self.annotate(**{
+            name: models.Case(
+                models.When(
+                    models.Q(
+                        *self.build_publication_conditions(target_date=target_date)
+                    ),
+                    then=models.Value(True),
+                ),
+                default=models.Value(False),
+                output_field=models.BooleanField(),
+            )
+        })
+
+    def get_transitions(self, since, until=None):
+        """
+        Return a queryset with entries which publication started or ended within a
+        period.
+
+        Arguments:
+            since (datetime.datetime): Datetime timezone aware for the period start,
+                it is excluded from the period.
+
+        Keyword Arguments:
+            until (datetime.datetime): Datetime timezone aware for the period end, it
+                is included in the period. If empty default value will be the current
+                datetime.
+
+        Returns:
+            queryset: Queryset to filter entries with a publication transition.
+        """
+        return self.filter(
+            *self.build_transition_conditions(since, until=until)
+        )
+
+    def get_next_transition(self, target_date=None):
+        """
+        Return the date of the next publication start or end of published entries.
+
+        Publication start is built from publish date and time in the target date
+        timezone like it is compared in ``build_publication_conditions``.
+
+        Keyword Arguments:
+            target_date (datetime.datetime): Datetime timezone aware to search
+                transitions after, if empty default value will be the current
+                datetime.
+
+        Returns:
+            datetime.datetime: The next transition date or ``None`` if there is none.
+        """
+        target_date = target_date or timezone.now()
+        queryset = self.filter(status=STATUS_PUBLISHED)
+
+        transitions = []
+
+        start = queryset.filter(
+            models.Q(publish_date__gt=target_date.date()) |
+            models.Q(
+                publish_date=target_date.date(),
+                publish_time__gt=target_date.time(),
+            )
+        ).order_by("publish_date", "publish_time").values_list(
+            "publish_date", "publish_time"
+        ).first()
+        if start:
+            transitions.append(
+                datetime.datetime.combine(*start, tzinfo=target_date.tzinfo)
+            )
+
+        end = queryset.filter(publish_end__gt=target_date).aggregate(
+            next_end=models.Min("publish_end")
+        )["next_end"]
+        if end:
+            transitions.append(end)
+
+        return min(transitions) if transitions else None
+
+    def get_cache_timeout(self, timeout, target_date=None):
+        """
+        Return a cache timeout which does not last after the next publication start
+        or end of published entries.
+
+        Arguments:
+            timeout (integer): Maximum time in seconds.
+
+        Keyword Arguments:
+            target_date (datetime.datetime): Datetime timezone aware the timeout
+                starts from, if empty default value will be the current datetime.
+
+        Returns:
+            integer: Time in seconds, ``0`` means content must not be cached.
+        """
+        target_date = target_date or timezone.now()
+
+        transition = self.get_next_transition(target_date=target_date)
+        if transition is not None:
+            timeout = min(
+                timeout,
+                math.floor((transition - target_date).total_seconds()),
+            )
+
+        return max(timeout, 0)
+
     def get_unpublished(self, target_date=None, language=None, prefix=None):
         """
         Return a queryset with unpublished entries selected.
@@ -64,7 +222,7 @@ class BasePublishedQuerySet(LookupBuilder, models.QuerySet):
         )
 
 
-class BaseTranslatedQuerySet(LookupBuilder, models.QuerySet):
+class BaseTranslatedQuerySet(ReplicaQuerySetMixin, LookupBuilder, models.QuerySet):
     """
     Base queryset for translation methods only.
     """
@@ -105,12 +263,143 @@ class BaseTranslatedQuerySet(LookupBuilder, models.QuerySet):
             *self.build_siblings_conditions(source)
         )
 
+    def get_translation_groups(self, sources):
+        """
+        Return every objects from the translation groups of given source objects.
+
+        This allows to get the siblings for a list of objects with a single query.
+
+        Arguments:
+            sources (iterable): Objects to use for their translation group.
+
+        Returns:
+            queryset: Queryset with all objects sharing a translation group with
+            the sources, including the sources themselves.
+        """
+        return self.filter(
+            translation_group__in={
+                item.translation_group
+                for item in sources
+                if item.translation_group
+            }
+        )
+
 
 class ArticleQuerySet(BasePublishedQuerySet, BaseTranslatedQuerySet):
     """
     Article queryset mix publication and translation QuerySet classes.
     """
-    pass
+    def with_album(self):
+        """
+        Join article album.
+
+        Album items are not loaded here since album payloads are commonly served from
+        cache, they are only read when a payload is built.
+
+        Returns:
+            queryset: Queryset with album loaded in a single join.
+        """
+        return self.select_related("album")
+
+    def list_projection(self, *fields):
+        """
+        Defer the article fields from ``Article.LIST_DEFERRED_FIELDS`` that are only
+        used in article detail, like the large content text.
+
+        Lists should use it so these fields are never read from database. Accessing a
+        deferred field from an object would still work but with a query for each
+        object.
+
+        Arguments:
+            *fields (string): Names of fields from ``LIST_DEFERRED_FIELDS`` that are
+                still needed and must not be deferred.
+
+        Returns:
+            queryset: Queryset with deferred fields.
+        """
+        return self.defer(*[
+            name
+            for name in self.model.LIST_DEFERRED_FIELDS
+            if name not in fields
+        ])
+
+    def get_for_category_tree(self, category):
+        """
+        Filter articles related to a category or to any of its descendants.
+
+        Descendants are matched on the tree path prefix of the category so there is no
+        query to get them. Articles are filtered with an ``EXISTS`` subquery on their
+        category relations instead of a join, so an article related to many categories
+        of the tree is returned only once without a ``DISTINCT`` over article rows and
+        the ordering and slicing stay on the article table alone.
+
+        Arguments:
+            category (lotus.models.Category): The tree root category.
+
+        Returns:
+            queryset: Filtered queryset.
+        """
+        Through = self.model.categories.through
+
+        return self.filter(
+            models.Exists(
+                Through.objects.filter(
+                    article_id=models.OuterRef("pk"),
+                    category__path__startswith=category.path,
+                )
+            )
+        )
+
+    def resolve_related(self, sources, filter_func=None):
+        """
+        Resolve the related articles of many articles.
+
+        Related articles are selected from the current queryset and filtered like
+        ``Article.get_related`` does, then stored in attribute ``prefetched_related``
+        of each source so ``Article.get_related`` does not perform any query. The
+        filtering function is stored in attribute ``prefetched_related_filter``.
+
+        There is a single query for each language of the given articles, so a single
+        one for a list page of articles in the same language.
+
+        Arguments:
+            sources (iterable): Article objects, commonly the objects of a list page.
+                When it is a queryset, it is evaluated and the resolved related
+                articles are stored on its cached objects.
+
+        Keyword Arguments:
+            filter_func (function): A function to filter related articles for a
+                language, commonly ``ArticleFilterMixin.apply_article_lookups``. If
+                not given only the language filtering is applied.
+
+        Returns:
+            list: Given articles.
+        """
+        sources = [item for item in sources if item.pk]
+        resolved = {}
+
+        languages = {}
+        for item in sources:
+            languages.setdefault(item.language, []).append(item.pk)
+
+        for language, pks in languages.items():
+            if filter_func:
+                queryset = filter_func(self, language)
+            else:
+                queryset = self.get_for_lang(language)
+
+            queryset = queryset.filter(relations__in=pks).annotate(
+                related_source_id=models.F("relations__id"),
+            ).list_projection().order_by(*self.model.COMMON_ORDER_BY)
+
+            for item in queryset:
+                resolved.setdefault(item.related_source_id, []).append(item)
+
+        for source in sources:
+            source.prefetched_related = resolved.get(source.pk, [])
+            source.prefetched_related_filter = filter_func
+
+        return sources
 
 
 class CategoryQuerySet(BaseTranslatedQuerySet, MP_NodeQuerySet):
@@ -145,6 +434,12 @@ class CategoryManager(MP_NodeManager):
     def get_siblings(self, source):
         return self.get_queryset().get_siblings(source)
 
+    def get_translation_groups(self, sources):
+        return self.get_queryset().get_translation_groups(sources)
+
+    def using_replica(self, alias=None):
+        return self.get_queryset().using_replica(alias=alias)
+
 
 class ArticleManager(models.Manager):
     """
@@ -166,12 +461,45 @@ class ArticleManager(models.Manager):
             language=language,
         )
 
+    def get_transitions(self, since, until=None):
+        return self.get_queryset().get_transitions(since, until=until)
+
+    def get_next_transition(self, target_date=None):
+        return self.get_queryset().get_next_transition(target_date=target_date)
+
+    def get_cache_timeout(self, timeout, target_date=None):
+        return self.get_queryset().get_cache_timeout(
+            timeout,
+            target_date=target_date,
+        )
+
+    def get_for_category_tree(self, category):
+        return self.get_queryset().get_for_category_tree(category)
+
+    def resolve_related(self, sources, filter_func=None):
+        return self.get_queryset().resolve_related(sources, filter_func=filter_func)
+
+    def list_projection(self, *fields):
+        return self.get_queryset().list_projection(*fields)
+
+    def annotate_published(self, target_date=None, name="published"):
+        return self.get_queryset().annotate_published(
+            target_date=target_date,
+            name=name,
+        )
+
     def get_for_lang(self, language):
         return self.get_queryset().get_for_lang(language)
 
     def get_siblings(self, source):
         return self.get_queryset().get_siblings(source)
 
+    def get_translation_groups(self, sources):
+        return self.get_queryset().get_translation_groups(sources)
+
+    def using_replica(self, alias=None):
+        return self.get_queryset().using_replica(alias=alias)
+
 
 class AuthorManager(models.Manager):
     """
@@ -196,3 +524,186 @@ class AuthorManager(models.Manager):
         )
 
         return q.distinct()
+
+
+class ThumbnailJobManager(models.Manager):
+    """
+    Thumbnail job objects manager.
+    """
+    def enqueue(self, instance, field_names):
+        """
+        Create pending jobs for the given object media fields.
+
+        Empty fields are ignored and no job is created for a field which already has
+        a pending job.
+
+        Arguments:
+            instance (django.db.models.Model): Saved object to create jobs for.
+            field_names (list): Names of the media fields to queue.
+
+        Returns:
+            list: Created jobs.
+        """
+        label = instance._meta.label_lower
+        field_names = [name for name in field_names if getattr(instance, name)]
+
+        if not field_names:
+            return []
+
+        pending = set(
+            self.get_queryset().filter(
+                model_label=label,
+                object_id=instance.pk,
+                field_name__in=field_names,
+                status=THUMBNAIL_JOB_PENDING,
+            ).values_list("field_name", flat=True)
+        )
+
+        return self.bulk_create([
+            self.model(model_label=label, object_id=instance.pk, field_name=name)
+            for name in field_names
+            if name not in pending
+        ])
+
+    def claim(self, limit=None, retry_failed=False, exclude=None):
+        """
+        Mark pending jobs as running and return them.
+
+        Running jobs which have not been processed since
+        ``LOTUS_THUMBNAIL_JOB_TIMEOUT`` seconds are considered as abandoned by a
+        crashed worker and are claimed again. Processing date is only stamped here, so
+        this timeout must be longer than the worst processing time of a job.
+
+        Each job is claimed with a conditional update so concurrent workers never
+        process the same job twice.
+
+        Keyword Arguments:
+            limit (integer): Maximum number of jobs to claim. Default to ``None`` for
+                every pending jobs.
+            retry_failed (boolean): If true, failed jobs which have not reached
+                ``LOTUS_THUMBNAIL_MAX_ATTEMPTS`` are claimed along pending ones.
+            exclude (list): IDs of jobs to not claim, commonly the ones already
+                handled by a worker run.
+
+        Returns:
+            list: Claimed jobs.
+        """
+        now = timezone.now()
+
+        conditions = models.Q(status=THUMBNAIL_JOB_PENDING) | models.Q(
+            status=THUMBNAIL_JOB_RUNNING,
+            processed__lt=now - datetime.timedelta(
+                seconds=settings.LOTUS_THUMBNAIL_JOB_TIMEOUT
+            ),
+        )
+        if retry_failed:
+            conditions |= models.Q(
+                status=THUMBNAIL_JOB_FAILED,
+                attempts__lt=settings.LOTUS_THUMBNAIL_MAX_ATTEMPTS,
+            )
+
+        candidates = self.get_queryset().filter(conditions)
+        if exclude:
+            candidates = candidates.exclude(pk__in=exclude)
+
+        candidates = candidates.values_list("id", flat=True)
+        if limit:
+            candidates = candidates[:limit]
+
+        claimed = [
+            pk
+            for pk in list(candidates)
+            if self.get_queryset().filter(conditions, pk=pk).update(
+                status=THUMBNAIL_JOB_RUNNING,
+                processed=now,
+            )
+        ]
+
+        return list(self.get_queryset().filter(pk__in=claimed))
+
+    def prune(self, target_date=None):
+        """
+        Delete done jobs processed since more than ``LOTUS_THUMBNAIL_JOB_RETENTION``
+        seconds.
+
+        Nothing is deleted if retention setting is empty.
+
+        Keyword Arguments:
+            target_date (datetime.datetime): Datetime timezone aware the retention
+                is counted from, if empty default value will be the current datetime.
+
+        Returns:
+            integer: Number of deleted jobs.
+        """
+        if not settings.LOTUS_THUMBNAIL_JOB_RETENTION:
+            return 0
+
+        target_date = target_date or timezone.now()
+
+        deleted, _ = self.get_queryset().filter(
+            status=THUMBNAIL_JOB_DONE,
+            processed__lt=target_date - datetime.timedelta(
+                seconds=settings.LOTUS_THUMBNAIL_JOB_RETENTION
+            ),
+        ).delete()
+
+        return deleted
+
+
+class DeletionLogManager(models.Manager):
+    """
+    Deletion log objects manager.
+    """
+    def log(self, instance):
+        """
+        Create a deletion entry for the given object.
+
+        Arguments:
+            instance (django.db.models.Model): Deleted object.
+
+        Returns:
+            lotus.models.deletion.DeletionLog: Created entry.
+        """
+        return self.create(
+            model_label=instance._meta.label_lower,
+            object_id=instance.pk,
+            language=getattr(instance, "language", ""),
+            private=getattr(instance, "private", False),
+        )
+
+    def get_period(self, since=None, until=None, model_labels=None, language=None,
+                   private=None):
+        """
+        Return entries for deletions within a period.
+
+        Keyword Arguments:
+            since (datetime.datetime): Datetime timezone aware for the period start, it
+                is excluded from the period. If empty the period has no start.
+            until (datetime.datetime): Datetime timezone aware for the period end, it
+                is included in the period. If empty default value will be the current
+                datetime.
+            model_labels (list): Lowercase model labels to filter on. If empty, every
+                models are selected.
+            language (string): Language code to filter on. If empty, language is not
+                filtered.
+            private (boolean): Either True or False to filter on private state. If
+                not given, private state is not filtered.
+
+        Returns:
+            queryset: Deletion entries ordered on deletion date.
+        """
+        q = self.get_queryset().filter(deleted__lte=until or timezone.now())
+
+        if since:
+            q = q.filter(deleted__gt=since)
+
+        if model_labels:
+            q = q.filter(model_label__in=model_labels)
+
+        if language:
+            q = q.filter(language=language)
+
+        if private is not None:
+            q = q.filter(private=private)
+
+        return q.order_by("deleted", "id")
@@ -0,0 +1,212 @@
+"""
+Full page cache for anonymous users.
+
+``PageCacheMiddleware`` caches the HTML responses from Lotus views (the ones under
+URL namespace ``lotus``) in the default cache. Responses differ from preview mode,
+staff edition links and private articles, so only the requests which are safe to
+share are cached and served from cache:
+
+* Only ``GET`` requests from anonymous users without preview mode in their session;
+* Only successful responses without cookies and without a ``private`` or
+  ``no-store`` cache control.
+
+Cache key includes the request host, the language and the full path (with query
+string). A page is stored with the versions of its surrogate keys (see
+``lotus.surrogates``) so it is dropped on the same content changes that purge its
+surrogate keys, pages without surrogate keys are not cached. Bodies are stored
+compressed with ``zlib``.
+
+A page is kept for ``LOTUS_PAGE_CACHE_TIMEOUT`` seconds at most and never after the
+next publication start or end of an article, so scheduled articles appear and ended
+ones disappear on time.
+
+Middleware must be enabled after ``AuthenticationMiddleware`` and
+``LocaleMiddleware``: ::
+
+    MIDDLEWARE = [
+        ...
+        "django.contrib.auth.middleware.AuthenticationMiddleware",
+        ...
+        "lotus.middleware.PageCacheMiddleware",
+    ]
+
+Command ``lotus_warmup`` requests the main Lotus pages for every language to fill
+caches after a deploy: ::
+
+    python manage.py lotus_warmup --pages=3 --workers=4 --url=/sitemap.xml
+"""
+import hashlib
+import zlib
+
+from django.conf import settings
+from django.http import HttpResponse
+from django.utils.cache import cc_delim_re
+
+from .models import Article, Category
+from .surrogates import build_listing_key, get_versioned, set_versioned
+from .utils.language import get_language_code
+
+
+class PageCacheMiddleware:
+    """
+    Cache the Lotus pages for anonymous users.
+
+    Served responses have an header ``X-Lotus-Page-Cache`` with value ``hit`` when
+    they come from the cache or ``miss`` when they have just been cached.
+
+    Attributes:
+        namespaces (list): URL namespaces of views to cache.
+        excluded_headers (list): Names (in lowercase) of response headers which are not
+            stored.
+        shared_models (list): Models which listing every page depends on additionally
+            to its own surrogate keys, like categories for the category menu.
+    """
+    namespaces = ["lotus"]
+    excluded_headers = ["set-cookie", "x-lotus-page-cache"]
+    shared_models = [Category]
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def is_cacheable_request(self, request):
+        """
+        Return if request may be answered from cache.
+
+        Arguments:
+            request (django.http.request.HttpRequest): Current request.
+
+        Returns:
+            boolean: True if the request is safe to share.
+        """
+        if not settings.LOTUS_PAGE_CACHE_TIMEOUT or request.method != "GET":
+            return False
+
+        user = getattr(request, "user", None)
+        if user is not None and user.is_authenticated:
+            return False
+
+        session = getattr(request, "session", None)
+        if session is not None and session.get(settings.LOTUS_PREVIEW_KEYWORD):
+            return False
+
+        return True
+
+    def is_cacheable_response(self, request, response):
+        """
+        Return if response can be stored in cache.
+
+        Arguments:
+            request (django.http.request.HttpRequest): Current request.
+            response (django.http.response.HttpResponse): Response to store.
+
+        Returns:
+            boolean: True if the response comes from a Lotus view and is the same for
+            every anonymous users.
+        """
+        resolver_match = getattr(request, "resolver_match", None)
+        if resolver_match is None or not set(self.namespaces).intersection(
+            resolver_match.namespaces
+        ):
+            return False
+
+        if (
+            response.status_code != 200 or
+            response.streaming or
+            response.cookies or
+            not getattr(response, "surrogate_keys", None)
+        ):
+            return False
+
+        directives = {
+            item.split("=")[0].strip().lower()
+            for item in cc_delim_re.split(response.get("Cache-Control", ""))
+        }
+
+        return not directives.intersection({"private", "no-store", "no-cache"})
+
+    def get_cache_key(self, request):
+        """
+        Return cache key for a page request.
+
+        Arguments:
+            request (django.http.request.HttpRequest): Current request.
+
+        Returns:
+            string: Cache key.
+        """
+        path = "{}:{}:{}".format(
+            request.get_host(),
+            get_language_code(request),
+            request.get_full_path(),
+        )
+
+        return "lotus-page:{}".format(
+            hashlib.md5(path.encode("utf-8")).hexdigest(),
+        )
+
+    def get_timeout(self):
+        """
+        Return the time to keep a page in cache.
+
+        Returns:
+            integer: Time in seconds, ``LOTUS_PAGE_CACHE_TIMEOUT`` or less if an
+            article publication starts or ends before. ``0`` means the page must not
+            be cached.
+        """
+        return Article.objects.get_cache_timeout(settings.LOTUS_PAGE_CACHE_TIMEOUT)
+
+    def build_response(self, payload):
+        """
+        Build a response from a cached payload.
+
+        Arguments:
+            payload (dict): Cached payload.
+
+        Returns:
+            django.http.response.HttpResponse: Response.
+        """
+        response = HttpResponse(
+            zlib.decompress(payload["content"]),
+            status=payload["status"],
+        )
+        for name, value in payload["headers"]:
+            response[name] = value
+
+        return response
+
+    def __call__(self, request):
+        if not self.is_cacheable_request(request):
+            return self.get_response(request)
+
+        cache_key = self.get_cache_key(request)
+        payload = get_versioned(cache_key)
+
+        if payload is not None:
+            response = self.build_response(payload)
+            response["X-Lotus-Page-Cache"] = "hit"
+            return response
+
+        response = self.get_response(request)
+
+        if self.is_cacheable_response(request, response):
+            timeout = self.get_timeout()
+            if timeout:
+                set_versioned(
+                    cache_key,
+                    {
+                        "content": zlib.compress(response.content),
+                        "status": response.status_code,
+                        "headers": [
+                            (name, value)
+                            for name, value in response.items()
+                            if name.lower() not in self.excluded_headers
+                        ],
+                    },
+                    response.surrogate_keys + [
+                        build_listing_key(model) for model in self.shared_models
+                    ],
+                    timeout,
+                )
+                response["X-Lotus-Page-Cache"] = "miss"
+
+        return response
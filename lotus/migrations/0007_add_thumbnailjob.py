@@ -0,0 +1,34 @@
+# Generated by Django 5.2.18 on 2026-10-19 00:16
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('lotus', '0006_add_article_category_template'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ThumbnailJob',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('model_label', models.CharField(max_length=100, verbose_name='model label')),
+                ('object_id', models.PositiveIntegerField(verbose_name='object ID')),
+                ('field_name', models.CharField(max_length=100, verbose_name='field name')),
+                ('status', models.SmallIntegerField(choices=[(0, 'pending'), (10, 'running'), (20, 'done'), (30, 'failed')], db_index=True, default=0, verbose_name='status')),
+                ('created', models.DateTimeField(default=django.utils.timezone.now, editable=False, verbose_name='creation date')),
+                ('processed', models.DateTimeField(blank=True, default=None, null=True, verbose_name='processing date')),
+                ('attempts', models.PositiveSmallIntegerField(default=0, verbose_name='attempts')),
+                ('error', models.TextField(blank=True, default='', verbose_name='error')),
+            ],
+            options={
+                'verbose_name': 'Thumbnail job',
+                'verbose_name_plural': 'Thumbnail jobs',
+                'ordering': ['created', 'id'],
+                'indexes': [models.Index(fields=['model_label', 'object_id', 'field_name'], name='lotus_thumbjob_target_idx')],
+            },
+        ),
+    ]
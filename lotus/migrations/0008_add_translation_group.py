@@ -0,0 +1,42 @@
+# Generated by Django 5.2.18 on 2026-10-19 00:37
+
+from django.db import migrations, models
+from django.db.models import F
+
+
+def fill_translation_groups(apps, schema_editor):
+    """
+    Set translation group for existing articles and categories, this is the original
+    ID for translations else the object ID.
+    """
+    db_alias = schema_editor.connection.alias
+
+    for name in ("Article", "Category"):
+        model = apps.get_model("lotus", name)
+        model.objects.using(db_alias).filter(original__isnull=True).update(
+            translation_group=F("id")
+        )
+        model.objects.using(db_alias).filter(original__isnull=False).update(
+            translation_group=F("original_id")
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('lotus', '0007_add_thumbnailjob'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='article',
+            name='translation_group',
+            field=models.PositiveIntegerField(blank=True, db_index=True, default=None, editable=False, null=True, verbose_name='translation group'),
+        ),
+        migrations.AddField(
+            model_name='category',
+            name='translation_group',
+            field=models.PositiveIntegerField(blank=True, db_index=True, default=None, editable=False, null=True, verbose_name='translation group'),
+        ),
+        migrations.RunPython(fill_translation_groups, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,29 @@
+# Generated by Django 5.2.18 on 2026-10-19 01:14
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('lotus', '0008_add_translation_group'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DeletionLog',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('model_label', models.CharField(max_length=100, verbose_name='model label')),
+                ('object_id', models.PositiveIntegerField(verbose_name='object ID')),
+                ('language', models.CharField(blank=True, default='', max_length=8, verbose_name='language')),
+                ('deleted', models.DateTimeField(db_index=True, default=django.utils.timezone.now, editable=False, verbose_name='deletion date')),
+            ],
+            options={
+                'verbose_name': 'Deletion log',
+                'verbose_name_plural': 'Deletion logs',
+                'ordering': ['deleted', 'id'],
+            },
+        ),
+    ]
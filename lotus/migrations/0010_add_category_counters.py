@@ -0,0 +1,33 @@
+# Generated by Django 5.2.18 on 2026-10-19 01:25
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('lotus', '0009_add_deletionlog'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='category',
+            name='direct_count',
+            field=models.PositiveIntegerField(default=0, editable=False, verbose_name='published articles'),
+        ),
+        migrations.AddField(
+            model_name='category',
+            name='direct_public_count',
+            field=models.PositiveIntegerField(default=0, editable=False, verbose_name='published public articles'),
+        ),
+        migrations.AddField(
+            model_name='category',
+            name='subtree_count',
+            field=models.PositiveIntegerField(default=0, editable=False, verbose_name='published articles in subtree'),
+        ),
+        migrations.AddField(
+            model_name='category',
+            name='subtree_public_count',
+            field=models.PositiveIntegerField(default=0, editable=False, verbose_name='published public articles in subtree'),
+        ),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 5.2.18 on 2026-10-19 01:34
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('lotus', '0010_add_category_counters'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='article',
+            index=models.Index(fields=['-pinned', '-publish_date', '-publish_time', 'title'], name='lotus_article_common_order_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='category',
+            index=models.Index(fields=['path'], name='lotus_category_path_prefix_idx', opclasses=['varchar_pattern_ops']),
+        ),
+    ]
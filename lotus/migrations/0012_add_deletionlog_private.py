@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-19 02:57
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('lotus', '0011_add_tree_listing_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='deletionlog',
+            name='private',
+            field=models.BooleanField(default=False, verbose_name='private'),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-19 03:19
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('lotus', '0012_add_deletionlog_private'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='category',
+            name='counts_expire',
+            field=models.DateTimeField(blank=True, db_index=True, default=None, editable=False, null=True, verbose_name='counters expiration'),
+        ),
+    ]
@@ -2,6 +2,8 @@ from .album import Album, AlbumItem
 from .article import Article
 from .author import Author
 from .category import Category
+from .deletion import DeletionLog
+from .thumbnail import ThumbnailJob
 
 
 __all__ = [
@@ -10,4 +12,6 @@ __all__ = [
     "Article",
     "Author",
     "Category",
+    "DeletionLog",
+    "ThumbnailJob",
 ]
@@ -1,5 +1,7 @@
+import hashlib
+
 from django.db import models
-from django.db.models.signals import post_delete, pre_save
+from django.db.models.signals import post_delete, post_save, pre_save
 from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
 
@@ -7,6 +9,9 @@ from smart_media.mixins import SmartFormatMixin
 from smart_media.modelfields import SmartMediaField
 from smart_media.signals import auto_purge_files_on_change, auto_purge_files_on_delete
 
+from ..surrogates import auto_purge_surrogate_keys, build_surrogate_key, purge_keys
+from ..thumbnailing import auto_enqueue_thumbnails, auto_remember_thumbnail_sources
+
 
 class Album(models.Model):
     """
@@ -38,6 +43,28 @@ class Album(models.Model):
     def __str__(self):
         return self.title
 
+    def get_cache_key(self, *parts):
+        """
+        Return a cache key for a payload built from album and its items.
+
+        The key is versioned on the ``modified`` date which is also updated when an
+        item is saved or deleted, so an outdated payload is never returned.
+
+        Arguments:
+            *parts (string): Strings to distinguish payload kinds like the template
+                path used to render album.
+
+        Returns:
+            string: Cache key.
+        """
+        return "lotus-album-{pk}-{version}-{parts}".format(
+            pk=self.pk,
+            version=int(self.modified.timestamp() * 1000000),
+            parts=hashlib.md5(
+                "|".join([str(item) for item in parts]).encode("utf-8")
+            ).hexdigest(),
+        )
+
     def save(self, *args, **kwargs):
         # Auto update 'modified' value on each save
         self.modified = timezone.now()
@@ -119,6 +146,23 @@ class AlbumItem(SmartFormatMixin, models.Model):
         super().save(*args, **kwargs)
 
 
+def touch_item_album(sender, instance, **kwargs):
+    """
+    Update album modification date when one of its items has changed.
+    """
+    Album.objects.filter(pk=instance.album_id).update(modified=timezone.now())
+
+
+def purge_item_album(sender, instance, raw=False, **kwargs):
+    """
+    Purge album surrogate key when one of its items has changed.
+    """
+    if raw:
+        return
+
+    purge_keys([build_surrogate_key(Album, instance.album_id)])
+
+
 # Connect signals for automatic media purge
 post_delete.connect(
     auto_purge_files_on_delete(["media"]),
@@ -132,3 +176,51 @@ pre_save.connect(
     sender=AlbumItem,
     weak=False,
 )
+pre_save.connect(
+    auto_remember_thumbnail_sources(["media"]),
+    dispatch_uid="albumitem_thumbnails_on_change",
+    sender=AlbumItem,
+    weak=False,
+)
+post_save.connect(
+    auto_enqueue_thumbnails(["media"]),
+    dispatch_uid="albumitem_thumbnails_on_save",
+    sender=AlbumItem,
+    weak=False,
+)
+post_save.connect(
+    touch_item_album,
+    dispatch_uid="albumitem_touch_album_on_save",
+    sender=AlbumItem,
+    weak=False,
+)
+post_delete.connect(
+    touch_item_album,
+    dispatch_uid="albumitem_touch_album_on_delete",
+    sender=AlbumItem,
+    weak=False,
+)
+post_save.connect(
+    auto_purge_surrogate_keys(listing=False),
+    dispatch_uid="album_surrogate_keys_on_save",
+    sender=Album,
+    weak=False,
+)
+post_delete.connect(
+    auto_purge_surrogate_keys(listing=False),
+    dispatch_uid="album_surrogate_keys_on_delete",
+    sender=Album,
+    weak=False,
+)
+post_save.connect(
+    purge_item_album,
+    dispatch_uid="albumitem_surrogate_keys_on_save",
+    sender=AlbumItem,
+    weak=False,
+)
+post_delete.connect(
+    purge_item_album,
+    dispatch_uid="albumitem_surrogate_keys_on_delete",
+    sender=AlbumItem,
+    weak=False,
+)
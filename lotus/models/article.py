@@ -2,12 +2,15 @@ import datetime
 
 from django.conf import settings
 from django.db import models
-from django.db.models.signals import post_delete, pre_save
+from django.db.models.signals import (
+    m2m_changed, post_delete, post_save, pre_delete, pre_save,
+)
 from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
-from django.urls import translate_url, reverse
+from django.urls import reverse
 
 from taggit.managers import TaggableManager
+from taggit.models import Tag
 
 from smart_media.mixins import SmartFormatMixin
 from smart_media.modelfields import SmartMediaField
@@ -17,9 +20,17 @@ from ..choices import (
     STATUS_PUBLISHED, get_status_choices, get_status_default,
     get_article_template_choices, get_article_template_default,
 )
+from ..counters import (
+    article_counts_on_delete, article_counts_on_pre_delete, article_counts_on_save,
+    categories_counts_on_change,
+)
 from ..managers import ArticleManager
+from ..surrogates import auto_purge_surrogate_keys, purge_relations_surrogate_keys
+from ..thumbnailing import auto_enqueue_thumbnails, auto_remember_thumbnail_sources
+from ..urltemplates import build_translated_url
 
-from .translated import Translated
+from .deletion import log_deletion
+from .translated import Translated, sync_translation_group
 
 
 class Article(SmartFormatMixin, Translated):
@@ -306,6 +317,12 @@ class Article(SmartFormatMixin, Translated):
     List of field order commonly used in frontend view/api
     """
 
+    LIST_DEFERRED_FIELDS = ["lead", "content", "image", "image_alt_text", "template"]
+    """
+    List of fields only used in article detail that lists do not load, see
+    ``ArticleQuerySet.list_projection``.
+    """
+
     objects = ArticleManager()
 
     class Meta:
@@ -332,10 +349,29 @@ class Article(SmartFormatMixin, Translated):
                 name="lotus_unique_art_original_lang"
             ),
         ]
+        indexes = [
+            # Follow COMMON_ORDER_BY so paginated lists do not need to sort every rows
+            models.Index(
+                fields=["-pinned", "-publish_date", "-publish_time", "title"],
+                name="lotus_article_common_order_idx",
+            ),
+        ]
 
     def __str__(self):
         return self.title
 
+    def __getstate__(self):
+        """
+        Drop the prefetch filtering function which is commonly bound to a view and
+        its request that can not be pickled, like when an object is kept in a cached
+        API payload. Then an unpickled object only uses its prefetched related
+        articles without filtering function.
+        """
+        state = super().__getstate__()
+        state.pop("prefetched_related_filter", None)
+
+        return state
+
     def build_absolute_url(self, urlname):
         """
         Build object absolute URL with language prefix for url name.
@@ -348,14 +384,13 @@ class Article(SmartFormatMixin, Translated):
         Returns:
             string: Object absolute URL.
         """
-        return translate_url(
-            reverse(urlname, kwargs={
-                "year": self.publish_date.year,
-                "month": self.publish_date.month,
-                "day": self.publish_date.day,
-                "slug": self.slug,
-            }),
-            self.language
+        return build_translated_url(
+            urlname,
+            self.language,
+            year=self.publish_date.year,
+            month=self.publish_date.month,
+            day=self.publish_date.day,
+            slug=self.slug,
         )
 
     def get_absolute_url(self):
@@ -394,27 +429,55 @@ class Article(SmartFormatMixin, Translated):
         """
         return reverse("admin:lotus_article_change", args=(self.id,))
 
+    def is_prefetched(self, name):
+        """
+        Check if a relation has been prefetched for this object.
+
+        Arguments:
+            name (string): Relation name.
+
+        Returns:
+            boolean: True if relation is in prefetch cache.
+        """
+        return name in getattr(self, "_prefetched_objects_cache", {})
+
     def get_authors(self):
         """
         Return article authors.
 
+        Prefetched authors are used when available, they are expected to be ordered
+        like ``Author.COMMON_ORDER_BY``.
+
         Returns:
             queryset: List of article authors.
         """
+        if self.is_prefetched("authors"):
+            return self.authors.all()
+
         return self.authors.all().order_by("first_name", "last_name")
 
     def get_categories(self):
         """
         Return article categories, results are enforced on article language.
 
+        Prefetched categories are used when available, they are expected to be ordered
+        like ``Category.COMMON_ORDER_BY``.
+
         .. Todo::
 
             This should use Category.COMMON_ORDER_BY instead of hardcoded field (even
             it is right)
 
         Returns:
-            queryset: List of article categories.
+            queryset or list: List of article categories.
         """
+        if self.is_prefetched("categories"):
+            return [
+                category
+                for category in self.categories.all()
+                if category.language == self.language
+            ]
+
         return self.categories.get_for_lang(self.language).order_by("title")
 
     def get_album_items(self):
@@ -449,14 +512,26 @@ class Article(SmartFormatMixin, Translated):
                 function should at least expect the same arguments.
 
         Returns:
-            queryset: List of related articles.
+            queryset or list: List of related articles. This is a list of the
+            prefetched filtered related articles when they have been loaded with
+            ``lotus.prefetches.prefetch_article_detail`` or queryset method
+            ``resolve_related`` and ``filter_func`` is either empty or equal to the
+            function used to prefetch them (stored in attribute
+            ``prefetched_related_filter``). With another function the related
+            articles are queried again.
         """
+        if hasattr(self, "prefetched_related") and (
+            filter_func is None or
+            filter_func == getattr(self, "prefetched_related_filter", None)
+        ):
+            return self.prefetched_related
+
         if filter_func:
             q = filter_func(self.related, self.language)
         else:
             q = self.related.get_for_lang(self.language)
 
-        return q.order_by(*self.COMMON_ORDER_BY)
+        return q.list_projection().order_by(*self.COMMON_ORDER_BY)
 
     def get_tags(self):
         """
@@ -579,3 +654,77 @@ pre_save.connect(
     sender=Article,
     weak=False,
 )
+pre_save.connect(
+    auto_remember_thumbnail_sources(["cover", "image"]),
+    dispatch_uid="article_thumbnails_on_change",
+    sender=Article,
+    weak=False,
+)
+post_save.connect(
+    auto_enqueue_thumbnails(["cover", "image"]),
+    dispatch_uid="article_thumbnails_on_save",
+    sender=Article,
+    weak=False,
+)
+post_save.connect(
+    sync_translation_group,
+    dispatch_uid="article_translation_group_on_save",
+    sender=Article,
+    weak=False,
+)
+post_delete.connect(
+    log_deletion,
+    dispatch_uid="article_deletion_log_on_delete",
+    sender=Article,
+    weak=False,
+)
+
+# Connect signals to maintain category article counters
+post_save.connect(
+    article_counts_on_save,
+    dispatch_uid="article_category_counts_on_save",
+    sender=Article,
+    weak=False,
+)
+pre_delete.connect(
+    article_counts_on_pre_delete,
+    dispatch_uid="article_category_counts_on_pre_delete",
+    sender=Article,
+    weak=False,
+)
+post_delete.connect(
+    article_counts_on_delete,
+    dispatch_uid="article_category_counts_on_delete",
+    sender=Article,
+    weak=False,
+)
+m2m_changed.connect(
+    categories_counts_on_change,
+    dispatch_uid="article_categories_counts_on_change",
+    sender=Article.categories.through,
+    weak=False,
+)
+
+# Connect signals to purge surrogate keys, tags are only changed from articles so
+# their signals are connected here
+for model, name in ((Article, "article"), (Tag, "tag")):
+    post_save.connect(
+        auto_purge_surrogate_keys(),
+        dispatch_uid="{}_surrogate_keys_on_save".format(name),
+        sender=model,
+        weak=False,
+    )
+    post_delete.connect(
+        auto_purge_surrogate_keys(),
+        dispatch_uid="{}_surrogate_keys_on_delete".format(name),
+        sender=model,
+        weak=False,
+    )
+
+for relation in ("authors", "categories", "related", "tags"):
+    m2m_changed.connect(
+        purge_relations_surrogate_keys,
+        dispatch_uid="article_{}_surrogate_keys_on_change".format(relation),
+        sender=getattr(Article, relation).through,
+        weak=False,
+    )
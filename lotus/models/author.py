@@ -1,8 +1,10 @@
 from django.contrib.auth import get_user_model
 from django.db import models
+from django.db.models.signals import post_delete, post_save
 from django.urls import reverse
 
 from ..managers import AuthorManager
+from ..surrogates import auto_purge_surrogate_keys
 
 
 class AuthorManagerEnabled(models.Model):
@@ -60,3 +62,19 @@ class Author(get_user_model(), AuthorManagerEnabled):
         Author's meta informations.
         """
         proxy = True
+
+
+# Connect signals to purge surrogate keys, only saves made through the proxy model
+# are catched
+post_save.connect(
+    auto_purge_surrogate_keys(),
+    dispatch_uid="author_surrogate_keys_on_save",
+    sender=Author,
+    weak=False,
+)
+post_delete.connect(
+    auto_purge_surrogate_keys(),
+    dispatch_uid="author_surrogate_keys_on_delete",
+    sender=Author,
+    weak=False,
+)
@@ -1,9 +1,9 @@
 from django.core import serializers
 from django.db import models
-from django.db.models.signals import post_delete, pre_save
+from django.db.models.signals import post_delete, post_save, pre_save
 from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
-from django.urls import translate_url, reverse
+from django.urls import reverse
 
 from treebeard.mp_tree import MP_Node, get_result_class
 
@@ -13,8 +13,16 @@ from smart_media.signals import auto_purge_files_on_change, auto_purge_files_on_
 
 from ..choices import get_category_template_choices, get_category_template_default
 from ..managers import CategoryManager
+from ..counters import (
+    COUNTER_FIELDS, category_counts_on_delete, get_ancestor_paths,
+    refresh_expired_counts, update_counts,
+)
 from ..exceptions import LanguageMismatchError
-from .translated import Translated
+from ..surrogates import auto_purge_surrogate_keys
+from ..thumbnailing import auto_enqueue_thumbnails, auto_remember_thumbnail_sources
+from ..urltemplates import build_translated_url
+from .deletion import log_deletion
+from .translated import Translated, sync_translation_group
 
 
 class Category(SmartFormatMixin, MP_Node, Translated):
@@ -113,6 +121,55 @@ class Category(SmartFormatMixin, MP_Node, Translated):
     Optional alternative text for cover image.
     """
 
+    direct_count = models.PositiveIntegerField(
+        _("published articles"),
+        default=0,
+        editable=False,
+    )
+    """
+    Automatic number of published articles directly in category.
+    """
+
+    direct_public_count = models.PositiveIntegerField(
+        _("published public articles"),
+        default=0,
+        editable=False,
+    )
+    """
+    Automatic number of published public articles directly in category.
+    """
+
+    subtree_count = models.PositiveIntegerField(
+        _("published articles in subtree"),
+        default=0,
+        editable=False,
+    )
+    """
+    Automatic number of published articles in category and its descendants.
+    """
+
+    subtree_public_count = models.PositiveIntegerField(
+        _("published public articles in subtree"),
+        default=0,
+        editable=False,
+    )
+    """
+    Automatic number of published public articles in category and its descendants.
+    """
+
+    counts_expire = models.DateTimeField(
+        _("counters expiration"),
+        null=True,
+        blank=True,
+        default=None,
+        editable=False,
+        db_index=True,
+    )
+    """
+    Automatic date of the next publication start or end of an article in category
+    and its descendants, counters have to be computed again from this date.
+    """
+
     COMMON_ORDER_BY = ["title"]
     """
     List of field order commonly used in frontend view/api.
@@ -153,6 +210,15 @@ class Category(SmartFormatMixin, MP_Node, Translated):
                 name="lotus_unique_cat_original_lang"
             ),
         ]
+        indexes = [
+            # Path prefix lookups (like descendants) can not use the unique index with
+            # PostgreSQL non C collations, operator class is ignored by other backends
+            models.Index(
+                fields=["path"],
+                name="lotus_category_path_prefix_idx",
+                opclasses=["varchar_pattern_ops"],
+            ),
+        ]
 
     def __str__(self):
         return self.title
@@ -164,9 +230,10 @@ class Category(SmartFormatMixin, MP_Node, Translated):
         Returns:
             string: An URL.
         """
-        return translate_url(
-            reverse("lotus:category-detail", kwargs={"slug": self.slug}),
-            self.language
+        return build_translated_url(
+            "lotus:category-detail",
+            self.language,
+            slug=self.slug,
         )
 
     def get_absolute_api_url(self):
@@ -199,6 +266,34 @@ class Category(SmartFormatMixin, MP_Node, Translated):
 
         return self.get_children().filter(language=self.language).order_by("title")
 
+    def get_article_counts(self, private=False):
+        """
+        Return the published article counters.
+
+        Counters are maintained from ``lotus.counters``, they do not need any query
+        until they expire on the next publication start or end of an article from the
+        category subtree.
+
+        Keyword Arguments:
+            private (boolean): If true, private articles are counted.
+
+        Returns:
+            dict: Number of articles directly in category with item ``direct`` and
+            number of articles in category and its descendants with item
+            ``subtree``.
+        """
+        if self.counts_expire and self.counts_expire <= timezone.now():
+            refresh_expired_counts()
+            self.refresh_from_db(fields=COUNTER_FIELDS + ["counts_expire"])
+
+        if private:
+            return {"direct": self.direct_count, "subtree": self.subtree_count}
+
+        return {
+            "direct": self.direct_public_count,
+            "subtree": self.subtree_public_count,
+        }
+
     def get_cover_format(self):
         return self.media_format(self.cover)
 
@@ -255,7 +350,7 @@ class Category(SmartFormatMixin, MP_Node, Translated):
 
     @classmethod
     def get_nested_tree(cls, parent=None, language=None, current=None, branch=True,
-                        safe=True):
+                        safe=True, private=False, exclude_empty=False):
         """
         A convenient method to get a Category tree with language filtered or not.
 
@@ -296,6 +391,10 @@ class Category(SmartFormatMixin, MP_Node, Translated):
                 true, there won't be any exception for this case and missing key will
                 just be ignored. If false, any exception related to missing node key
                 will be raised.
+            private (boolean): If true, node article counters include the private
+                articles.
+            exclude_empty (boolean): If true, nodes without any published article in
+                their subtree are excluded.
 
         Results:
             list: Recursive list of Category tree. Each item is dictionnary of node
@@ -316,10 +415,13 @@ class Category(SmartFormatMixin, MP_Node, Translated):
                     "active": False,
                     "depth": 1,
                     "path": "0001",
+                    "articles": {"direct": 0, "subtree": 0},
                     "children": []
                 }
 
-            The ``children`` is only present if the node has children.
+            The ``children`` is only present if the node has children. The
+            ``articles`` item holds the published article counters as returned from
+            ``Category.get_article_counts``.
 
         """
         cls = get_result_class(cls)
@@ -331,12 +433,32 @@ class Category(SmartFormatMixin, MP_Node, Translated):
             parent=parent,
             current=current if branch is True else None,
         )
+        now = timezone.now()
+        expired = models.Q(counts_expire__lte=now)
+        if exclude_empty:
+            not_empty = models.Q(
+                **{"subtree_count__gt" if private else "subtree_public_count__gt": 0}
+            )
+            # Expired nodes may not be empty anymore once computed again
+            queryset = queryset.filter(not_empty | expired)
         queryset = queryset.order_by(*cls.TREE_ORDER_BY)
 
+        items = serializers.serialize("python", queryset)
+
+        # Compute again expired counters then reload nodes with the right ones
+        if any(
+            item["fields"]["counts_expire"] and item["fields"]["counts_expire"] <= now
+            for item in items
+        ):
+            refresh_expired_counts(target_date=now)
+            if exclude_empty:
+                queryset = queryset.filter(not_empty)
+            items = serializers.serialize("python", queryset.all())
+
         ret, lnk = [], {}
         pk_field = cls._meta.pk.attname
 
-        for pyobj in serializers.serialize("python", queryset):
+        for pyobj in items:
             # django's serializer stores the attributes in 'fields'
             fields = pyobj["fields"]
             path = fields["path"]
@@ -352,10 +474,26 @@ class Category(SmartFormatMixin, MP_Node, Translated):
             # Add active state
             newobj["active"] = (current.id == pyobj["pk"]) if current else False
 
+            # Move counters out of data to the ones for the privacy level
+            counters = {name: fields.pop(name) for name in COUNTER_FIELDS}
+            newobj["articles"] = (
+                {
+                    "direct": counters["direct_count"],
+                    "subtree": counters["subtree_count"],
+                }
+                if private else
+                {
+                    "direct": counters["direct_public_count"],
+                    "subtree": counters["subtree_public_count"],
+                }
+            )
+
             # Clean useless fields from item payload
             del fields["numchild"]
             del fields["depth"]
             del fields["path"]
+            del fields["translation_group"]
+            del fields["counts_expire"]
 
             # Remove id from data fields
             if pk_field in fields:
@@ -418,6 +556,35 @@ class Category(SmartFormatMixin, MP_Node, Translated):
 
         self.move(parent, pos="sorted-child")
 
+    def move(self, target, pos=None):
+        """
+        Move object in tree relatively to target node and update the article counters
+        of previous and new ancestors.
+
+        This is the method used from admin move form so counters stay right whatever
+        the move origin is.
+
+        Arguments:
+            target (Category): Reference node to move to.
+
+        Keyword Arguments:
+            pos (string): Position relative to target, see ``MP_Node.move``.
+        """
+        # Path is read from database since treebeard may let instance path stale.
+        # Previous ancestors are kept from their IDs since a move may rewrite the
+        # paths of other nodes.
+        path = type(self).objects.values_list("path", flat=True).get(pk=self.pk)
+        previous_ancestors = list(
+            type(self).objects.filter(
+                path__in=get_ancestor_paths(path, self.steplen)[:-1]
+            ).values_list("id", flat=True)
+        )
+
+        super().move(target, pos=pos)
+
+        # Moved articles are removed from previous ancestors and added to new ones
+        update_counts(previous_ancestors + [self.pk])
+
     def save(self, *args, **kwargs):
         # Auto update 'modified' value on each save
         self.modified = timezone.now()
@@ -438,3 +605,45 @@ pre_save.connect(
     sender=Category,
     weak=False,
 )
+pre_save.connect(
+    auto_remember_thumbnail_sources(["cover"]),
+    dispatch_uid="category_thumbnails_on_change",
+    sender=Category,
+    weak=False,
+)
+post_save.connect(
+    auto_enqueue_thumbnails(["cover"]),
+    dispatch_uid="category_thumbnails_on_save",
+    sender=Category,
+    weak=False,
+)
+post_save.connect(
+    sync_translation_group,
+    dispatch_uid="category_translation_group_on_save",
+    sender=Category,
+    weak=False,
+)
+post_save.connect(
+    auto_purge_surrogate_keys(),
+    dispatch_uid="category_surrogate_keys_on_save",
+    sender=Category,
+    weak=False,
+)
+post_delete.connect(
+    auto_purge_surrogate_keys(),
+    dispatch_uid="category_surrogate_keys_on_delete",
+    sender=Category,
+    weak=False,
+)
+post_delete.connect(
+    log_deletion,
+    dispatch_uid="category_deletion_log_on_delete",
+    sender=Category,
+    weak=False,
+)
+post_delete.connect(
+    category_counts_on_delete,
+    dispatch_uid="category_counts_on_delete",
+    sender=Category,
+    weak=False,
+)
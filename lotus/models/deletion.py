@@ -0,0 +1,77 @@
+from django.db import models
+from django.utils import timezone
+from django.utils.translation import gettext_lazy as _
+
+from ..managers import DeletionLogManager
+
+
+class DeletionLog(models.Model):
+    """
+    A lightweight record of a deleted object.
+
+    Entries are created on Article and Category delete so the change feed can
+    publish tombstones for objects which do not exist anymore.
+    """
+    model_label = models.CharField(
+        _("model label"),
+        max_length=100,
+    )
+    """
+    Required lowercase model label like ``lotus.article``.
+    """
+
+    object_id = models.PositiveIntegerField(
+        _("object ID"),
+    )
+    """
+    Required primary key of the deleted object.
+    """
+
+    language = models.CharField(
+        _("language"),
+        blank=True,
+        max_length=8,
+        default="",
+    )
+    """
+    Optional language code of the deleted object.
+    """
+
+    private = models.BooleanField(
+        _("private"),
+        default=False,
+    )
+    """
+    Optional private state of the deleted object, private objects are not reported
+    to anonymous users.
+    """
+
+    deleted = models.DateTimeField(
+        _("deletion date"),
+        db_index=True,
+        default=timezone.now,
+        editable=False,
+    )
+    """
+    Automatic deletion date.
+    """
+
+    objects = DeletionLogManager()
+
+    class Meta:
+        ordering = ["deleted", "id"]
+        verbose_name = _("Deletion log")
+        verbose_name_plural = _("Deletion logs")
+
+    def __str__(self):
+        return "{label}:{pk}".format(
+            label=self.model_label,
+            pk=self.object_id,
+        )
+
+
+def log_deletion(sender, instance, **kwargs):
+    """
+    A ``post_delete`` signal receiver to record object deletion.
+    """
+    DeletionLog.objects.log(instance)
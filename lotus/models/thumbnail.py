@@ -0,0 +1,103 @@
+from django.db import models
+from django.utils import timezone
+from django.utils.translation import gettext_lazy as _
+
+from ..choices import THUMBNAIL_JOB_PENDING, THUMBNAIL_JOB_STATUS_CHOICES
+from ..managers import ThumbnailJobManager
+
+
+class ThumbnailJob(models.Model):
+    """
+    A queued job to generate thumbnails for a media field of an object.
+
+    Jobs are created on object save when ``LOTUS_THUMBNAIL_PREGENERATION`` is enabled
+    or from the backfill command, then processed from the worker command.
+    """
+    model_label = models.CharField(
+        _("model label"),
+        max_length=100,
+    )
+    """
+    Required lowercase model label like ``lotus.article``.
+    """
+
+    object_id = models.PositiveIntegerField(
+        _("object ID"),
+    )
+    """
+    Required object primary key.
+    """
+
+    field_name = models.CharField(
+        _("field name"),
+        max_length=100,
+    )
+    """
+    Required media field name.
+    """
+
+    status = models.SmallIntegerField(
+        _("status"),
+        db_index=True,
+        choices=THUMBNAIL_JOB_STATUS_CHOICES,
+        default=THUMBNAIL_JOB_PENDING,
+    )
+    """
+    Required job status.
+    """
+
+    created = models.DateTimeField(
+        _("creation date"),
+        default=timezone.now,
+        editable=False,
+    )
+    """
+    Automatic creation date.
+    """
+
+    processed = models.DateTimeField(
+        _("processing date"),
+        blank=True,
+        null=True,
+        default=None,
+    )
+    """
+    Optional date of the last processing.
+    """
+
+    attempts = models.PositiveSmallIntegerField(
+        _("attempts"),
+        default=0,
+    )
+    """
+    Number of processing attempts.
+    """
+
+    error = models.TextField(
+        _("error"),
+        blank=True,
+        default="",
+    )
+    """
+    Optional error message from the last failed attempt.
+    """
+
+    objects = ThumbnailJobManager()
+
+    class Meta:
+        ordering = ["created", "id"]
+        verbose_name = _("Thumbnail job")
+        verbose_name_plural = _("Thumbnail jobs")
+        indexes = [
+            models.Index(
+                fields=["model_label", "object_id", "field_name"],
+                name="lotus_thumbjob_target_idx",
+            ),
+        ]
+
+    def __str__(self):
+        return "{label}:{pk}:{field}".format(
+            label=self.model_label,
+            pk=self.object_id,
+            field=self.field_name,
+        )
@@ -7,6 +7,8 @@ from ..choices import get_language_choices, get_language_default
 class Translated(models.Model):
     """
     Abstract model for common content translation fields.
+
+    Concrete models are expected to have an ``original`` relation to themselves.
     """
     language = models.CharField(
         _("language"),
@@ -20,5 +22,42 @@ class Translated(models.Model):
     Required language code.
     """
 
+    translation_group = models.PositiveIntegerField(
+        _("translation group"),
+        blank=True,
+        null=True,
+        default=None,
+        editable=False,
+        db_index=True,
+    )
+    """
+    Automatically filled key shared by an original object and all of its translations,
+    this is the original object ID. It is maintained from ``sync_translation_group``
+    on each save and allows to get every siblings with a single equality lookup.
+    """
+
     class Meta:
         abstract = True
+
+    def get_translation_group(self):
+        """
+        Return the expected translation group key.
+
+        Returns:
+            integer: The original ID for a translation else the object ID.
+        """
+        return self.original_id or self.pk
+
+
+def sync_translation_group(sender, instance, **kwargs):
+    """
+    Update the translation group of a saved object if it does not match its original
+    relation anymore.
+
+    This is done with a queryset update so the object is not saved again.
+    """
+    group = instance.get_translation_group()
+
+    if instance.translation_group != group:
+        sender.objects.filter(pk=instance.pk).update(translation_group=group)
+        instance.translation_group = group
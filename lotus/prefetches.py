@@ -0,0 +1,226 @@
+"""
+Loaders to fetch object relations in a fixed number of queries.
+
+Model methods like ``Article.get_categories`` transparently use the data prefetched
+from these loaders instead of performing their own query.
+"""
+from itertools import groupby
+
+from django.conf import settings
+from django.db.models import Prefetch, prefetch_related_objects
+
+from .exceptions import PrefetchProfileError
+from .models import Article, Author, Category
+
+
+def get_list_prefetches(relations, language=None):
+    """
+    Build the prefetches of an article list from a prefetch profile.
+
+    A prefetch profile is a list of the article relation names that a list template
+    renders for each article. Prefetched relations are then used from the article
+    methods ``get_categories``, ``get_authors`` and ``get_tags`` without any query.
+
+    Available relation names are:
+
+    categories
+        Categories ordered like ``Category.COMMON_ORDER_BY``. They are filtered on
+        the given language since a list only contains articles in this language,
+        ``Article.get_categories`` filters them on the article language anyway;
+    authors
+        Authors ordered like ``Author.COMMON_ORDER_BY``;
+    tags
+        Tags without any ordering like ``Article.get_tags`` returns them.
+
+    Arguments:
+        relations (list): Relation names.
+
+    Keyword Arguments:
+        language (string): Language code of listed articles to filter categories on.
+            If not given categories are not filtered.
+
+    Returns:
+        list: Lookups to give to queryset method ``prefetch_related``.
+    """
+    prefetches = []
+
+    for name in relations:
+        if name == "categories":
+            queryset = (
+                Category.objects.get_for_lang(language) if language
+                else Category.objects.all()
+            )
+            prefetches.append(Prefetch(
+                "categories",
+                queryset=queryset.order_by(*Category.COMMON_ORDER_BY),
+            ))
+        elif name == "authors":
+            prefetches.append(Prefetch(
+                "authors",
+                queryset=Author.objects.order_by(*Author.COMMON_ORDER_BY),
+            ))
+        elif name == "tags":
+            # Tag manager does not support custom querysets
+            prefetches.append("tags")
+        else:
+            raise PrefetchProfileError(
+                "Unknown relation name in prefetch profile: {}".format(name)
+            )
+
+    return prefetches
+
+
+def prefetch_article_detail(articles, filter_func=None, target_date=None,
+                            preview=False):
+    """
+    Prefetch every relations used to render or serialize article details.
+
+    This honors the same language and publication filters than the model methods and
+    template tags applies:
+
+    * Categories are prefetched then filtered on article language from
+      ``Article.get_categories``;
+    * Authors and tags are prefetched without filtering;
+    * Related articles are filtered with ``filter_func`` for the article language and
+      stored in attribute ``prefetched_related``, the function is stored in attribute
+      ``prefetched_related_filter``;
+    * Translations (articles which have the article as original) are filtered with
+      ``filter_func`` without language and stored in attribute
+      ``prefetched_translations``;
+    * Translation siblings are filtered on publication for ``target_date`` unless
+      preview mode is enabled and stored in attribute ``prefetched_siblings``.
+
+    Only the related articles and siblings queries depend on the number of distinct
+    article languages and articles, so for a single article detail the number of
+    queries is fixed.
+
+    Arguments:
+        articles (list): Article objects to prefetch relations for. Commonly a list of
+            a single article from a detail.
+
+    Keyword Arguments:
+        filter_func (function): Function to filter related and translations article
+            querysets, commonly ``ArticleFilterMixin.apply_article_lookups``. If not
+            given only the language filtering is applied on related articles.
+        target_date (datetime.datetime): Datetime used for siblings publication
+            filtering. Default to current datetime.
+        preview (boolean): If true, siblings are not filtered on publication.
+
+    Returns:
+        list: Given articles.
+    """
+    articles = list(articles)
+    if not articles:
+        return articles
+
+    prefetch_related_objects(
+        articles,
+        Prefetch(
+            "categories",
+            queryset=Category.objects.order_by(*Category.COMMON_ORDER_BY),
+        ),
+        Prefetch(
+            "authors",
+            queryset=Author.objects.order_by(*Author.COMMON_ORDER_BY),
+        ),
+        "tags",
+        Prefetch(
+            "article_set",
+            queryset=(
+                filter_func(Article.objects.all()) if filter_func
+                else Article.objects.all()
+            ).list_projection().order_by(*Article.COMMON_ORDER_BY),
+            to_attr="prefetched_translations",
+        ),
+    )
+
+    # Related articles are filtered on language so they are prefetched per language
+    by_language = sorted(articles, key=lambda item: item.language)
+    for language, items in groupby(by_language, key=lambda item: item.language):
+        if filter_func:
+            queryset = filter_func(Article.objects.all(), language)
+        else:
+            queryset = Article.objects.get_for_lang(language)
+
+        prefetch_related_objects(
+            list(items),
+            Prefetch(
+                "related",
+                queryset=queryset.list_projection().order_by(
+                    *Article.COMMON_ORDER_BY
+                ),
+                to_attr="prefetched_related",
+            ),
+        )
+
+    for article in articles:
+        article.prefetched_related_filter = filter_func
+
+        siblings = Article.objects.get_siblings(source=article)
+        if not preview:
+            siblings = siblings.get_published(target_date=target_date)
+
+        article.prefetched_siblings = list(
+            siblings.list_projection().order_by("language")
+        )
+
+    return articles
+
+
+def resolve_translation_siblings(sources, target_date=None, preview=False):
+    """
+    Resolve translation siblings for many objects in a single query.
+
+    Siblings are retrieved from the translation groups of given objects, so objects
+    without translation group (not saved yet) are ignored.
+
+    Arguments:
+        sources (list): Article or Category objects, all from the same model. Commonly
+            the objects of a list page.
+
+    Keyword Arguments:
+        target_date (datetime.datetime): Datetime used for article siblings
+            publication filtering. Default to current datetime.
+        preview (boolean): If true, article siblings are not filtered on publication.
+
+    Returns:
+        dict: Resolved siblings indexed on source object ID. Each item is a dictionnary
+        with the same items than template tag ``translation_siblings`` returns:
+        ``source``, ``siblings`` as a list ordered on language, ``existing_languages``
+        and ``available_languages``.
+    """
+    sources = [item for item in sources if item.translation_group]
+    if not sources:
+        return {}
+
+    model = type(sources[0])
+
+    queryset = model.objects.get_translation_groups(sources)
+    if issubclass(model, Article) and not preview:
+        queryset = queryset.get_published(target_date=target_date)
+
+    groups = {}
+    for item in queryset.order_by("language"):
+        groups.setdefault(item.translation_group, []).append(item)
+
+    resolved = {}
+    for source in sources:
+        siblings = [
+            item
+            for item in groups.get(source.translation_group, [])
+            if item.pk != source.pk
+        ]
+        existing_languages = [item.language for item in [source] + siblings]
+
+        resolved[source.pk] = {
+            "source": source,
+            "siblings": siblings,
+            "existing_languages": existing_languages,
+            "available_languages": [
+                code
+                for code, name in settings.LANGUAGES
+                if (code not in existing_languages)
+            ],
+        }
+
+    return resolved
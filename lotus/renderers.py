@@ -0,0 +1,130 @@
+"""
+Fast JSON rendering for the API.
+
+``LotusJSONRenderer`` renders with `orjson <https://github.com/ijl/orjson>`_ when it is
+installed and falls back to the DRF renderer with ``LotusJSONEncoder`` else. Both
+ways give the same output than the DRF JSON renderer for the data produced by Lotus
+serializers, types unknown from JSON are dispatched from the ``API_JSON_ENCODERS``
+table.
+"""
+import datetime
+import decimal
+import json
+import uuid
+
+from django.db.models.query import QuerySet
+from django.utils.encoding import force_str
+from django.utils.functional import Promise
+
+from rest_framework.renderers import JSONRenderer
+from rest_framework.utils import encoders
+
+from .utils.jsons import JSON_TYPE_ENCODERS, TypeEncoderTable
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+drf_json_default = encoders.JSONEncoder().default
+"""
+DRF encoding function, values which representation may differ between DRF versions
+(like the datetime precision) are always encoded with it.
+"""
+
+API_JSON_ENCODERS = TypeEncoderTable(
+    {
+        **JSON_TYPE_ENCODERS,
+        datetime.datetime: drf_json_default,
+        datetime.date: drf_json_default,
+        datetime.time: drf_json_default,
+        datetime.timedelta: drf_json_default,
+        decimal.Decimal: drf_json_default,
+        uuid.UUID: drf_json_default,
+        Promise: force_str,
+        QuerySet: tuple,
+    },
+    # Remaining types supported by DRF encoder like IP addresses or iterables
+    fallback=drf_json_default,
+)
+"""
+Encoder table for API rendering, it includes types from ``ExtendedJsonEncoder`` and
+the common ones from DRF encoder.
+"""
+
+ORJSON_OPTIONS = (
+    orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS
+    if orjson is not None else None
+)
+"""
+Options given to ``orjson.dumps``, ``OPT_PASSTHROUGH_DATETIME`` makes datetimes,
+dates and times encoded with the DRF encoder instead of the orjson format.
+"""
+
+
+class LotusJSONEncoder(encoders.JSONEncoder):
+    """
+    DRF JSON encoder with types dispatched from ``API_JSON_ENCODERS``.
+    """
+    def default(self, obj):
+        return API_JSON_ENCODERS.default(obj)
+
+
+def json_dumps(data):
+    """
+    Encode data to compact JSON.
+
+    Arguments:
+        data (object): Data to encode.
+
+    Returns:
+        bytes: JSON encoded in UTF-8 where characters ``U+2028`` and ``U+2029`` are
+        escaped so output is a strict Javascript subset.
+    """
+    if orjson is not None:
+        content = orjson.dumps(
+            data,
+            default=API_JSON_ENCODERS.default,
+            option=ORJSON_OPTIONS,
+        )
+    else:
+        content = json.dumps(
+            data,
+            cls=LotusJSONEncoder,
+            ensure_ascii=False,
+            separators=(",", ":"),
+        ).encode()
+
+    if b"\xe2\x80\xa8" in content or b"\xe2\x80\xa9" in content:
+        content = content.replace(b"\xe2\x80\xa8", b"\\u2028").replace(
+            b"\xe2\x80\xa9", b"\\u2029"
+        )
+
+    return content
+
+
+class LotusJSONRenderer(JSONRenderer):
+    """
+    JSON renderer using ``json_dumps``.
+
+    It falls back to the DRF renderer for outputs ``json_dumps`` does not implement,
+    that is indented output (like from the browsable API), ASCII output or non compact
+    output from DRF settings.
+    """
+    encoder_class = LotusJSONEncoder
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if (
+            data is None or
+            self.ensure_ascii or
+            not self.compact or
+            self.get_indent(accepted_media_type, renderer_context or {}) is not None
+        ):
+            return super().render(
+                data,
+                accepted_media_type=accepted_media_type,
+                renderer_context=renderer_context,
+            )
+
+        return json_dumps(data)
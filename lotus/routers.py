@@ -0,0 +1,195 @@
+"""
+Optional read replica routing for public reads.
+
+Lotus always read and write from the default database unless you enable read replicas
+with setting ``LOTUS_READ_REPLICAS``, register the router
+``lotus.routers.LotusReplicaRouter`` in ``DATABASE_ROUTERS`` and the middleware
+``lotus.routers.LotusReplicaMiddleware`` in ``MIDDLEWARE`` after the session and
+authentication middlewares.
+
+The middleware marks public requests as allowed to read from a replica and the router
+sends their reads on Lotus models to this replica. Everything else stays on the
+default database:
+
+* Every write, including writes on objects read from a replica;
+* Every request that is not a ``GET`` or ``HEAD``;
+* Admin views and views which disable replica with attribute ``replica_reads``;
+* Requests with preview mode enabled;
+* Requests from a client which made a write request recently, this is the read your
+  writes stickiness which lasts for ``LOTUS_REPLICA_STICKINESS`` seconds.
+
+Code running outside of a request (like management commands) can explicitly use a
+replica with the context manager ``replica_reads`` or the queryset method
+``using_replica``.
+"""
+import random
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS
+from django.utils.module_loading import import_string
+
+
+ROUTED_APP_LABELS = ("lotus", "taggit")
+"""
+Application labels of models that are allowed to be read from a replica.
+"""
+
+SAFE_METHODS = ("GET", "HEAD", "OPTIONS")
+
+_replica_alias = ContextVar("lotus_replica_alias", default=None)
+
+
+def pick_replica():
+    """
+    Choose a replica alias from setting ``LOTUS_READ_REPLICAS``.
+
+    Returns:
+        string: A replica alias or ``None`` if there is no enabled replica.
+    """
+    if not settings.LOTUS_READ_REPLICAS:
+        return None
+
+    return random.choice(settings.LOTUS_READ_REPLICAS)
+
+
+def get_replica_alias():
+    """
+    Return the replica alias enabled for the current context.
+
+    Returns:
+        string: A replica alias or ``None`` if reads are not allowed on a replica.
+    """
+    return _replica_alias.get()
+
+
+@contextmanager
+def replica_reads(alias=None):
+    """
+    Context manager to allow reads on a replica.
+
+    Keyword Arguments:
+        alias (string): Replica alias to use. If not given, a replica is picked from
+            setting ``LOTUS_READ_REPLICAS``. Reads stay on default database if there
+            is no enabled replica.
+    """
+    token = _replica_alias.set(alias or pick_replica())
+    try:
+        yield _replica_alias.get()
+    finally:
+        _replica_alias.reset(token)
+
+
+class LotusReplicaRouter:
+    """
+    Database router to send public reads on Lotus models to a replica.
+
+    Reads are only routed when a replica has been enabled for the current context,
+    from ``LotusReplicaMiddleware`` or ``replica_reads``. Writes always go to the
+    default database.
+    """
+    def is_routed(self, model):
+        return model._meta.app_label in ROUTED_APP_LABELS
+
+    def db_for_read(self, model, **hints):
+        alias = get_replica_alias()
+        # Related objects from an instance are left to Django which use the
+        # instance database
+        if alias is None or "instance" in hints or not self.is_routed(model):
+            return None
+
+        return alias
+
+    def db_for_write(self, model, **hints):
+        if not self.is_routed(model):
+            return None
+
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        databases = [DEFAULT_DB_ALIAS] + list(settings.LOTUS_READ_REPLICAS)
+        if obj1._state.db in databases and obj2._state.db in databases:
+            return True
+
+        return None
+
+
+class LotusReplicaMiddleware:
+    """
+    Middleware to allow public requests to read from a replica.
+
+    It also sets the stickiness cookie on write requests so the client reads from the
+    default database for a while and is able to see its own changes.
+    """
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        # Ensure a request never inherits a replica from another context
+        token = _replica_alias.set(None)
+        try:
+            response = self.get_response(request)
+        finally:
+            _replica_alias.reset(token)
+
+        if (
+            settings.LOTUS_READ_REPLICAS and
+            request.method not in SAFE_METHODS and
+            settings.LOTUS_REPLICA_STICKINESS
+        ):
+            response.set_cookie(
+                settings.LOTUS_REPLICA_STICKY_COOKIE,
+                "1",
+                max_age=settings.LOTUS_REPLICA_STICKINESS,
+                httponly=True,
+                samesite="Lax",
+            )
+
+        return response
+
+    def allows_replica(self, request, view_func):
+        """
+        Return if request is allowed to read from a replica.
+
+        Arguments:
+            request (django.http.request.HttpRequest): The current request.
+            view_func (function): The view function resolved for request.
+
+        Returns:
+            boolean: True if request can read from a replica.
+        """
+        if not settings.LOTUS_READ_REPLICAS or request.method not in SAFE_METHODS:
+            return False
+
+        if settings.LOTUS_REPLICA_STICKY_COOKIE in request.COOKIES:
+            return False
+
+        if "admin" in getattr(request.resolver_match, "app_names", []):
+            return False
+
+        view_class = getattr(view_func, "view_class", None) or getattr(
+            view_func, "cls", None
+        )
+        # Lazy views only know the path to their class until their first call
+        if view_class is None and getattr(view_func, "lazy_path", None):
+            view_class = import_string(view_func.lazy_path)
+        if not getattr(view_class, "replica_reads", True):
+            return False
+
+        # Same rule than PreviewModeMixin.allowed_preview_mode
+        user = getattr(request, "user", None)
+        session = getattr(request, "session", None)
+        if (
+            user is not None and user.is_staff and session is not None and
+            session.get(settings.LOTUS_PREVIEW_KEYWORD, None) is True
+        ):
+            return False
+
+        return True
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        if self.allows_replica(request, view_func):
+            _replica_alias.set(pick_replica())
+
+        return None
@@ -1,3 +1,6 @@
+from django.conf import settings
+from django.core.cache import cache
+
 from rest_framework import serializers
 
 from ..models import Album, AlbumItem
@@ -16,12 +19,38 @@ class AlbumSerializer(serializers.ModelSerializer):
         model = Album
         exclude = ["id"]
 
+    def to_representation(self, instance):
+        """
+        Return album payload from cache if any.
+
+        Payload is cached for ``LOTUS_ALBUM_CACHE_TIMEOUT`` seconds on a key versioned
+        from the album modification date. Since media URLs are absolute, the key also
+        depends on the request host.
+        """
+        if not settings.LOTUS_ALBUM_CACHE_TIMEOUT:
+            return super().to_representation(instance)
+
+        request = self.context.get("request")
+        cache_key = instance.get_cache_key(
+            "api",
+            request.build_absolute_uri("/") if request else "",
+        )
+
+        data = cache.get(cache_key)
+        if data is None:
+            data = super().to_representation(instance)
+            cache.set(cache_key, data, settings.LOTUS_ALBUM_CACHE_TIMEOUT)
+
+        return data
+
     def get_items(self, obj):
         """
         Return list of album items.
+
+        Items are only queried when the payload is not served from cache.
         """
         return AlbumItemSerializer(
-            obj.albumitems.all(),
+            obj.albumitems.order_by(*AlbumItem.COMMON_ORDER_BY),
             many=True,
             context=self.context
         ).data
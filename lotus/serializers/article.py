@@ -4,9 +4,11 @@ from taggit.serializers import TagListSerializerField, TaggitSerializer
 
 from ..models import Article
 from ..templatetags.lotus import article_state_list
+from .mixins import SparseFieldsetMixin
 
 
-class ArticleSerializer(TaggitSerializer, serializers.HyperlinkedModelSerializer):
+class ArticleSerializer(SparseFieldsetMixin, TaggitSerializer,
+                        serializers.HyperlinkedModelSerializer):
     """
     This is the serializer for full payload which implement every possible fields.
 
@@ -29,7 +31,7 @@ class ArticleSerializer(TaggitSerializer, serializers.HyperlinkedModelSerializer
 
     class Meta:
         model = Article
-        fields = "__all__"
+        exclude = ["translation_group"]
         extra_kwargs = {
             "url": {
                 "view_name": "lotus-api:article-detail"
@@ -119,14 +121,24 @@ class ArticleSerializer(TaggitSerializer, serializers.HyperlinkedModelSerializer
     def get_translations(self, obj):
         """
         Return list of possible translations.
+
+        Translations prefetched from ``lotus.prefetches.prefetch_article_detail`` are
+        used if any.
         """
-        queryset = self.Meta.model.objects.filter(original=obj.id)
+        if hasattr(obj, "prefetched_translations"):
+            queryset = obj.prefetched_translations
+        else:
+            queryset = self.Meta.model.objects.filter(original=obj.id)
 
-        if self.context.get("article_filter_func"):
-            queryset = self.context.get("article_filter_func")(queryset)
+            if self.context.get("article_filter_func"):
+                queryset = self.context.get("article_filter_func")(queryset)
+
+            queryset = queryset.list_projection().order_by(
+                *self.Meta.model.COMMON_ORDER_BY
+            )
 
         return ArticleMinimalSerializer(
-            queryset.order_by(*self.Meta.model.COMMON_ORDER_BY),
+            queryset,
             many=True,
             context=self.context
         ).data
@@ -145,7 +157,10 @@ class ArticleResumeSerializer(ArticleSerializer):
         Field ``related`` is not allowed since this serializer is used into list and
         it could lead on too many recursions.
 
+    Fields ``album``, ``original``, ``related`` and ``translations`` can still be
+    added on demand with the serializer argument ``expand``.
     """
+    expandable_fields = ["album", "original", "related", "translations"]
 
     class Meta:
         model = Article
@@ -1,9 +1,10 @@
 from rest_framework import serializers
 
 from ..models import Author
+from .mixins import SparseFieldsetMixin
 
 
-class AuthorSerializer(serializers.HyperlinkedModelSerializer):
+class AuthorSerializer(SparseFieldsetMixin, serializers.HyperlinkedModelSerializer):
     """
     Author serializer only share a few fields since we don't want to expose security
     concern informations about users.
@@ -53,13 +54,18 @@ class AuthorSerializer(serializers.HyperlinkedModelSerializer):
             queryset = obj.articles.filter(language=self.context.get("LANGUAGE_CODE"))
 
         return ArticleMinimalSerializer(
-            queryset,
+            queryset.list_projection(),
             many=True,
             context=self.context
         ).data
 
 
 class AuthorResumeSerializer(AuthorSerializer):
+    """
+    Reduced author serializer, fields ``articles`` and ``username`` can be added on
+    demand with the serializer argument ``expand``.
+    """
+    expandable_fields = ["articles", "username"]
 
     class Meta:
         model = Author
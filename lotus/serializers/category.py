@@ -1,9 +1,10 @@
 from rest_framework import serializers
 
-from ..models import Category
+from ..models import Article, Category
+from .mixins import SparseFieldsetMixin
 
 
-class CategorySerializer(serializers.HyperlinkedModelSerializer):
+class CategorySerializer(SparseFieldsetMixin, serializers.HyperlinkedModelSerializer):
     """
     Other used model serializer are imported into methods to avoid circular references.
     """
@@ -17,10 +18,20 @@ class CategorySerializer(serializers.HyperlinkedModelSerializer):
     articles = serializers.SerializerMethodField()
     translations = serializers.SerializerMethodField()
     children = serializers.SerializerMethodField()
+    article_counts = serializers.SerializerMethodField()
 
     class Meta:
         model = Category
-        exclude = ["path", "numchild"]
+        exclude = [
+            "path",
+            "numchild",
+            "translation_group",
+            "direct_count",
+            "direct_public_count",
+            "subtree_count",
+            "subtree_public_count",
+            "counts_expire",
+        ]
         extra_kwargs = {
             "url": {
                 "view_name": "lotus-api:category-detail"
@@ -48,6 +59,15 @@ class CategorySerializer(serializers.HyperlinkedModelSerializer):
         """
         return obj.get_absolute_url()
 
+    def get_article_counts(self, obj):
+        """
+        Return the published article counters, private articles are only counted
+        for authenticated users.
+        """
+        user = getattr(self.context.get("request"), "user", None)
+
+        return obj.get_article_counts(private=bool(user and user.is_authenticated))
+
     def get_articles(self, obj):
         """
         Return list of articles related to category object.
@@ -57,18 +77,26 @@ class CategorySerializer(serializers.HyperlinkedModelSerializer):
         filtering function expecting the same arguments as
         ``ArticleFilterMixin.apply_article_lookups`` and also some viewset attributes
         like ``request``.
+
+        Articles from the category descendants are included when context item
+        ``include_descendants`` is true.
         """
         from .article import ArticleMinimalSerializer
 
+        if self.context.get("include_descendants"):
+            articles = Article.objects.get_for_category_tree(obj)
+        else:
+            articles = obj.articles
+
         if self.context.get("article_filter_func"):
             queryset = self.context.get("article_filter_func")(
-                obj.articles, obj.language
+                articles, obj.language
             )
         else:
-            queryset = obj.articles.filter(language=obj.language)
+            queryset = articles.filter(language=obj.language)
 
         return ArticleMinimalSerializer(
-            queryset,
+            queryset.list_projection(),
             many=True,
             context=self.context
         ).data
@@ -101,8 +129,11 @@ class CategoryResumeSerializer(CategorySerializer):
     Reduced category serializer
 
     This should be the common serializer, the other complete one would be better in
-    detail.
+    detail. Fields ``articles``, ``children``, ``original``, ``parent`` and
+    ``translations`` can be added on demand with the serializer argument ``expand``.
     """
+    expandable_fields = ["articles", "children", "original", "parent", "translations"]
+
     class Meta:
         model = Category
         fields = [
@@ -113,6 +144,7 @@ class CategoryResumeSerializer(CategorySerializer):
             "lead",
             "cover",
             "description",
+            "article_counts",
         ]
         extra_kwargs = {
             "url": {
@@ -0,0 +1,42 @@
+class SparseFieldsetMixin:
+    """
+    A mixin for model serializers to select the serialized fields.
+
+    Serializer accepts two additional keyword arguments:
+
+    fields
+        A list of field names to keep, other fields are not serialized at all so their
+        method is never called. Unknown names are ignored. If not given, every
+        serializer fields are kept.
+    expand
+        A list of field names to add to serializer fields, only names from
+        ``expandable_fields`` are allowed and unknown names are ignored.
+
+    These arguments are only meant for the root serializer, nested serializers from
+    method fields are not affected.
+
+    Attributes:
+        expandable_fields (list): Names of fields which are not in the serializer
+            fields but can be added with ``expand``.
+    """
+    expandable_fields = []
+
+    def __init__(self, *args, **kwargs):
+        self.requested_fields = kwargs.pop("fields", None)
+        self.requested_expansions = kwargs.pop("expand", None) or []
+
+        super().__init__(*args, **kwargs)
+
+    def get_field_names(self, declared_fields, info):
+        names = list(super().get_field_names(declared_fields, info))
+
+        names.extend([
+            name
+            for name in self.requested_expansions
+            if name in self.expandable_fields and name not in names
+        ])
+
+        if self.requested_fields is not None:
+            names = [name for name in names if name in self.requested_fields]
+
+        return names
@@ -119,6 +119,14 @@ LOTUS_ALBUM_TAG_TEMPLATE = "lotus/album/partials/tag_get_album_html.html"
 Template path used to render template tag ``get_album_html``.
 """
 
+LOTUS_ALBUM_CACHE_TIMEOUT = 3600
+"""
+Time in seconds to keep rendered albums in cache, either the HTML from template tag
+``get_album_html`` or the API payload. Cache keys are versioned on album modification
+date which is updated on each album item change, so there is no stale content. Set it
+to ``0`` to disable this cache.
+"""
+
 LOTUS_PREVIEW_KEYWORD = "preview"
 """
 Keyword name for preview mode in session
@@ -153,6 +161,21 @@ in crumbs. When true, only the current category is listed in crumbs. This is onl
 applied on category children.
 """
 
+LOTUS_CATEGORY_INCLUDE_DESCENDANTS = False
+"""
+When true, the category detail view lists the articles from the category and from all
+its descendants instead of only the articles directly related to the category. The
+API category detail has the same default, it can be changed per request with query
+parameter ``descendants``.
+"""
+
+LOTUS_CATEGORY_PARENT_SAME_LANGUAGE = False
+"""
+When true, the parent choices from the category admin change form are limited to the
+categories in the same language than the edited category. Parent with a different
+language are rejected on form validation anyway.
+"""
+
 LOTUS_ADMIN_ARTICLE_ASSETS = {
     "css": {
         "all": ("css/lotus-admin.css",)
@@ -283,3 +306,167 @@ This behavior is applied for all translated models like Article and Category.
 In any way, all other endpoints still filter on language especially for the lists that
 need to not return mixed languages.
 """
+
+LOTUS_THUMBNAIL_PREGENERATION = False
+"""
+Enable background thumbnail pre-generation. When enabled, saving an Article, a Category
+or an AlbumItem will enqueue a job to generate the thumbnails defined in
+``LOTUS_THUMBNAIL_SIZES`` for its media fields. Jobs are processed from the management
+command ``lotus_thumbnail_worker``.
+
+This is disabled on default since queued jobs would pile up without a running worker.
+"""
+
+LOTUS_THUMBNAIL_MAX_ATTEMPTS = 3
+"""
+Maximum number of processing attempts for a thumbnail job. A failed job which has
+reached it is not claimed anymore by the worker, even with option ``--retry-failed``.
+"""
+
+LOTUS_THUMBNAIL_JOB_TIMEOUT = 600
+"""
+Time in seconds after which a running thumbnail job is considered as abandoned (like
+from a crashed worker) and can be claimed again. Job processing date is only stamped
+when it is claimed, so this must be longer than the worst time to generate every
+thumbnails of a media else a slow job would be processed twice.
+"""
+
+LOTUS_THUMBNAIL_JOB_RETENTION = 604800
+"""
+Time in seconds to keep done thumbnail jobs, the worker deletes the older ones once
+the queue is empty. Failed jobs are kept. Set it to ``0`` to never delete done jobs.
+"""
+
+LOTUS_THUMBNAIL_SIZES = {
+    "lotus.article": {
+        "cover": [
+            ("300x200", {"crop": "center"}),
+        ],
+        "image": [
+            ("948x416", {}),
+        ],
+    },
+    "lotus.category": {
+        "cover": [
+            ("300x200", {"crop": "center"}),
+            ("800x640", {"crop": "center"}),
+        ],
+    },
+    "lotus.albumitem": {
+        "media": [
+            ("300x200", {"crop": "center"}),
+        ],
+    },
+}
+"""
+Thumbnail sizes to pre-generate for each model media field. Item key is the lowercase
+model label and item value is a dictionnary of field names with their list of
+thumbnails.
+
+Each thumbnail is a tuple of a geometry and the options as given to the template tag
+``media_thumb``. These must be exactly the same than the ones used in your templates
+else pre-generated thumbnails won't be reused. Default values are the ones from Lotus
+templates.
+"""
+
+LOTUS_READ_REPLICAS = []
+"""
+Database aliases of read replicas to use for public reads. Reads are distributed
+randomly between replicas. This requires the router
+``lotus.routers.LotusReplicaRouter`` and the middleware
+``lotus.routers.LotusReplicaMiddleware`` to be enabled.
+
+Default is empty so every reads are made on the default database.
+"""
+
+LOTUS_REPLICA_STICKINESS = 15
+"""
+Duration in seconds that a client keeps reading from the default database after a
+write request (commonly an editor saving an object from admin) so it can see its own
+changes while replicas are catching up. Use ``0`` to disable stickiness.
+"""
+
+LOTUS_REPLICA_STICKY_COOKIE = "lotus_primary"
+"""
+Name of the cookie used to mark a client for stickiness on default database.
+"""
+
+LOTUS_SURROGATE_KEY_PREFIX = "lotus"
+"""
+Prefix for surrogate keys, you may change it to avoid collisions when many sites share
+the same CDN service.
+"""
+
+LOTUS_SURROGATE_KEY_HEADERS = {
+    "Surrogate-Key": " ",
+    "Cache-Tag": ",",
+}
+"""
+Response headers to fill with surrogate keys. Item key is the header name and item
+value is the separator to join keys with. Default values fit the common CDN services,
+use an empty dictionnary to disable these headers.
+"""
+
+LOTUS_PURGE_BACKEND = "lotus.surrogates.LoggingPurgeBackend"
+"""
+Python path to the backend class which purges surrogate keys when objects change.
+Default backend only logs the purged keys, ``lotus.surrogates.HTTPPurgeBackend``
+posts them to an URL. Use ``None`` to disable purge.
+"""
+
+LOTUS_PURGE_BACKEND_OPTIONS = {}
+"""
+Keyword arguments given to the purge backend class, like ``{"url": "http://..."}``
+for ``lotus.surrogates.HTTPPurgeBackend``.
+"""
+
+LOTUS_FEED_LIMIT = 20
+"""
+Maximum number of articles listed in syndication feeds.
+"""
+
+LOTUS_FEED_CACHE_TIMEOUT = 3600
+"""
+Time in seconds to keep rendered syndication feeds in cache. Cached feeds are
+versioned on their surrogate keys so they are dropped when one of their objects or
+listings is purged, and never kept after the next article publication start or end.
+Set it to ``0`` to disable this cache.
+"""
+
+LOTUS_PAGE_CACHE_TIMEOUT = 600
+"""
+Maximum time in seconds to keep pages in cache with middleware
+``lotus.middleware.PageCacheMiddleware``. Pages are dropped before when one of their
+surrogate keys is purged and on the next article publication start or end. Set it
+to ``0`` to disable this cache even if middleware is enabled.
+"""
+
+LOTUS_API_CACHE_TIMEOUT = 3600
+"""
+Time in seconds to keep the serialized payload of Article and Category API details in
+cache. Cached payloads are versioned on their surrogate keys so they are dropped when
+one of their objects or listings is purged, and never kept after the next article
+publication start or end. Set it to ``0`` to disable this cache.
+"""
+
+LOTUS_CHANGEFEED_CHUNK_SIZE = 2000
+"""
+Number of rows fetched at once from database cursors by the API change feed, it
+limits the memory used to stream large feeds.
+"""
+
+LOTUS_CHANGEFEED_SAFETY_MARGIN = 5
+"""
+Number of seconds subtracted from the current date to build the API change feed
+watermark. Objects saved from transactions which are still running when a feed is
+requested have an older date than the watermark once committed, the margin should be
+longer than the write transactions so these objects are not missed by the next feed.
+"""
+
+LOTUS_API_FAST_JSON = False
+"""
+If enabled, Lotus viewsets render JSON with ``lotus.renderers.LotusJSONRenderer``
+instead of the DRF JSON renderer. It uses `orjson <https://github.com/ijl/orjson>`_
+when installed for a faster rendering and the same values, only floats in exponent
+notation are written differently (like ``1e16`` instead of ``1e+16``).
+"""
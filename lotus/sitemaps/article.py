@@ -34,7 +34,7 @@ class ArticleSitemap(TranslatedSitemapAbstract):
         so no private or non published contents. Each original may have alternate links
         for their translations.
         """
-        q = self.model.objects.get_published(private=False)
+        q = self.model.objects.get_published(private=False).list_projection()
 
         if self.translations:
             return q.filter(original__isnull=True)
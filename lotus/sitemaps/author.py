@@ -38,38 +38,25 @@ class AuthorSitemap(Sitemap):
 
     def items(self):
         """
-        Get all active Author object to reference.
+        Get all active Author object to reference for each available language.
 
-        We need to retrieve object separatly for each available language because
-        we filter for active tag per language. So we try to do it more efficiently with
-        ``union()``.
+        Authors are grouped on their article language from a single query over the
+        published articles, so an author is listed once for each language it has
+        published articles in. Ordering ends on the author ID so paginating is stable.
 
         Returns:
-            Queryset: Combined lookups in a single queryset.
+            Queryset: Author objects annotated with ``article_language`` and
+            ``article_latest_update``.
         """
-        return self.model.objects.none().union(*[
-            self.get_language_items(code)
-            for code, name in settings.LANGUAGES
-        ]).order_by("article_language", *self.model.COMMON_ORDER_BY)
+        q = self.model.lotus_objects.get_queryset()
 
-    def get_language_items(self, language):
-        """
-        Return active Author for a language.
-
-        Published articles are determined with the common publication criterias.
-
-        Arguments:
-            language (string): Language code to filter on. It will also annotate
-                objects so their language can be retrieved for further usage.
-
-        Returns:
-            Queryset: Build complex queryset to get all tags which have published
-            articles for required language.
-        """
-        return self.model.lotus_objects.get_active(
-            language=language,
-            private=False,
+        # Publication and language lookups must be in the same filter so annotations
+        # use the same join on filtered articles
+        return q.filter(
+            *q.build_publication_conditions(private=False, prefix="articles__"),
+            articles__language__in=[code for code, name in settings.LANGUAGES],
+        ).annotate(
+            article_language=models.F("articles__language"),
         ).annotate(
-            article_language=models.Value(language),
             article_latest_update=models.Max("articles__last_update"),
-        )
+        ).order_by("article_language", *self.model.COMMON_ORDER_BY, "pk")
@@ -1,10 +1,10 @@
 from django.conf import settings
 from django.contrib.sitemaps import Sitemap
 from django.db import models
-from django.urls import translate_url, reverse
 
 from taggit.models import Tag
 
+from ..urltemplates import build_translated_url
 from ..views.mixins import ArticleFilterMixin
 
 
@@ -23,9 +23,10 @@ class TagSitemap(ArticleFilterMixin, Sitemap):
         Return localized url for the tag language (defined through annotation from
         queryset).
         """
-        return translate_url(
-            reverse("lotus:tag-detail", kwargs={"tag": item.slug}),
-            item.article_language
+        return build_translated_url(
+            "lotus:tag-detail",
+            item.article_language,
+            tag=item.slug,
         )
 
     def lastmod(self, obj):
@@ -40,44 +41,23 @@ class TagSitemap(ArticleFilterMixin, Sitemap):
 
     def items(self):
         """
-        Get all active Tag object to reference.
+        Get all active Tag object to reference for each available language.
 
-        We need to retrieve object separatly for each available language because
-        we filter for active tag per language. So we try to do it more efficiently with
-        ``union()``.
+        Tags are grouped on their article language from a single query over the
+        published articles, so a tag is listed once for each language it has published
+        articles in. Ordering ends on the tag ID so paginating is stable.
 
         Returns:
-            Queryset: Combined lookups in a single queryset.
+            Queryset: Tag objects annotated with ``article_language`` and
+            ``article_latest_update``.
         """
-        return self.model.objects.none().union(*[
-            self.get_language_items(code)
-            for code, name in settings.LANGUAGES
-        ]).order_by("article_language", "name")
+        publication_criterias = self.build_article_lookups(prefix="article__")
 
-    def get_language_items(self, language):
-        """
-        Return active Tags for a language.
-
-        Published articles are determined with the common publication criterias.
-
-        Arguments:
-            language (string): Language code to filter on. It will also annotate
-                objects so their language can be retrieved for further usage.
-
-        Returns:
-            Queryset: Build complex queryset to get all tags which have published
-            articles for required language.
-        """
-        publication_criterias = self.build_article_lookups(
-            language=language,
-            prefix="article__",
-        )
-
-        return self.model.objects.annotate(
-            article_language=models.Value(language),
+        return self.model.objects.filter(
+            *publication_criterias,
+            article__language__in=[code for code, name in settings.LANGUAGES],
+        ).annotate(
+            article_language=models.F("article__language"),
+        ).annotate(
             article_latest_update=models.Max("article__last_update"),
-            article_count=models.Count(
-                "article",
-                filter=models.Q(*publication_criterias),
-            )
-        ).filter(article_count__gt=0)
+        ).order_by("article_language", "name", "pk")
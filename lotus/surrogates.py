@@ -0,0 +1,377 @@
+"""
+Surrogate keys to cache Lotus responses on a CDN and purge them.
+
+Lotus views and API viewsets add headers (as defined in setting
+``LOTUS_SURROGATE_KEY_HEADERS``) listing a key for each object a response depends on.
+Model signals then call the purge backend from setting ``LOTUS_PURGE_BACKEND`` with the
+keys of changed objects, so the CDN can drop the responses tagged with them.
+
+A key is built from the model name and the object ID like ``lotus-article-42``.
+Listing responses also have a listing key like ``lotus-article-list`` which is purged
+each time an object from this model changes.
+
+Each key also has a version which changes on each purge. Lotus caches store the
+versions of the keys their entry depends on and drop the entry once one of these
+versions has changed (see ``set_versioned`` and ``get_versioned``), so they are
+invalidated on the same changes than the CDN and only for the related objects.
+"""
+import json
+import logging
+import urllib.request
+import uuid
+from functools import partial
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.utils.module_loading import import_string
+
+
+logger = logging.getLogger("lotus.purge")
+
+KEY_VERSION_CACHE_PREFIX = "lotus-key-version"
+
+
+def build_surrogate_key(model, pk):
+    """
+    Build the surrogate key for an object.
+
+    Arguments:
+        model (django.db.models.Model): Model class or object.
+        pk (integer): Object primary key.
+
+    Returns:
+        string: Surrogate key.
+    """
+    return "{prefix}-{name}-{pk}".format(
+        prefix=settings.LOTUS_SURROGATE_KEY_PREFIX,
+        name=model._meta.model_name,
+        pk=pk,
+    )
+
+
+def build_listing_key(model):
+    """
+    Build the surrogate key for the listings of a model.
+
+    Arguments:
+        model (django.db.models.Model): Model class or object.
+
+    Returns:
+        string: Surrogate key.
+    """
+    return "{prefix}-{name}-list".format(
+        prefix=settings.LOTUS_SURROGATE_KEY_PREFIX,
+        name=model._meta.model_name,
+    )
+
+
+def get_objects_keys(objects):
+    """
+    Build surrogate keys for given objects.
+
+    Arguments:
+        objects (iterable): Model objects.
+
+    Returns:
+        list: Unique surrogate keys in the same order than objects.
+    """
+    return list(dict.fromkeys([
+        build_surrogate_key(item, item.pk)
+        for item in objects
+    ]))
+
+
+def get_article_detail_keys(article):
+    """
+    Build surrogate keys for an article detail.
+
+    This includes the article and every related objects rendered with it. It is
+    intended to be used on an article with relations from
+    ``lotus.prefetches.prefetch_article_detail`` to not perform additional queries.
+
+    Arguments:
+        article (lotus.models.Article): Article object.
+
+    Returns:
+        list: Unique surrogate keys.
+    """
+    keys = get_objects_keys(
+        [article] +
+        list(article.get_categories()) +
+        list(article.authors.all()) +
+        list(article.tags.all()) +
+        list(getattr(article, "prefetched_related", [])) +
+        list(getattr(article, "prefetched_translations", [])) +
+        list(getattr(article, "prefetched_siblings", []))
+    )
+
+    # Album is not loaded from projections which do not need it
+    if "album_id" not in article.get_deferred_fields() and article.album_id:
+        keys.append(build_surrogate_key(
+            article._meta.get_field("album").related_model,
+            article.album_id,
+        ))
+
+    return keys
+
+
+def set_surrogate_headers(response, keys):
+    """
+    Set surrogate key headers on a response.
+
+    Each header from setting ``LOTUS_SURROGATE_KEY_HEADERS`` is filled with given keys
+    joined with the header separator. Nothing is set if there are no keys. Keys are
+    also stored in response attribute ``surrogate_keys`` for the page cache.
+
+    Arguments:
+        response (django.http.response.HttpResponse): Response to modify.
+        keys (list): Surrogate keys.
+
+    Returns:
+        django.http.response.HttpResponse: The given response.
+    """
+    response.surrogate_keys = list(keys)
+
+    if keys:
+        for name, separator in settings.LOTUS_SURROGATE_KEY_HEADERS.items():
+            response[name] = separator.join(keys)
+
+    return response
+
+
+class BasePurgeBackend:
+    """
+    Base purge backend, every backend must implement method ``purge``.
+    """
+    def purge(self, keys):
+        raise NotImplementedError()
+
+
+class LoggingPurgeBackend(BasePurgeBackend):
+    """
+    Purge backend which only logs purged keys, this is the default backend for
+    development and tests.
+    """
+    def purge(self, keys):
+        logger.info("Purge surrogate keys: %s", " ".join(keys))
+
+
+class HTTPPurgeBackend(BasePurgeBackend):
+    """
+    Purge backend which post purged keys as JSON to an URL.
+
+    This is a basic stand-in for a CDN purge API, a real CDN would commonly need a
+    specific backend to follow its API.
+
+    Arguments:
+        url (string): URL to post keys to.
+
+    Keyword Arguments:
+        headers (dict): Additional request headers, commonly used for authentication.
+        timeout (integer): Request timeout in seconds.
+    """
+    def __init__(self, url, headers=None, timeout=5):
+        self.url = url
+        self.headers = headers or {}
+        self.timeout = timeout
+
+    def purge(self, keys):
+        request = urllib.request.Request(
+            self.url,
+            data=json.dumps({"surrogate_keys": keys}).encode("utf-8"),
+            headers={"Content-Type": "application/json", **self.headers},
+            method="POST",
+        )
+
+        try:
+            with urllib.request.urlopen(request, timeout=self.timeout):
+                pass
+        except OSError as e:
+            # A failing purge should not break the editor save
+            logger.error("Unable to purge surrogate keys: %s", e)
+
+
+def get_purge_backend():
+    """
+    Return the purge backend from settings.
+
+    Returns:
+        BasePurgeBackend: Backend instance built with options from setting
+        ``LOTUS_PURGE_BACKEND_OPTIONS`` or ``None`` if there is no backend defined.
+    """
+    if not settings.LOTUS_PURGE_BACKEND:
+        return None
+
+    return import_string(settings.LOTUS_PURGE_BACKEND)(
+        **settings.LOTUS_PURGE_BACKEND_OPTIONS
+    )
+
+
+def get_key_versions(keys):
+    """
+    Return the current versions of surrogate keys.
+
+    A key without version yet gets a new one.
+
+    Arguments:
+        keys (list): Surrogate keys.
+
+    Returns:
+        dict: Versions indexed on surrogate keys.
+    """
+    names = {
+        "{}:{}".format(KEY_VERSION_CACHE_PREFIX, key): key
+        for key in keys
+    }
+
+    versions = cache.get_many(list(names))
+    missing = {
+        name: uuid.uuid4().hex
+        for name in names
+        if name not in versions
+    }
+    if missing:
+        cache.set_many(missing, None)
+        versions.update(missing)
+
+    return {names[name]: version for name, version in versions.items()}
+
+
+def rotate_key_versions(keys):
+    """
+    Change the versions of surrogate keys.
+
+    Arguments:
+        keys (list): Surrogate keys.
+    """
+    cache.set_many(
+        {
+            "{}:{}".format(KEY_VERSION_CACHE_PREFIX, key): uuid.uuid4().hex
+            for key in keys
+        },
+        None,
+    )
+
+
+def set_versioned(cache_key, value, keys, timeout):
+    """
+    Store a value in cache with the versions of the surrogate keys it depends on.
+
+    Arguments:
+        cache_key (string): Cache key.
+        value (object): Value to store.
+        keys (list): Surrogate keys of the objects the value has been built from.
+        timeout (integer): Time in seconds to keep the value.
+    """
+    cache.set(
+        cache_key,
+        {
+            "value": value,
+            "versions": get_key_versions(keys),
+        },
+        timeout,
+    )
+
+
+def get_versioned(cache_key):
+    """
+    Return a value stored with ``set_versioned``.
+
+    Arguments:
+        cache_key (string): Cache key.
+
+    Returns:
+        object: The stored value or ``None`` if there is none or if one of its
+        surrogate keys has been purged since it has been stored.
+    """
+    entry = cache.get(cache_key)
+    if entry is None:
+        return None
+
+    if get_key_versions(list(entry["versions"])) != entry["versions"]:
+        return None
+
+    return entry["value"]
+
+
+def invalidate_content(keys, backend=None):
+    """
+    Change the versions of given keys and purge them with the backend.
+
+    Arguments:
+        keys (list): Surrogate keys to purge.
+
+    Keyword Arguments:
+        backend (BasePurgeBackend): Purge backend, no purge is made if empty.
+    """
+    rotate_key_versions(keys)
+
+    if backend is not None:
+        backend.purge(keys)
+
+
+def purge_keys(keys):
+    """
+    Purge given surrogate keys and invalidate the cache entries depending on them
+    once the current transaction is committed.
+
+    Key versions are changed immediately also, so the current process never reuses
+    a cache built before the change.
+
+    Arguments:
+        keys (list): Surrogate keys to purge.
+    """
+    keys = list(dict.fromkeys(keys))
+
+    if keys:
+        rotate_key_versions(keys)
+        transaction.on_commit(
+            partial(invalidate_content, keys, backend=get_purge_backend())
+        )
+
+
+def auto_purge_surrogate_keys(listing=True):
+    """
+    Build a ``post_save`` or ``post_delete`` signal receiver to purge the object
+    surrogate key.
+
+    Keyword Arguments:
+        listing (boolean): If enabled the model listing key is purged also.
+
+    Returns:
+        function: The signal receiver.
+    """
+    def receiver(sender, instance, raw=False, **kwargs):
+        if raw:
+            return
+
+        keys = [build_surrogate_key(instance, instance.pk)]
+        if listing:
+            keys.append(build_listing_key(instance))
+
+        purge_keys(keys)
+
+    return receiver
+
+
+def purge_relations_surrogate_keys(sender, instance, action, model, pk_set,
+                                   **kwargs):
+    """
+    A ``m2m_changed`` signal receiver to purge the surrogate keys of both sides of a
+    changed relation.
+
+    Since a relation clear does not give the removed objects, the related model
+    listing key is purged instead.
+    """
+    if action not in ("post_add", "post_remove", "post_clear"):
+        return
+
+    keys = [build_surrogate_key(instance, instance.pk)]
+
+    if action == "post_clear":
+        keys.append(build_listing_key(model))
+    else:
+        keys.extend([build_surrogate_key(model, pk) for pk in pk_set or []])
+
+    purge_keys(keys)
@@ -1,7 +1,9 @@
 from django.conf import settings
+from django.core.cache import cache
 from django.template import Library, TemplateSyntaxError, loader
 
-from ..models import Album, Article, Category
+from ..models import Album, AlbumItem, Article, Category
+from ..prefetches import resolve_translation_siblings
 from ..utils.language import get_language_code
 
 register = Library()
@@ -92,6 +94,99 @@ def article_states(context, article, **kwargs):
     return " ".join(states)
 
 
+SIBLINGS_CACHE_VARNAME = "lotus_translation_siblings"
+"""
+Context variable name where tag ``prefetch_translation_siblings`` stores the resolved
+siblings.
+"""
+
+
+def _get_siblings_options(context, model, tag_name, kwargs):
+    """
+    Return the preview mode and the publication datetime to use to get siblings.
+
+    Raises:
+        TemplateSyntaxError: For an Article model without preview mode, if the
+        datetime is not given from tag argument ``now`` or from context variable
+        ``lotus_now``.
+
+    Returns:
+        tuple: Preview mode and datetime. Datetime is None for a Category model or
+        with preview mode.
+    """
+    preview = context.get(settings.LOTUS_PREVIEW_VARNAME, False)
+    if kwargs.get("preview", None) is not None:
+        preview = kwargs.get("preview")
+
+    if not issubclass(model, Article) or preview:
+        return preview, None
+
+    lotus_now = kwargs.get("now") or context.get("lotus_now")
+    if lotus_now is None:
+        raise TemplateSyntaxError(
+            (
+                "'{tag_name}' require either a context variable 'lotus_now' to be "
+                "set or a tag argument named 'now'."
+            ).format(tag_name=tag_name)
+        )
+
+    return preview, lotus_now
+
+
+@register.simple_tag(takes_context=True)
+def prefetch_translation_siblings(context, sources, **kwargs):
+    """
+    Resolve the translation siblings of many objects with a single query and store
+    them in the template context, then tags ``translation_siblings`` and
+    ``translation_siblings_html`` for these objects do not perform any query.
+
+    The tag must be used before the tags that need the siblings and at the same
+    template level (not inside a block like ``for`` which discards its context
+    changes once ended).
+
+    Exemple:
+        Commonly used with the object list of a page: ::
+
+            {% load lotus %}
+            {% prefetch_translation_siblings article_list %}
+            {% for article in article_list %}
+                {% translation_siblings_html article %}
+            {% endfor %}
+
+        This tag accepts the same ``now`` and ``preview`` arguments than
+        ``translation_siblings``. However ``translation_siblings`` won't use the
+        resolved siblings if it is given one of these arguments.
+
+    Arguments:
+        context (object): Either a ``django.template.Context`` or a dictionnary for
+            context variable for template where the tag is included.
+        sources (iterable): Article or Category objects, all from the same model.
+
+    Returns:
+        string: An empty string since the tag does not render anything.
+    """
+    sources = list(sources)
+    if not sources:
+        return ""
+
+    model = type(sources[0])
+    preview, lotus_now = _get_siblings_options(
+        context, model, "prefetch_translation_siblings", kwargs
+    )
+
+    cached = dict(context.get(SIBLINGS_CACHE_VARNAME, {}))
+    for pk, resolved in resolve_translation_siblings(
+        sources,
+        target_date=lotus_now,
+        preview=preview,
+    ).items():
+        cached[(model._meta.label_lower, pk)] = resolved
+
+    context[SIBLINGS_CACHE_VARNAME] = cached
+
+    return ""
+
+
 @register.simple_tag(takes_context=True)
 def translation_siblings(context, source, tag_name=None, **kwargs):
     """
@@ -137,17 +232,17 @@ def translation_siblings(context, source, tag_name=None, **kwargs):
 
     Returns:
         dict: A dictionnary with item ``source`` for the given source object and item
-        ``siblings`` for retrieved translation sibling objects.
+        ``siblings`` for the list of retrieved translation sibling objects. When the
+        source has been loaded with ``lotus.prefetches.prefetch_article_detail``, the
+        siblings are the prefetched list, already filtered. When the source has been
+        resolved from tag ``prefetch_translation_siblings`` the results come from the
+        context cache.
 
     """
     model = type(source)
 
     tag_name = tag_name or "translation_siblings"
 
-    preview = context.get(settings.LOTUS_PREVIEW_VARNAME, False)
-    if kwargs.get("preview", None) is not None:
-        preview = kwargs.get("preview")
-
     # If unsupported model has been given
     if not isinstance(source, Article) and not isinstance(source, Category):
         source_name = type(source).__name__
@@ -158,28 +253,37 @@ def translation_siblings(context, source, tag_name=None, **kwargs):
             ).format(tag_name=tag_name, source_name=source_name)
         )
 
-    # Get the base queryset for siblings
-    siblings = model.objects.get_siblings(source=source)
+    # Use the batch resolved siblings if any, except when the tag is given options
+    # that may differ from the ones used to resolve them
+    if kwargs.get("now") is None and kwargs.get("preview") is None:
+        cached = context.get(SIBLINGS_CACHE_VARNAME, {}).get(
+            (model._meta.label_lower, source.pk)
+        )
+        if cached is not None:
+            return cached
+
+    preview, lotus_now = _get_siblings_options(context, model, tag_name, kwargs)
+
+    # Use the siblings prefetched from a detail loader if any
+    if hasattr(source, "prefetched_siblings"):
+        siblings = source.prefetched_siblings
+    # Else get the base queryset for siblings
+    else:
+        siblings = model.objects.get_siblings(source=source)
 
     # Article model make additional filtering on publication criteria if not in admin
     # mode
-    if isinstance(source, Article) and not preview:
-        lotus_now = kwargs.get("now") or context.get("lotus_now")
-        if lotus_now is None:
-            raise TemplateSyntaxError(
-                (
-                    "'{tag_name}' require either a context variable 'lotus_now' to be "
-                    "set or a tag argument named 'now'."
-                ).format(tag_name=tag_name)
-            )
-
+    if isinstance(siblings, list):
+        pass
+    elif isinstance(source, Article) and not preview:
         siblings = siblings.get_published(target_date=lotus_now)
 
-    # Enforce order on language code
-    siblings = siblings.order_by("language")
+    # Enforce order on language code and evaluate queryset once for all
+    if not isinstance(siblings, list):
+        siblings = list(siblings.order_by("language"))
 
     # All available language names and codes
-    existing_languages = [item.language for item in [source] + list(siblings)]
+    existing_languages = [item.language for item in [source] + siblings]
     available_languages = [
         code
         for code, name in settings.LANGUAGES
@@ -383,6 +487,90 @@ def article_get_related(context, article, **kwargs):
     return article.get_related(filter_func=filter_func)
 
 
+@register.simple_tag(takes_context=True)
+def prefetch_article_related(context, articles):
+    """
+    Resolve the related articles of many articles, then tag ``article_get_related``
+    for these articles does not perform any query.
+
+    It uses the same optional filtering function from template context item
+    ``article_filter_func`` than ``article_get_related``.
+
+    Exemple:
+        Commonly used with the object list of a page: ::
+
+            {% load lotus %}
+            {% prefetch_article_related article_list %}
+            {% for article in article_list %}
+                {% article_get_related article as relateds %}
+            {% endfor %}
+
+    Arguments:
+        context (object): Either a ``django.template.Context`` or a dictionnary for
+            context variable for template where the tag is included.
+        articles (iterable): Article objects.
+
+    Returns:
+        string: An empty string since the tag does not render anything.
+    """
+    Article.objects.resolve_related(
+        articles,
+        filter_func=context.get("article_filter_func", None),
+    )
+
+    return ""
+
+
+@register.simple_tag(takes_context=True)
+def get_category_articles(context, category, descendants=False):
+    """
+    Returns the articles of a given category object.
+
+    Like ``article_get_related`` it rely on the optional filtering function from
+    template context item ``article_filter_func`` to apply publication lookups,
+    articles are always filtered on the category language.
+
+    Exemple:
+        You must give a Category object: ::
+
+            {% load lotus %}
+            {% get_category_articles mycategory [descendants=True] as articles %}
+
+    Arguments:
+        context (object): Either a ``django.template.Context`` or a dictionnary for
+            context variable for template where the tag is included.
+        category (lotus.models.category.Category): Category object to get articles
+            from.
+
+    Keyword Arguments:
+        descendants (boolean): If true, articles from category descendants are
+            included. Default is false.
+
+    Returns:
+        queryset: Queryset for retrieved articles in their common order.
+    """
+    if not isinstance(category, Category):
+        raise TemplateSyntaxError(
+            (
+                "'get_category_articles' tag only accepts a Category object as "
+                "'category' argument. Object type '{category_type}' was given."
+            ).format(category_type=type(category).__name__)
+        )
+
+    if descendants:
+        queryset = Article.objects.get_for_category_tree(category)
+    else:
+        queryset = category.articles.all()
+
+    filter_func = context.get("article_filter_func", None)
+    if filter_func:
+        queryset = filter_func(queryset, category.language)
+    else:
+        queryset = queryset.filter(language=category.language)
+
+    return queryset.order_by(*Article.COMMON_ORDER_BY)
+
+
 @register.simple_tag(takes_context=True)
 def get_categories(context, current=None):
     """
@@ -473,7 +661,7 @@ def get_categories_html(context, current=None, template=None):
 
 @register.simple_tag(takes_context=True)
 def get_category_tree_html(context, parent=None, current=None, branch=None,
-                           template=None):
+                           template=None, exclude_empty=False):
     """
     Build HTML of a category tree for current language.
 
@@ -495,16 +683,19 @@ def get_category_tree_html(context, parent=None, current=None, branch=None,
             "active": False,
             "depth": 1,
             "path": "0001",
+            "articles": {"direct": 0, "subtree": 0},
             "children": []
         }
 
     The ``children`` is in fact only present in payload if the node has children.
+    Article counters from ``articles`` include private articles for authenticated
+    users only.
 
     Exemple:
         This tag does not require any argument to work: ::
 
             {% load lotus %}
-            {% get_category_tree_html [parent=mycategory] [current=anothercategory] [branch=True] [template="foo/bar.html"] %}
+            {% get_category_tree_html [parent=mycategory] [current=anothercategory] [branch=True] [template="foo/bar.html"] [exclude_empty=True] %}
 
     Arguments:
         context (object): Either a ``django.template.Context`` or a dictionnary for
@@ -524,6 +715,8 @@ def get_category_tree_html(context, parent=None, current=None, branch=None,
             the same depth than the parent).
         template (string): A path for custom template to use. If not given a default
             one will be used from setting ``LOTUS_CATEGORY_TREE_TAG_TEMPLATE``.
+        exclude_empty (boolean): If true, categories without any published article
+            in their subtree are not listed.
 
     Returns:
         string: Rendered template tag fragment.
@@ -535,6 +728,7 @@ def get_category_tree_html(context, parent=None, current=None, branch=None,
     request = context.get("request", None)
     language = get_language_code(request=request)
     branch = branch if branch else False
+    user = getattr(request, "user", None)
 
     return loader.get_template(template_path).render({
         "nodes": Category.get_nested_tree(
@@ -542,6 +736,8 @@ def get_category_tree_html(context, parent=None, current=None, branch=None,
             parent=parent,
             current=current,
             branch=branch,
+            private=bool(user and user.is_authenticated),
+            exclude_empty=exclude_empty,
         ),
         "parent": parent,
         "current": current,
@@ -554,6 +750,9 @@ def get_album_html(context, album, template=None):
     """
     Render an Album object with a template.
 
+    Rendered HTML is cached for ``LOTUS_ALBUM_CACHE_TIMEOUT`` seconds, it will be
+    renewed as soon as the album or one of its items is modified.
+
     Exemple:
         This tag requires ``album`` argument to work: ::
 
@@ -583,6 +782,23 @@ def get_album_html(context, album, template=None):
     # Use given template if any else the default one from settings
     template_path = template or settings.LOTUS_ALBUM_TAG_TEMPLATE
 
-    return loader.get_template(template_path).render({
+    # Rendered album is cached on a key versioned from the album modification date
+    cache_key = None
+    if album and settings.LOTUS_ALBUM_CACHE_TIMEOUT:
+        cache_key = album.get_cache_key("html", template_path)
+        rendered = cache.get(cache_key)
+        if rendered is not None:
+            return rendered
+
+    # Items are only queried on cache miss
+    rendered = loader.get_template(template_path).render({
         "album_object": album,
+        "album_items": (
+            album.albumitems.order_by(*AlbumItem.COMMON_ORDER_BY) if album else []
+        ),
     })
+
+    if cache_key:
+        cache.set(cache_key, rendered, settings.LOTUS_ALBUM_CACHE_TIMEOUT)
+
+    return rendered
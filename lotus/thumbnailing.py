@@ -0,0 +1,186 @@
+"""
+Thumbnail pre-generation pipeline.
+
+Thumbnails are commonly created at render time from the template tag ``media_thumb``,
+so the first visitor after an upload pays for every resize. This module allows to
+generate them ahead from a queue of ``ThumbnailJob`` objects filled when an object is
+saved with new medias or from the backfill command and processed by the worker
+command.
+"""
+from concurrent.futures import ThreadPoolExecutor
+
+from django.apps import apps
+from django.conf import settings
+from django.db import connections
+from django.utils import timezone
+
+from smart_media.templatetags.smart_image import media_thumb
+
+from .choices import THUMBNAIL_JOB_DONE, THUMBNAIL_JOB_FAILED
+from .models.thumbnail import ThumbnailJob
+
+
+def get_thumbnail_sizes(model_label, field_name):
+    """
+    Return the thumbnail sizes defined for a model field.
+
+    Arguments:
+        model_label (string): Lowercase model label like ``lotus.article``.
+        field_name (string): Media field name.
+
+    Returns:
+        list: List of tuples ``(geometry, options)`` from setting
+        ``LOTUS_THUMBNAIL_SIZES``, empty if the field has no defined sizes.
+    """
+    return settings.LOTUS_THUMBNAIL_SIZES.get(model_label, {}).get(field_name, [])
+
+
+def generate_thumbnails(instance, field_name):
+    """
+    Generate every defined thumbnails for an object media field.
+
+    This uses the same function than the template tag ``media_thumb`` so generated
+    thumbnails are the ones that templates will retrieve from the thumbnail cache.
+
+    Arguments:
+        instance (django.db.models.Model): Object to generate thumbnails for.
+        field_name (string): Media field name.
+
+    Returns:
+        list: Thumbnail files, it may be empty if field is empty.
+    """
+    source = getattr(instance, field_name)
+    if not source:
+        return []
+
+    return [
+        media_thumb(source, geometry, **dict(options))
+        for geometry, options in get_thumbnail_sizes(
+            instance._meta.label_lower,
+            field_name
+        )
+    ]
+
+
+def process_job(job):
+    """
+    Process a thumbnail job and save its resulting status.
+
+    A job for an object that does not exist anymore is just marked as done.
+
+    Arguments:
+        job (lotus.models.ThumbnailJob): Job to process.
+
+    Returns:
+        lotus.models.ThumbnailJob: The processed job.
+    """
+    model = apps.get_model(job.model_label)
+
+    job.attempts += 1
+    job.processed = timezone.now()
+
+    try:
+        instance = model.objects.filter(pk=job.object_id).first()
+        if instance is not None:
+            generate_thumbnails(instance, job.field_name)
+    except Exception as e:
+        job.status = THUMBNAIL_JOB_FAILED
+        job.error = "{}: {}".format(type(e).__name__, e)
+    else:
+        job.status = THUMBNAIL_JOB_DONE
+        job.error = ""
+
+    job.save(update_fields=["status", "attempts", "processed", "error"])
+
+    return job
+
+
+def _threaded_process_job(job):
+    """
+    Process a job from a pool thread and close the thread database connections.
+    """
+    try:
+        return process_job(job)
+    finally:
+        connections.close_all()
+
+
+def process_jobs(jobs, workers=1):
+    """
+    Process given jobs, possibly in a thread pool.
+
+    Arguments:
+        jobs (list): Jobs to process.
+
+    Keyword Arguments:
+        workers (integer): Maximum number of concurrent threads. With ``1`` or less
+            the jobs are processed sequentially in the current thread.
+
+    Returns:
+        list: Processed jobs.
+    """
+    if workers <= 1:
+        return [process_job(job) for job in jobs]
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(_threaded_process_job, jobs))
+
+
+def auto_remember_thumbnail_sources(fields):
+    """
+    Build a ``pre_save`` signal receiver to remember the media files of an existing
+    object before it is saved.
+
+    This is used by the receiver from ``auto_enqueue_thumbnails`` to only enqueue the
+    changed media fields. It performs a query to get the saved values, nothing is done
+    if setting ``LOTUS_THUMBNAIL_PREGENERATION`` is disabled.
+
+    Arguments:
+        fields (list): Names of the media fields to watch.
+
+    Returns:
+        function: The signal receiver.
+    """
+    def receiver(sender, instance, raw=False, **kwargs):
+        if raw or not settings.LOTUS_THUMBNAIL_PREGENERATION or instance.pk is None:
+            return
+
+        instance._thumbnail_sources = sender._default_manager.filter(
+            pk=instance.pk
+        ).values(*fields).first() or {}
+
+    return receiver
+
+
+def auto_enqueue_thumbnails(fields):
+    """
+    Build a ``post_save`` signal receiver to enqueue thumbnail jobs.
+
+    For an existing object, only the fields which value changed from the ones
+    remembered by the receiver from ``auto_remember_thumbnail_sources`` are queued.
+    Nothing is enqueued if setting ``LOTUS_THUMBNAIL_PREGENERATION`` is disabled.
+
+    Arguments:
+        fields (list): Names of the media fields to queue.
+
+    Returns:
+        function: The signal receiver.
+    """
+    def receiver(sender, instance, created=False, raw=False, **kwargs):
+        sources = instance.__dict__.pop("_thumbnail_sources", None)
+
+        if raw or not settings.LOTUS_THUMBNAIL_PREGENERATION:
+            return
+
+        if not created and sources is not None:
+            fields_changed = [
+                name
+                for name in fields
+                if (getattr(instance, name).name or "") != (sources.get(name) or "")
+            ]
+        else:
+            fields_changed = fields
+
+        ThumbnailJob.objects.enqueue(instance, fields_changed)
+
+    return receiver
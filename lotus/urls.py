@@ -3,12 +3,17 @@ Application URLs
 """
 from django.urls import path
 
+from .feeds import (
+    ArticleAtomFeed, ArticleFeed, AuthorArticleAtomFeed, AuthorArticleFeed,
+    CategoryArticleAtomFeed, CategoryArticleFeed, TagArticleAtomFeed, TagArticleFeed,
+)
 from .views import (
     ArticleIndexView, ArticleDetailView,
     AuthorIndexView, AuthorDetailView,
     CategoryIndexView, CategoryDetailView,
     PreviewTogglerView, PreviewArticleDetailView,
-    TagIndexView, TagDetailView, TagAutocompleteView,
+    TagIndexView, TagDetailView,
+    lazy_view,
 )
 
 
@@ -17,6 +22,8 @@ app_name = "lotus"
 
 urlpatterns = [
     path("", ArticleIndexView.as_view(), name="article-index"),
+    path("feeds/rss/", ArticleFeed(), name="article-feed-rss"),
+    path("feeds/atom/", ArticleAtomFeed(), name="article-feed-atom"),
 
     path("authors/", AuthorIndexView.as_view(), name="author-index"),
     path(
@@ -24,14 +31,45 @@ urlpatterns = [
         AuthorDetailView.as_view(),
         name="author-detail"
     ),
+    path(
+        "authors/<slug:username>/feeds/rss/",
+        AuthorArticleFeed(),
+        name="author-feed-rss"
+    ),
+    path(
+        "authors/<slug:username>/feeds/atom/",
+        AuthorArticleAtomFeed(),
+        name="author-feed-atom"
+    ),
 
     path("categories/", CategoryIndexView.as_view(), name="category-index"),
-
     path(
         "categories/<slug:slug>/",
         CategoryDetailView.as_view(),
         name="category-detail"
     ),
+    path(
+        "categories/<slug:slug>/feeds/rss/",
+        CategoryArticleFeed(),
+        name="category-feed-rss"
+    ),
+    path(
+        "categories/<slug:slug>/feeds/atom/",
+        CategoryArticleAtomFeed(),
+        name="category-feed-atom"
+    ),
+
+    # Admin autocompletes are under their own prefix to not collide with slugs
+    path(
+        "autocomplete/articles/",
+        lazy_view("lotus.views.autocomplete.ArticleAutocompleteView"),
+        name="article-autocomplete",
+    ),
+    path(
+        "autocomplete/categories/",
+        lazy_view("lotus.views.autocomplete.CategoryAutocompleteView"),
+        name="category-autocomplete",
+    ),
 
     path(
         "preview/disable/",
@@ -52,7 +90,7 @@ urlpatterns = [
     path("tags/", TagIndexView.as_view(), name="tag-index"),
     path(
         "tags/autocomplete/",
-        TagAutocompleteView.as_view(),
+        lazy_view("lotus.views.autocomplete.TagAutocompleteView"),
         name="tag-autocomplete",
     ),
     path(
@@ -60,6 +98,16 @@ urlpatterns = [
         TagDetailView.as_view(),
         name="tag-detail"
     ),
+    path(
+        "tags/<str:tag>/feeds/rss/",
+        TagArticleFeed(),
+        name="tag-feed-rss"
+    ),
+    path(
+        "tags/<str:tag>/feeds/atom/",
+        TagArticleAtomFeed(),
+        name="tag-feed-atom"
+    ),
 
     path(
         "<int:year>/<int:month>/<int:day>/<slug:slug>/",
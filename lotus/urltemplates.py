@@ -0,0 +1,136 @@
+"""
+Fast building of translated URLs.
+
+Building a translated object URL with ``reverse()`` then ``translate_url()`` resolves
+the path and reverses it again for the target language. Objects listed in pages,
+sitemaps and API payloads all build their URL, so this module compiles a URL template
+once per URL name, argument names and language and then only formats it with object
+values.
+
+A template is compiled from a ``reverse()`` call with numeric placeholder values under
+the target language, so it respects the URLconf, the language prefix from
+``i18n_patterns`` and translated URL patterns. Templates are stored on the URL
+resolver so they follow URLconf reloads (like with ``clear_url_caches()`` or a
+``ROOT_URLCONF`` change), and on the script prefix.
+
+When a template can not be compiled (like with a converter that does not accept the
+placeholder values), URL is built with ``reverse()`` and ``translate_url()`` as usual.
+"""
+import weakref
+from urllib.parse import quote
+
+from django.urls import (
+    NoReverseMatch, get_resolver, get_script_prefix, get_urlconf, reverse,
+    translate_url,
+)
+from django.utils import translation
+from django.utils.http import RFC3986_SUBDELIMS
+
+
+PLACEHOLDER_START = 4300000000
+"""
+First value used as placeholder for an argument when compiling a template. It is an
+integer so it is accepted by the common path converters.
+"""
+
+_templates = weakref.WeakKeyDictionary()
+"""
+Compiled templates for each URL resolver.
+"""
+
+
+def compile_url_template(urlname, names, language):
+    """
+    Compile an URL template.
+
+    Arguments:
+        urlname (string): The URL name to reverse.
+        names (tuple): Names of URL keyword arguments.
+        language (string): Language code to reverse URL for.
+
+    Returns:
+        string: Template to format with URL keyword arguments or ``None`` if it could
+        not be compiled.
+    """
+    placeholders = {
+        name: PLACEHOLDER_START + index
+        for index, name in enumerate(names)
+    }
+
+    with translation.override(language):
+        try:
+            url = reverse(urlname, kwargs=placeholders)
+        except NoReverseMatch:
+            return None
+
+    template = url.replace("{", "{{").replace("}", "}}")
+    for name, value in placeholders.items():
+        # Each placeholder must be found once else the template would be ambiguous
+        if url.count(str(value)) != 1:
+            return None
+
+        template = template.replace(str(value), "{" + name + "}")
+
+    return template
+
+
+def get_url_template(urlname, names, language):
+    """
+    Return an URL template from cache or compile it.
+
+    Arguments:
+        urlname (string): The URL name to reverse.
+        names (tuple): Names of URL keyword arguments.
+        language (string): Language code to reverse URL for.
+
+    Returns:
+        string: Template to format with URL keyword arguments or ``None`` if it could
+        not be compiled.
+    """
+    templates = _templates.setdefault(get_resolver(get_urlconf()), {})
+    key = (urlname, names, language, get_script_prefix())
+
+    try:
+        return templates[key]
+    except KeyError:
+        template = templates[key] = compile_url_template(urlname, names, language)
+        return template
+
+
+def clear_url_templates():
+    """
+    Clear every compiled template.
+
+    This is not required on URLconf reloads since templates are stored on the URL
+    resolver.
+    """
+    _templates.clear()
+
+
+def build_translated_url(urlname, language, **kwargs):
+    """
+    Build an URL for the given language.
+
+    It returns the same URL than ``translate_url(reverse(urlname, kwargs=kwargs),
+    language)`` for valid arguments. Arguments are not validated against their path
+    converters.
+
+    Arguments:
+        urlname (string): The URL name to reverse.
+        language (string): Language code to build URL for.
+
+    Keyword Arguments:
+        **kwargs: URL keyword arguments.
+
+    Returns:
+        string: The URL.
+    """
+    template = get_url_template(urlname, tuple(sorted(kwargs)), language)
+
+    if template is None:
+        return translate_url(reverse(urlname, kwargs=kwargs), language)
+
+    return template.format(**{
+        name: quote(str(value), safe=RFC3986_SUBDELIMS + "/~:@")
+        for name, value in kwargs.items()
+    })
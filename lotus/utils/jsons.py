@@ -1,41 +1,138 @@
 import datetime
 import json
-from pathlib import Path
+from pathlib import PurePath
 
 from taggit.models import Tag
 
 from ..models import Album, Article, Author, Category
 
 
+JSON_TYPE_ENCODERS = {
+    bytes: lambda obj: obj.decode("utf-8"),
+    # Support for pathlib.Path to a string
+    PurePath: str,
+    # Support for set to a list
+    set: list,
+    frozenset: list,
+    datetime.datetime: lambda obj: obj.isoformat(),
+    datetime.date: lambda obj: obj.isoformat(),
+    datetime.time: lambda obj: obj.isoformat(),
+    Album: repr,
+    Article: repr,
+    Author: repr,
+    Category: repr,
+    Tag: repr,
+}
+"""
+Encoding functions indexed on the object type they support, used by
+``ExtendedJsonEncoder``. Subclasses are supported from their nearest parent type in
+this table.
+"""
+
+
+class TypeEncoderTable:
+    """
+    Dispatch objects to their encoding function from their type.
+
+    The function for a type is searched from the type MRO only once, the result is
+    then remembered for the type so encoding an object costs a single dictionnary
+    lookup instead of a chain of ``isinstance`` checks.
+
+    Arguments:
+        encoders (dict): Encoding functions indexed on the type they support.
+
+    Keyword Arguments:
+        fallback (function): Function called with objects which type is not
+            supported. Default is to raise a ``TypeError``.
+    """
+    def __init__(self, encoders, fallback=None):
+        self.encoders = dict(encoders)
+        self.fallback = fallback
+        self._resolved = {}
+
+    def get_encoder(self, klass):
+        """
+        Return the encoding function for a type.
+
+        Arguments:
+            klass (type): Object type.
+
+        Returns:
+            function: The encoding function or ``None`` if type is not supported.
+        """
+        try:
+            return self._resolved[klass]
+        except KeyError:
+            pass
+
+        encoder = next(
+            (
+                self.encoders[parent]
+                for parent in klass.__mro__
+                if parent in self.encoders
+            ),
+            None,
+        )
+        self._resolved[klass] = encoder
+
+        return encoder
+
+    def default(self, obj):
+        """
+        Encode an object which is not supported by JSON.
+
+        This can be given as the ``default`` argument of ``json.dumps`` or other JSON
+        libraries like ``orjson``.
+
+        Arguments:
+            obj (object): Object to encode.
+
+        Raises:
+            TypeError: When object type is not supported and there is no fallback.
+
+        Returns:
+            object: A value supported by JSON.
+        """
+        encoder = self.get_encoder(type(obj))
+        if encoder is not None:
+            return encoder(obj)
+
+        if self.fallback is not None:
+            return self.fallback(obj)
+
+        raise TypeError(
+            "Object of type {} is not JSON serializable".format(type(obj).__name__)
+        )
+
+
+EXTENDED_JSON_ENCODERS = TypeEncoderTable(JSON_TYPE_ENCODERS)
+"""
+Encoder table used by ``ExtendedJsonEncoder``.
+"""
+
+
+def extended_json_default(obj):
+    """
+    Encode an object like ``ExtendedJsonEncoder`` does, this is meant to be given
+    as the ``default`` argument of JSON libraries.
+    """
+    return EXTENDED_JSON_ENCODERS.default(obj)
+
+
 class ExtendedJsonEncoder(json.JSONEncoder):
     """
     Additional opiniated support for more basic object types.
 
+    Supported types are dispatched from ``JSON_TYPE_ENCODERS``.
+
     Usage sample: ::
 
         json.dumps(..., cls=ExtendedJsonEncoder)
     """
     def default(self, obj):
-        if isinstance(obj, bytes):
-            return obj.decode("utf-8")
-        # Support for pathlib.Path to a string
-        if isinstance(obj, Path):
-            return str(obj)
-        # Support for set to a list
-        if isinstance(obj, set):
-            return list(obj)
-        if isinstance(obj, (datetime.datetime, datetime.date, datetime.time)):
-            return obj.isoformat()
-        if isinstance(obj, Album):
-            return repr(obj)
-        if isinstance(obj, Article):
-            return repr(obj)
-        if isinstance(obj, Author):
-            return repr(obj)
-        if isinstance(obj, Category):
-            return repr(obj)
-        if isinstance(obj, Tag):
-            return repr(obj)
+        encoder = EXTENDED_JSON_ENCODERS.get_encoder(type(obj))
+        if encoder is not None:
+            return encoder(obj)
 
         # Let the base class default method raise the TypeError
         return json.JSONEncoder.default(self, obj)
@@ -1,4 +1,5 @@
 import hashlib
+from contextlib import contextmanager
 
 from django.contrib.sites.models import Site
 from django.template.response import TemplateResponse
@@ -315,3 +316,47 @@ def sum_file_object(fileobj):
     algorithm.update(content)
 
     return algorithm.hexdigest()
+
+
+@contextmanager
+def forbid_deferred_loading(model):
+    """
+    Context manager to make the loading of deferred fields fail for a model.
+
+    A deferred field accessed from an object is loaded with a query for this object
+    only, this helps to detect such accesses from lists that are a query per row.
+
+    Usage sample: ::
+
+        with forbid_deferred_loading(Article):
+            client.get(url)
+
+    Arguments:
+        model (django.db.models.Model): Model to watch.
+
+    Raises:
+        AssertionError: When a deferred field from a model object is loaded.
+    """
+    original = model.__dict__.get("refresh_from_db")
+    refresh_from_db = model.refresh_from_db
+
+    def forbidden_refresh(instance, using=None, fields=None, **kwargs):
+        if fields:
+            raise AssertionError(
+                "Deferred field(s) '{fields}' loaded from object {obj!r}".format(
+                    fields=", ".join(fields),
+                    obj=instance,
+                )
+            )
+
+        return refresh_from_db(instance, using=using, fields=fields, **kwargs)
+
+    model.refresh_from_db = forbidden_refresh
+
+    try:
+        yield
+    finally:
+        if original is None:
+            del model.refresh_from_db
+        else:
+            model.refresh_from_db = original
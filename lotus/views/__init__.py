@@ -1,20 +1,44 @@
-from .article import ArticleIndexView, ArticleDetailView, PreviewArticleDetailView
+from importlib import import_module
+
+from .article import (
+    ArticleIndexView, ArticleDetailView, PreviewArticleDetailView,
+)
 from .author import AuthorIndexView, AuthorDetailView
 from .category import CategoryIndexView, CategoryDetailView
+from .lazy import lazy_view
 from .preview import PreviewTogglerView
 from .tag import (
     DisabledTagIndexView, EnabledTagIndexView, TagIndexView, TagDetailView,
-    TagAutocompleteView,
 )
 
 
+LAZY_VIEWS = {
+    "ArticleAutocompleteView": ".autocomplete",
+    "CategoryAutocompleteView": ".autocomplete",
+    "TagAutocompleteView": ".autocomplete",
+}
+"""
+Views which are only imported when accessed since they depend on admin only
+libraries.
+"""
+
+
+def __getattr__(name):
+    if name in LAZY_VIEWS:
+        return getattr(import_module(LAZY_VIEWS[name], __name__), name)
+
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+
+
 __all__ = [
     "ArticleIndexView",
     "ArticleDetailView",
+    "ArticleAutocompleteView",
     "AuthorIndexView",
     "AuthorDetailView",
     "CategoryIndexView",
     "CategoryDetailView",
+    "CategoryAutocompleteView",
     "DisabledTagIndexView",
     "EnabledTagIndexView",
     "PreviewArticleDetailView",
@@ -22,4 +46,5 @@ __all__ = [
     "TagIndexView",
     "TagDetailView",
     "TagAutocompleteView",
+    "lazy_view",
 ]
@@ -5,7 +5,11 @@ from django.utils.translation import gettext_lazy as _
 from django.urls import reverse
 
 from ..models import Article
-from .mixins import ArticleFilterAbstractView, TemplateFromObjectMixin
+from ..prefetches import prefetch_article_detail
+from ..surrogates import get_article_detail_keys
+from .mixins import (
+    ArticleFilterAbstractView, PrefetchProfileMixin, TemplateFromObjectMixin,
+)
 
 try:
     from view_breadcrumbs import BaseBreadcrumbMixin
@@ -13,7 +17,8 @@ except ImportError:
     from .mixins import NoOperationBreadcrumMixin as BaseBreadcrumbMixin
 
 
-class ArticleIndexView(BaseBreadcrumbMixin, ArticleFilterAbstractView, ListView):
+class ArticleIndexView(BaseBreadcrumbMixin, PrefetchProfileMixin,
+                       ArticleFilterAbstractView, ListView):
     """
     Paginated list of articles.
     """
@@ -24,6 +29,7 @@ class ArticleIndexView(BaseBreadcrumbMixin, ArticleFilterAbstractView, ListView)
     crumb_title = settings.LOTUS_CRUMBS_TITLES["article-index"]
     crumb_urlname = "lotus:article-index"
     lotus_stage = "articles"
+    prefetch_profile = ["categories"]
 
     @property
     def crumbs(self):
@@ -32,9 +38,11 @@ class ArticleIndexView(BaseBreadcrumbMixin, ArticleFilterAbstractView, ListView)
         ]
 
     def get_queryset(self):
-        q = self.apply_article_lookups(self.model.objects, self.get_language_code())
+        language = self.get_language_code()
+        q = self.apply_article_lookups(self.model.objects, language)
+        q = self.apply_prefetch_profile(q, language)
 
-        return q.order_by(*self.model.COMMON_ORDER_BY)
+        return q.list_projection().order_by(*self.model.COMMON_ORDER_BY)
 
 
 class ArticleDetailView(BaseBreadcrumbMixin, ArticleFilterAbstractView,
@@ -74,15 +82,19 @@ class ArticleDetailView(BaseBreadcrumbMixin, ArticleFilterAbstractView,
         Preview mode is enabled from a flag in session and only for staff user. If it is
         disabled publication criterias are applied on lookups.
 
-        Also apply lookup against "preview" mode.
+        Also apply lookup against "preview" mode and load the possible album.
         """
         q = self.apply_article_lookups(self.model.objects, self.get_language_code())
 
-        return q
+        return q.with_album()
 
     def get_object(self, queryset=None):
         """
         Apply the right filters to get the article object.
+
+        Every relations used to render the detail are prefetched so the number of
+        queries does not depend from the number of categories, authors, tags,
+        related articles or translations.
         """
         # Use a custom queryset if provided
         if queryset is None:
@@ -104,8 +116,21 @@ class ArticleDetailView(BaseBreadcrumbMixin, ArticleFilterAbstractView,
             raise Http404(_("No %(verbose_name)s found matching the query") %
                           {'verbose_name': queryset.model._meta.verbose_name})
 
+        prefetch_article_detail(
+            [obj],
+            filter_func=self.apply_article_lookups,
+            target_date=self.target_date,
+            preview=self.allowed_preview_mode(self.request),
+        )
+
         return obj
 
+    def get_surrogate_keys(self, context):
+        """
+        Include the keys of every related objects rendered with the article.
+        """
+        return get_article_detail_keys(self.object)
+
 
 class PreviewArticleDetailView(ArticleDetailView):
     """
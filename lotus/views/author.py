@@ -8,7 +8,9 @@ from .mixins import (
     ArticleFilterAbstractView,
     LanguageMixin,
     LotusContextStage,
+    PrefetchProfileMixin,
     PreviewModeMixin,
+    SurrogateKeyMixin,
 )
 
 try:
@@ -17,8 +19,8 @@ except ImportError:
     from .mixins import NoOperationBreadcrumMixin as BaseBreadcrumbMixin
 
 
-class AuthorIndexView(BaseBreadcrumbMixin, LotusContextStage, PreviewModeMixin,
-                      LanguageMixin, ListView):
+class AuthorIndexView(BaseBreadcrumbMixin, SurrogateKeyMixin, LotusContextStage,
+                      PreviewModeMixin, LanguageMixin, ListView):
     """
     List of authors which have contributed at least to one article.
     """
@@ -45,8 +47,8 @@ class AuthorIndexView(BaseBreadcrumbMixin, LotusContextStage, PreviewModeMixin,
         return q.order_by(*self.model.COMMON_ORDER_BY)
 
 
-class AuthorDetailView(BaseBreadcrumbMixin, ArticleFilterAbstractView,
-                       SingleObjectMixin, ListView):
+class AuthorDetailView(BaseBreadcrumbMixin, PrefetchProfileMixin,
+                       ArticleFilterAbstractView, SingleObjectMixin, ListView):
     """
     Author detail and its related article list.
 
@@ -64,6 +66,7 @@ class AuthorDetailView(BaseBreadcrumbMixin, ArticleFilterAbstractView,
     crumb_title = None  # No usage since title depends from object
     crumb_urlname = "lotus:author-detail"
     lotus_stage = "authors"
+    prefetch_profile = ["categories"]
 
     @property
     def crumbs(self):
@@ -90,12 +93,11 @@ class AuthorDetailView(BaseBreadcrumbMixin, ArticleFilterAbstractView,
 
         Depend on "self.object" to list the Author related objects.
         """
-        q = self.apply_article_lookups(
-            self.object.articles,
-            self.get_language_code(),
-        )
+        language = self.get_language_code()
+        q = self.apply_article_lookups(self.object.articles, language)
+        q = self.apply_prefetch_profile(q, language)
 
-        return q.order_by(*self.listed_model.COMMON_ORDER_BY)
+        return q.list_projection().order_by(*self.listed_model.COMMON_ORDER_BY)
 
     def get(self, request, *args, **kwargs):
         # Try to get Author object
@@ -0,0 +1,102 @@
+"""
+Autocomplete views used by admin forms.
+
+They depend on ``dal`` and the admin forms, so this module is not imported with the
+other views. It is only loaded on the first autocomplete request (see
+``lotus.views.lazy.lazy_view``) or when one of its views is accessed from package
+``lotus.views``.
+"""
+from django.contrib.auth.mixins import UserPassesTestMixin
+from django.http import HttpResponseBadRequest
+
+from dal import autocomplete
+from taggit.models import Tag
+
+from ..forms import ArticleAdminForm
+from ..models import Article
+from .mixins import TranslatedAutocompleteMixin
+
+
+class ArticleAutocompleteView(TranslatedAutocompleteMixin, UserPassesTestMixin,
+                              autocomplete.Select2QuerySetView):
+    """
+    View to return JSON response for an article list.
+
+    Default returns paginated list of all available articles. If request argument
+    ``q`` is given, the list will return article items with a title that start with
+    text from argument.
+
+    If a relation name ``original`` or ``related`` is forwarded, articles are limited
+    with the same constraints than ``ArticleAdminForm`` applies on this field for the
+    possible forwarded article.
+    """
+    def get_queryset(self):
+        relation = self.forwarded.get("relation")
+
+        if relation in ("original", "related"):
+            qs = ArticleAdminForm.relation_querysets(
+                self.get_forwarded_article()
+            )[relation]
+        else:
+            qs = Article.objects.all()
+
+        if self.q:
+            qs = qs.filter(title__istartswith=self.q)
+
+        return qs.only("id", "title", "language")
+
+
+class CategoryAutocompleteView(TranslatedAutocompleteMixin, UserPassesTestMixin,
+                               autocomplete.Select2QuerySetView):
+    """
+    View to return JSON response for a category list.
+
+    Default returns paginated list of all available categories. If request argument
+    ``q`` is given, the list will return category items with a title that start with
+    text from argument.
+
+    If an article is forwarded, categories are limited with the same constraints than
+    ``ArticleAdminForm`` applies on its ``categories`` field.
+    """
+    def get_queryset(self):
+        qs = ArticleAdminForm.relation_querysets(
+            self.get_forwarded_article()
+        )["categories"]
+
+        if self.q:
+            qs = qs.filter(title__istartswith=self.q)
+
+        return qs.only("id", "title", "language")
+
+
+class TagAutocompleteView(UserPassesTestMixin, autocomplete.Select2QuerySetView):
+    """
+    View to return JSON response for a tag list.
+
+    Default returns paginated list of all available tags. If request argument ``q`` is
+    given, the list will return tag items that start with text from argument.
+
+    Worth to notice this is language agnostic, since a Tag does not have any specific
+    language.
+    """
+    replica_reads = False
+
+    def test_func(self):
+        """
+        Limit to admin only
+        """
+        return self.request.user.is_staff
+
+    def get_queryset(self):
+        qs = Tag.objects.all()
+
+        if self.q:
+            qs = qs.filter(name__istartswith=self.q)
+
+        return qs.order_by("name")
+
+    def post(self, request, *args, **kwargs):
+        """
+        POST request is forbidden since DAL would create a tag for a missing value.
+        """
+        return HttpResponseBadRequest()
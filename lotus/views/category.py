@@ -9,7 +9,9 @@ from .mixins import (
     ArticleFilterAbstractView,
     LanguageMixin,
     LotusContextStage,
+    PrefetchProfileMixin,
     PreviewModeMixin,
+    SurrogateKeyMixin,
     TemplateFromObjectMixin,
 )
 
@@ -19,8 +21,8 @@ except ImportError:
     from .mixins import NoOperationBreadcrumMixin as BaseBreadcrumbMixin
 
 
-class CategoryIndexView(BaseBreadcrumbMixin, LotusContextStage, PreviewModeMixin,
-                        LanguageMixin, ListView):
+class CategoryIndexView(BaseBreadcrumbMixin, SurrogateKeyMixin, LotusContextStage,
+                        PreviewModeMixin, LanguageMixin, ListView):
     """
     List of categories
     """
@@ -47,10 +49,15 @@ class CategoryIndexView(BaseBreadcrumbMixin, LotusContextStage, PreviewModeMixin
         return q.order_by(*self.model.COMMON_ORDER_BY)
 
 
-class CategoryDetailView(BaseBreadcrumbMixin, ArticleFilterAbstractView,
-                         TemplateFromObjectMixin, SingleObjectMixin, ListView):
+class CategoryDetailView(BaseBreadcrumbMixin, PrefetchProfileMixin,
+                         ArticleFilterAbstractView, TemplateFromObjectMixin,
+                         SingleObjectMixin, ListView):
     """
     Category detail and its related article list.
+
+    When attribute ``include_descendants`` is true, articles from the category
+    descendants are listed also. Its default value comes from setting
+    ``LOTUS_CATEGORY_INCLUDE_DESCENDANTS`` and it can be given to ``as_view()``.
     """
     model = Category
     listed_model = Article
@@ -62,6 +69,8 @@ class CategoryDetailView(BaseBreadcrumbMixin, ArticleFilterAbstractView,
     crumb_title = None  # No usage since title depends from object
     crumb_urlname = "lotus:category-detail"
     lotus_stage = "categories"
+    prefetch_profile = ["categories"]
+    include_descendants = settings.LOTUS_CATEGORY_INCLUDE_DESCENDANTS
 
     @property
     def crumbs(self):
@@ -103,12 +112,15 @@ class CategoryDetailView(BaseBreadcrumbMixin, ArticleFilterAbstractView,
         Depend on "self.object" to list the Category related objects filtered on its
         language.
         """
-        q = self.apply_article_lookups(
-            self.object.articles,
-            self.object.language,
-        )
+        if self.include_descendants:
+            articles = self.listed_model.objects.get_for_category_tree(self.object)
+        else:
+            articles = self.object.articles
+
+        q = self.apply_article_lookups(articles, self.object.language)
+        q = self.apply_prefetch_profile(q, self.object.language)
 
-        return q.order_by(*self.listed_model.COMMON_ORDER_BY)
+        return q.list_projection().order_by(*self.listed_model.COMMON_ORDER_BY)
 
     def get(self, request, *args, **kwargs):
         # Try to get Category object
@@ -0,0 +1,35 @@
+from django.utils.module_loading import import_string
+
+
+def lazy_view(dotted_path, **initkwargs):
+    """
+    Return a view function which imports its class based view only on its first
+    call.
+
+    This allows to declare URLs for views with heavy dependencies (like the admin
+    autocomplete views) without importing them when URLs are loaded.
+
+    Arguments:
+        dotted_path (string): Python path to the class based view.
+
+    Keyword Arguments:
+        **initkwargs: Arguments given to the view ``as_view()`` method.
+
+    Returns:
+        function: View function. Its attribute ``lazy_path`` is the given Python path
+        so the view class can be resolved without calling the view.
+    """
+    resolved = []
+
+    def view(request, *args, **kwargs):
+        if not resolved:
+            resolved.append(import_string(dotted_path).as_view(**initkwargs))
+
+        return resolved[0](request, *args, **kwargs)
+
+    view.__name__ = dotted_path.rsplit(".", 1)[-1]
+    view.__qualname__ = view.__name__
+    view.__module__ = dotted_path.rsplit(".", 1)[0]
+    view.lazy_path = dotted_path
+
+    return view
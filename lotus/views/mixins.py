@@ -1,9 +1,13 @@
 from django.conf import settings
+from django.http import HttpResponseBadRequest
 from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
+from django.views.generic.list import MultipleObjectMixin
 
 from ..exceptions import Http500
 from ..lookups import LookupBuilder
+from ..prefetches import get_list_prefetches
+from ..surrogates import build_listing_key, get_objects_keys, set_surrogate_headers
 from ..utils.language import get_language_code
 
 
@@ -208,8 +212,86 @@ class LotusContextStage:
         return context
 
 
-class ArticleFilterAbstractView(LotusContextStage, ArticleFilterMixin,
-                                PreviewModeMixin, LanguageMixin):
+class SurrogateKeyMixin:
+    """
+    A mixin to add surrogate key headers on response for the objects from context.
+
+    The keys are built from the context ``object`` and ``object_list`` items. List
+    views also include the listing key of their listed model.
+    """
+    def get_surrogate_keys(self, context):
+        """
+        Return surrogate keys for given context.
+
+        Arguments:
+            context (dict): The context used to render response.
+
+        Returns:
+            list: Surrogate keys.
+        """
+        keys = []
+
+        if isinstance(self, MultipleObjectMixin):
+            keys.append(build_listing_key(getattr(self, "listed_model", self.model)))
+
+        if context.get("object") is not None:
+            keys.extend(get_objects_keys([context["object"]]))
+
+        # This evaluates the page queryset which is then reused from template
+        keys.extend(get_objects_keys(context.get("object_list") or []))
+
+        return list(dict.fromkeys(keys))
+
+    def render_to_response(self, context, **response_kwargs):
+        response = super().render_to_response(context, **response_kwargs)
+
+        return set_surrogate_headers(response, self.get_surrogate_keys(context))
+
+
+class PrefetchProfileMixin:
+    """
+    A mixin for article list views to prefetch the relations rendered for each
+    article.
+
+    Attributes:
+        prefetch_profile (list): Names of article relations used by the list
+            template, see ``lotus.prefetches.get_list_prefetches`` for available
+            names. A view with a custom template rendering more relations should
+            extend it, it can also be given to ``as_view()``.
+    """
+    prefetch_profile = []
+
+    def get_prefetch_profile(self):
+        """
+        Return the names of relations to prefetch.
+
+        Returns:
+            list: Relation names.
+        """
+        return self.prefetch_profile
+
+    def apply_prefetch_profile(self, queryset, language=None):
+        """
+        Add the prefetches from profile to an article queryset.
+
+        Arguments:
+            queryset (django.db.models.QuerySet): Article queryset.
+
+        Keyword Arguments:
+            language (string): Language code of listed articles.
+
+        Returns:
+            django.db.models.QuerySet: Queryset with prefetches.
+        """
+        prefetches = get_list_prefetches(self.get_prefetch_profile(), language=language)
+        if not prefetches:
+            return queryset
+
+        return queryset.prefetch_related(*prefetches)
+
+
+class ArticleFilterAbstractView(SurrogateKeyMixin, LotusContextStage,
+                                ArticleFilterMixin, PreviewModeMixin, LanguageMixin):
     """
     Abstract class which gather all the classes needed to implement filtering on
     criterias.
@@ -247,3 +329,49 @@ class TemplateFromObjectMixin:
             )
 
         return [self.object.template]
+
+
+class TranslatedAutocompleteMixin:
+    """
+    A mixin for autocomplete views on translated models used by
+    ``ArticleAdminForm`` relations.
+
+    It limits access to staff users, forbids object creation and labels results like
+    ``TranslatedModelChoiceField`` does. Since they feed admin forms, they always
+    read from the default database.
+    """
+    replica_reads = False
+
+    def test_func(self):
+        """
+        Limit to admin only
+        """
+        return self.request.user.is_staff
+
+    def get_forwarded_article(self):
+        """
+        Return the edited article from forwarded ``article`` value if any.
+
+        Returns:
+            lotus.models.Article: Found article object or None.
+        """
+        from ..models import Article
+
+        pk = self.forwarded.get("article")
+        if not pk or not str(pk).isdigit():
+            return None
+
+        return Article.objects.filter(pk=pk).first()
+
+    def get_result_label(self, result):
+        return "{title} [{lang}]".format(
+            title=str(result),
+            lang=result.get_language_display(),
+        )
+
+    def post(self, request, *args, **kwargs):
+        """
+        POST request is forbidden since DAL would create an object for a missing
+        value.
+        """
+        return HttpResponseBadRequest()
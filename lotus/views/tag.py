@@ -1,17 +1,15 @@
 from django.conf import settings
-from django.contrib.auth.mixins import UserPassesTestMixin
 from django.db.models import Count, Q
-from django.http import Http404, HttpResponseBadRequest
+from django.http import Http404
 from django.views.generic import ListView
 from django.views.generic.detail import SingleObjectMixin
 from django.urls import reverse
 from django.views import View
 
-from dal import autocomplete
 from taggit.models import Tag
 
 from ..models import Article
-from .mixins import ArticleFilterAbstractView
+from .mixins import ArticleFilterAbstractView, PrefetchProfileMixin
 
 try:
     from view_breadcrumbs import BaseBreadcrumbMixin
@@ -64,8 +62,8 @@ class EnabledTagIndexView(BaseBreadcrumbMixin, ArticleFilterAbstractView, ListVi
         ).filter(article_count__gt=0).order_by("name")
 
 
-class TagDetailView(BaseBreadcrumbMixin, ArticleFilterAbstractView,
-                    SingleObjectMixin, ListView):
+class TagDetailView(BaseBreadcrumbMixin, PrefetchProfileMixin,
+                    ArticleFilterAbstractView, SingleObjectMixin, ListView):
     """
     Tag detail and its related article list.
 
@@ -83,6 +81,7 @@ class TagDetailView(BaseBreadcrumbMixin, ArticleFilterAbstractView,
     crumb_title = None  # No usage since title depends from object
     crumb_urlname = "lotus:tag-detail"
     lotus_stage = "tags"
+    prefetch_profile = ["categories"]
 
     @property
     def crumbs(self):
@@ -113,14 +112,16 @@ class TagDetailView(BaseBreadcrumbMixin, ArticleFilterAbstractView,
 
         Depend on "self.object" to list the Tag related objects.
         """
+        language = self.get_language_code()
         q = self.apply_article_lookups(
             self.listed_model.objects.filter(
                 tags__id__in=[self.object.id]
             ),
-            self.get_language_code(),
+            language,
         )
+        q = self.apply_prefetch_profile(q, language)
 
-        return q.order_by(*self.listed_model.COMMON_ORDER_BY)
+        return q.list_projection().order_by(*self.listed_model.COMMON_ORDER_BY)
 
     def get(self, request, *args, **kwargs):
         # Try to get Tag object
@@ -130,43 +131,16 @@ class TagDetailView(BaseBreadcrumbMixin, ArticleFilterAbstractView,
         return super().get(request, *args, **kwargs)
 
 
-class TagAutocompleteView(UserPassesTestMixin, autocomplete.Select2QuerySetView):
+class TagIndexView(EnabledTagIndexView):
     """
-    View to return JSON response for a tag list.
+    This is the effective index class view, it behaves like ``EnabledTagIndexView``
+    if Tag index is enabled from settings or like ``DisabledTagIndexView`` else.
 
-    Default returns paginated list of all available tags. If request argument ``q`` is
-    given, the list will return tag items that start with text from argument.
-
-    Worth to notice this is language agnostic, since a Tag does not have any specific
-    language.
+    Setting is read on each request instead of choosing a parent class at import
+    time.
     """
-    def test_func(self):
-        """
-        Limit to admin only
-        """
-        return self.request.user.is_staff
-
-    def get_queryset(self):
-        qs = Tag.objects.all()
-
-        if self.q:
-            qs = qs.filter(name__istartswith=self.q)
-
-        return qs.order_by("name")
+    def get(self, request, *args, **kwargs):
+        if not settings.LOTUS_ENABLE_TAG_INDEX_VIEW:
+            return DisabledTagIndexView().get(request, *args, **kwargs)
 
-    def post(self, request, *args, **kwargs):
-        """
-        POST request is forbidden since DAL would create a tag for a missing value.
-        """
-        return HttpResponseBadRequest()
-
-
-TagIndexView = type("TagIndexView", (
-    (EnabledTagIndexView,)
-    if settings.LOTUS_ENABLE_TAG_INDEX_VIEW
-    else (DisabledTagIndexView,)
-), {})
-"""
-This is the effective index class view which inherit either from the working index view
-or the dummy 404 view if Tag index is enabled or not according to settings.
-"""
+        return super().get(request, *args, **kwargs)
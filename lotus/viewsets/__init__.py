@@ -1,10 +1,12 @@
 from .article import ArticleViewSet
 from .author import AuthorViewSet
 from .category import CategoryViewSet
+from .changes import ChangeFeedViewSet
 
 
 __all__ = [
     "ArticleViewSet",
     "AuthorViewSet",
     "CategoryViewSet",
+    "ChangeFeedViewSet",
 ]
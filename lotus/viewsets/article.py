@@ -1,30 +1,57 @@
 from django.conf import settings
+from django.db.models import Prefetch
 
 from rest_framework import viewsets
 
-from ..models import Article
+from ..models import Article, Author, Category
+from ..prefetches import prefetch_article_detail
 from ..serializers import ArticleSerializer, ArticleResumeSerializer
+from ..surrogates import get_article_detail_keys
 
-from .mixins import ArticleFilterAbstractViewset, MultiSerializerViewSetMixin
+from .mixins import (
+    ArticleFilterAbstractViewset, MultiSerializerViewSetMixin, PayloadCacheViewSetMixin,
+)
 
 
-class ArticleViewSet(MultiSerializerViewSetMixin, ArticleFilterAbstractViewset,
-                     viewsets.ReadOnlyModelViewSet):
+class ArticleViewSet(PayloadCacheViewSetMixin, MultiSerializerViewSetMixin,
+                     ArticleFilterAbstractViewset, viewsets.ReadOnlyModelViewSet):
     """
     Entrypoint for Article listing and detail.
+
+    Detail payload is cached except for the publication states.
     """
     model = Article
     serializer_class = ArticleResumeSerializer
     serializer_action_classes = {
         "retrieve": ArticleSerializer,
     }
+    projection_required = [
+        "id", "language", "original", "translation_group", "last_update",
+    ]
+    projection_dependencies = {
+        "detail_url": ["publish_date", "slug"],
+        "publish_datetime": ["publish_date", "publish_time"],
+        "states": [
+            "featured", "pinned", "private", "publish_date", "publish_end",
+            "publish_time", "status",
+        ],
+    }
+    detail_relations = ["authors", "categories", "related", "tags", "translations"]
+    """
+    Serializer fields which need ``prefetch_article_detail``.
+    """
+    payload_version_field = "last_update"
+    dynamic_fields = ["states"]
 
     def get_queryset(self):
         """
         Get the base queryset which may include the basic publication filter
         depending preview mode.
 
-        Also apply lookup for "private" mode for non authenticated users.
+        Also apply lookup for "private" mode for non authenticated users, load the
+        possible album with its items and the list relations when they are serialized
+        and only load the model fields for requested fields. Without requested fields,
+        lists use the article list projection.
         """
         q = self.model.objects.all()
 
@@ -36,4 +63,66 @@ class ArticleViewSet(MultiSerializerViewSetMixin, ArticleFilterAbstractViewset,
         else:
             q = self.apply_article_lookups(q)
 
-        return q.order_by(*self.model.COMMON_ORDER_BY)
+        fields = self.get_serialized_fields()
+
+        if "album" in fields:
+            q = q.with_album()
+
+        if self.action != "retrieve":
+            if "authors" in fields:
+                q = q.prefetch_related(Prefetch(
+                    "authors",
+                    queryset=Author.objects.order_by(*Author.COMMON_ORDER_BY),
+                ))
+            if "categories" in fields:
+                q = q.prefetch_related(Prefetch(
+                    "categories",
+                    queryset=Category.objects.order_by(*Category.COMMON_ORDER_BY),
+                ))
+            if "tags" in fields:
+                q = q.prefetch_related("tags")
+
+            if self.get_projected_fields() is None:
+                q = q.list_projection()
+
+        return self.apply_projection(q).order_by(*self.model.COMMON_ORDER_BY)
+
+    def paginate_queryset(self, queryset):
+        """
+        Resolve the related articles of listed articles when they are serialized, so
+        the list does not perform a query for each article.
+        """
+        page = super().paginate_queryset(queryset)
+
+        if "related" in self.get_serialized_fields():
+            self.model.objects.resolve_related(
+                queryset if page is None else page,
+                filter_func=self.apply_article_lookups,
+            )
+
+        return page
+
+    def prepare_retrieve(self, instance):
+        """
+        Prefetch every relations used by serializer for the article detail.
+        """
+        if set(self.detail_relations).intersection(self.get_serialized_fields()):
+            prefetch_article_detail(
+                [instance],
+                filter_func=self.apply_article_lookups,
+                target_date=self.target_date,
+            )
+
+    def get_surrogate_keys(self):
+        """
+        Include the keys of every related objects serialized with the article
+        detail when they have been prefetched.
+        """
+        if (
+            self.action == "retrieve" and
+            self.surrogate_objects and
+            hasattr(self.surrogate_objects[0], "prefetched_related")
+        ):
+            return get_article_detail_keys(self.surrogate_objects[0])
+
+        return super().get_surrogate_keys()
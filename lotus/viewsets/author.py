@@ -17,6 +17,10 @@ class AuthorViewSet(MultiSerializerViewSetMixin, ArticleFilterAbstractViewset,
     serializer_action_classes = {
         "retrieve": AuthorSerializer,
     }
+    projection_required = ["id", "first_name", "last_name"]
+    projection_dependencies = {
+        "detail_url": ["username"],
+    }
 
     def get_queryset(self):
         q = self.model.lotus_objects.get_active(
@@ -24,4 +28,4 @@ class AuthorViewSet(MultiSerializerViewSetMixin, ArticleFilterAbstractViewset,
             private=None if self.request.user.is_authenticated else False,
         )
 
-        return q.order_by(*self.model.COMMON_ORDER_BY)
+        return self.apply_projection(q).order_by(*self.model.COMMON_ORDER_BY)
@@ -2,16 +2,24 @@ from django.conf import settings
 
 from rest_framework import viewsets
 
-from ..models import Category
+from ..counters import COUNTER_FIELDS
+from ..models import Article, Category
 from ..serializers import CategorySerializer, CategoryResumeSerializer
+from ..surrogates import build_listing_key
 
-from .mixins import ArticleFilterAbstractViewset, MultiSerializerViewSetMixin
+from .mixins import (
+    ArticleFilterAbstractViewset, MultiSerializerViewSetMixin, PayloadCacheViewSetMixin,
+)
 
 
-class CategoryViewSet(MultiSerializerViewSetMixin, ArticleFilterAbstractViewset,
-                      viewsets.ReadOnlyModelViewSet):
+class CategoryViewSet(PayloadCacheViewSetMixin, MultiSerializerViewSetMixin,
+                      ArticleFilterAbstractViewset, viewsets.ReadOnlyModelViewSet):
     """
     Entrypoint for Category listing and detail.
+
+    Detail payload is cached. Query parameter ``descendants`` (``true`` or ``false``)
+    enables or disables articles from category descendants in detail, default
+    value comes from setting ``LOTUS_CATEGORY_INCLUDE_DESCENDANTS``.
     """
 
     model = Category
@@ -19,6 +27,44 @@ class CategoryViewSet(MultiSerializerViewSetMixin, ArticleFilterAbstractViewset,
     serializer_action_classes = {
         "retrieve": CategorySerializer,
     }
+    projection_required = [
+        "id", "language", "path", "depth", "numchild", "modified",
+    ]
+    projection_dependencies = {
+        "detail_url": ["slug"],
+        "article_counts": COUNTER_FIELDS + ["counts_expire"],
+    }
+    payload_version_field = "modified"
+
+    def get_include_descendants(self):
+        """
+        Return if articles from category descendants are included.
+        """
+        value = self.request.query_params.get("descendants")
+        if not value:
+            return settings.LOTUS_CATEGORY_INCLUDE_DESCENDANTS
+
+        return value.lower() in ("1", "true", "yes")
+
+    def get_payload_variants(self):
+        return [self.get_include_descendants()]
+
+    def get_surrogate_keys(self):
+        """
+        Include the article listing key in detail since it includes the category
+        articles.
+        """
+        keys = super().get_surrogate_keys()
+
+        if self.action == "retrieve":
+            keys.append(build_listing_key(Article))
+
+        return keys
+
+    def get_serializer_context(self):
+        context = super().get_serializer_context()
+        context["include_descendants"] = self.get_include_descendants()
+        return context
 
     def get_queryset(self):
         """
@@ -32,4 +78,4 @@ class CategoryViewSet(MultiSerializerViewSetMixin, ArticleFilterAbstractViewset,
         ):
             q = q.get_for_lang(self.get_language_code())
 
-        return q.order_by(*self.model.COMMON_ORDER_BY)
+        return self.apply_projection(q).order_by(*self.model.COMMON_ORDER_BY)
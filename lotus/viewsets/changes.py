@@ -0,0 +1,260 @@
+import datetime
+
+from django.conf import settings
+from django.db import models
+from django.http import StreamingHttpResponse
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+from django.utils.translation import gettext_lazy as _
+
+from rest_framework import viewsets
+from rest_framework.exceptions import ValidationError
+
+from ..models import Article, Category, DeletionLog
+from ..renderers import json_dumps
+from ..serializers import ArticleMinimalSerializer, CategoryMinimalSerializer
+from .mixins import FastJSONViewSetMixin
+
+
+class ChangeFeedViewSet(FastJSONViewSetMixin, viewsets.ViewSet):
+    """
+    Entrypoint for the incremental change feed of articles and categories.
+
+    Response is streamed in NDJSON format, each line is an event for an object
+    changed after the watermark given in query parameter ``since``:
+
+    update
+        Article or category has been edited or its publication started, the event
+        includes its minimal payload.
+    remove
+        Article has been edited or its publication ended and it is not available
+        anymore. It is only emitted for articles which publication period included
+        ``since`` so articles never exposed before are not reported.
+    delete
+        Article or category has been deleted.
+
+    Private articles are never reported to anonymous users, not even their removal or
+    deletion.
+
+    The last line is the watermark event with the date to use as ``since`` for the
+    next request. Watermark is ``LOTUS_CHANGEFEED_SAFETY_MARGIN`` seconds before the
+    request date so objects from write transactions still running at this moment are
+    not missed by the next request. Without ``since`` the feed lists every available
+    objects and no deletion.
+
+    Objects are read with server-side cursors by chunks of
+    ``LOTUS_CHANGEFEED_CHUNK_SIZE`` rows so memory usage does not depend on the number
+    of changes.
+    """
+    ARTICLE_FIELDS = [
+        "id",
+        "cover",
+        "featured",
+        "introduction",
+        "language",
+        "last_update",
+        "pinned",
+        "private",
+        "publish_date",
+        "publish_end",
+        "publish_time",
+        "slug",
+        "status",
+        "title",
+    ]
+    """
+    Article fields loaded for events.
+    """
+
+    CATEGORY_FIELDS = [
+        "id",
+        "cover",
+        "language",
+        "lead",
+        "modified",
+        "slug",
+        "title",
+    ]
+    """
+    Category fields loaded for events.
+    """
+
+    def get_queryset(self):
+        """
+        Queryset is only used by model permissions.
+        """
+        return Article.objects.all()
+
+    def get_since(self):
+        """
+        Return the watermark from query parameter ``since``.
+
+        Returns:
+            datetime.datetime: Datetime in UTC, naive datetimes are assumed to be in
+            the current timezone. ``None`` if parameter is empty.
+        """
+        value = self.request.query_params.get("since")
+        if not value:
+            return None
+
+        since = parse_datetime(value)
+        if since is None:
+            raise ValidationError({
+                "since": _("Enter a valid ISO 8601 datetime.")
+            })
+
+        if timezone.is_naive(since):
+            since = timezone.make_aware(since)
+
+        return since.astimezone(datetime.timezone.utc)
+
+    def get_language(self):
+        """
+        Return the language code from query parameter ``language``, ``None`` means
+        every languages.
+        """
+        return self.request.query_params.get("language") or None
+
+    def build_event(self, kind, action, instance_id, language, date, data=None):
+        """
+        Return an event line.
+
+        Returns:
+            bytes: JSON event ended with a line break.
+        """
+        event = {
+            "type": kind,
+            "action": action,
+            "id": instance_id,
+            "language": language,
+            "date": date,
+        }
+        if data is not None:
+            event["data"] = data
+
+        return json_dumps(event) + b"\n"
+
+    def get_article_events(self, since, until, language):
+        """
+        Yield article events for edited articles and publication transitions.
+        """
+        queryset = Article.objects.filter(last_update__lte=until)
+        if since:
+            queryset = (
+                queryset.filter(last_update__gt=since) |
+                queryset.get_transitions(since, until=until)
+            )
+
+        if language:
+            queryset = queryset.filter(language=language)
+
+        allow_private = self.request.user.is_authenticated
+        if not allow_private:
+            queryset = queryset.filter(private=False)
+
+        queryset = queryset.only(*self.ARTICLE_FIELDS).annotate_published(
+            target_date=until
+        ).order_by("last_update", "id")
+
+        if since:
+            # Status and privacy have no history, only the publication period can
+            # tell if an article may have been exposed at the watermark
+            queryset = queryset.annotate(
+                was_exposed=models.Case(
+                    models.When(
+                        models.Q(*queryset.build_window_conditions(since)),
+                        then=models.Value(True),
+                    ),
+                    default=models.Value(False),
+                    output_field=models.BooleanField(),
+                )
+            )
+
+        serializer = ArticleMinimalSerializer(context={
+            "request": self.request,
+            "lotus_now": until,
+        })
+
+        for article in queryset.iterator(
+            chunk_size=settings.LOTUS_CHANGEFEED_CHUNK_SIZE
+        ):
+            if article.published:
+                yield self.build_event(
+                    "article", "update", article.id, article.language,
+                    article.last_update, serializer.to_representation(article),
+                )
+            elif since and article.was_exposed:
+                yield self.build_event(
+                    "article", "remove", article.id, article.language,
+                    article.last_update,
+                )
+
+    def get_category_events(self, since, until, language):
+        """
+        Yield category events for edited categories.
+        """
+        queryset = Category.objects.filter(modified__lte=until)
+        if since:
+            queryset = queryset.filter(modified__gt=since)
+
+        if language:
+            queryset = queryset.filter(language=language)
+
+        queryset = queryset.only(*self.CATEGORY_FIELDS).order_by("modified", "id")
+
+        serializer = CategoryMinimalSerializer(context={"request": self.request})
+
+        for category in queryset.iterator(
+            chunk_size=settings.LOTUS_CHANGEFEED_CHUNK_SIZE
+        ):
+            yield self.build_event(
+                "category", "update", category.id, category.language,
+                category.modified, serializer.to_representation(category),
+            )
+
+    def get_deletion_events(self, since, until, language):
+        """
+        Yield tombstone events for deleted articles and categories.
+        """
+        if not since:
+            return
+
+        queryset = DeletionLog.objects.get_period(
+            since=since,
+            until=until,
+            model_labels=[
+                Article._meta.label_lower,
+                Category._meta.label_lower,
+            ],
+            language=language,
+            private=None if self.request.user.is_authenticated else False,
+        )
+
+        for entry in queryset.iterator(
+            chunk_size=settings.LOTUS_CHANGEFEED_CHUNK_SIZE
+        ):
+            yield self.build_event(
+                entry.model_label.split(".")[1], "delete", entry.object_id,
+                entry.language, entry.deleted,
+            )
+
+    def stream(self, since, until, language):
+        """
+        Yield every event lines then the watermark line.
+        """
+        yield from self.get_article_events(since, until, language)
+        yield from self.get_category_events(since, until, language)
+        yield from self.get_deletion_events(since, until, language)
+
+        yield json_dumps({"type": "watermark", "date": until}) + b"\n"
+
+    def list(self, request, *args, **kwargs):
+        since = self.get_since()
+        until = timezone.now() - datetime.timedelta(
+            seconds=settings.LOTUS_CHANGEFEED_SAFETY_MARGIN
+        )
+
+        return StreamingHttpResponse(
+            self.stream(since, until, self.get_language()),
+            content_type="application/x-ndjson",
+        )
@@ -1,7 +1,352 @@
+import hashlib
+import json
+import uuid
+
+from django.conf import settings
+from django.utils.cache import get_conditional_response
+from django.utils.http import quote_etag
+
+from rest_framework.renderers import JSONRenderer
+from rest_framework.response import Response
+
+from ..models import Article
+from ..renderers import LotusJSONRenderer
+from ..serializers.mixins import SparseFieldsetMixin
+from ..surrogates import (
+    build_listing_key, get_objects_keys, get_versioned, set_surrogate_headers,
+    set_versioned,
+)
 from ..views.mixins import ArticleFilterMixin, LanguageMixin
 
 
-class ArticleFilterAbstractViewset(ArticleFilterMixin, LanguageMixin):
+class SurrogateKeyViewSetMixin:
+    """
+    A mixin to add surrogate key headers on successful responses for the objects
+    returned from viewset.
+
+    Objects are collected from ``get_object`` and ``paginate_queryset``, list action
+    also includes the listing key of viewset model.
+    """
+    surrogate_objects = None
+    surrogate_keys = None
+    """
+    Keys to use instead of the ones from ``get_surrogate_keys``, commonly the keys
+    restored from a cached payload.
+    """
+
+    def get_object(self):
+        obj = super().get_object()
+        self.surrogate_objects = [obj]
+
+        return obj
+
+    def paginate_queryset(self, queryset):
+        page = super().paginate_queryset(queryset)
+        # Without pagination the queryset is serialized as is and so it is already
+        # evaluated once keys are built
+        self.surrogate_objects = queryset if page is None else page
+
+        return page
+
+    def get_surrogate_keys(self):
+        """
+        Return surrogate keys for collected objects.
+
+        Returns:
+            list: Surrogate keys.
+        """
+        keys = []
+
+        if getattr(self, "action", None) == "list":
+            keys.append(build_listing_key(self.model))
+
+        keys.extend(get_objects_keys(self.surrogate_objects or []))
+
+        return keys
+
+    def finalize_response(self, request, response, *args, **kwargs):
+        response = super().finalize_response(request, response, *args, **kwargs)
+
+        if response.status_code < 400:
+            set_surrogate_headers(
+                response,
+                (
+                    self.surrogate_keys if self.surrogate_keys is not None
+                    else self.get_surrogate_keys()
+                )
+            )
+
+        return response
+
+
+class SparseFieldsetViewSetMixin:
+    """
+    A mixin to select serialized fields from request query parameters.
+
+    Query parameter ``fields`` is a comma separated list of field names to keep and
+    ``expand`` a comma separated list of field names to add (from the serializer
+    ``expandable_fields``). They are given to serializers which implement
+    ``SparseFieldsetMixin``.
+
+    When ``fields`` is given, viewset querysets can load only the needed model fields
+    with ``get_projected_fields``.
+
+    Attributes:
+        projection_required (list): Model fields always loaded with a projection.
+        projection_dependencies (dict): Model fields to load for serializer fields
+            which are not model fields. Item key is the serializer field name and item
+            value is a list of model field names.
+    """
+    projection_required = ["id"]
+    projection_dependencies = {}
+
+    def get_query_param_list(self, name):
+        """
+        Return a list of values from a comma separated query parameter.
+
+        Arguments:
+            name (string): Query parameter name.
+
+        Returns:
+            list: Values, empty if parameter is not given or empty.
+        """
+        return [
+            item.strip()
+            for item in self.request.query_params.get(name, "").split(",")
+            if item.strip()
+        ]
+
+    def get_requested_fields(self):
+        """
+        Return requested field names or ``None`` if there is none.
+        """
+        return self.get_query_param_list("fields") or None
+
+    def get_requested_expansions(self):
+        """
+        Return requested expansion names.
+        """
+        return self.get_query_param_list("expand")
+
+    def get_serializer(self, *args, **kwargs):
+        if issubclass(self.get_serializer_class(), SparseFieldsetMixin):
+            kwargs.setdefault("fields", self.get_requested_fields())
+            kwargs.setdefault("expand", self.get_requested_expansions())
+
+        return super().get_serializer(*args, **kwargs)
+
+    def get_serialized_fields(self):
+        """
+        Return names of fields the serializer will output for current request.
+
+        Returns:
+            list: Serializer field names.
+        """
+        if not hasattr(self, "_serialized_fields"):
+            self._serialized_fields = list(self.get_serializer().fields.keys())
+
+        return self._serialized_fields
+
+    def get_projected_fields(self):
+        """
+        Return model fields to load for the requested fields.
+
+        Returns:
+            list: Model field names to give to queryset method ``only``. This is
+            ``None`` when no fields have been requested.
+        """
+        if self.get_requested_fields() is None:
+            return None
+
+        model_fields = [field.name for field in self.model._meta.concrete_fields]
+        names = list(self.projection_required)
+
+        for name in self.get_serialized_fields():
+            if name in model_fields:
+                names.append(name)
+            names.extend(self.projection_dependencies.get(name, []))
+
+        return list(dict.fromkeys(names))
+
+    def apply_projection(self, queryset):
+        """
+        Apply the projection from ``get_projected_fields`` on given queryset.
+        """
+        names = self.get_projected_fields()
+        if names is None:
+            return queryset
+
+        return queryset.only(*names)
+
+
+class PayloadCacheViewSetMixin:
+    """
+    A mixin to cache the serialized payload of the retrieve action.
+
+    The payload is cached on a key built from the object ID and version, the
+    language, the user authentication state, the requested fields, the request host
+    and the values from ``get_payload_variants``. It is stored with the versions of
+    its surrogate keys (see ``lotus.surrogates``) so it is dropped as soon as the
+    object or one of the related objects it includes changes.
+
+    Payload is kept for ``LOTUS_API_CACHE_TIMEOUT`` seconds at most and never after
+    the next article publication start or end, since included article lists depend
+    on publication dates.
+
+    Fields from ``dynamic_fields`` depend on the current time so they are never
+    cached and are serialized again for each response. The response ETag is built
+    from the cache key and the dynamic fields so conditional requests with
+    ``If-None-Match`` can be answered with a 304 response.
+
+    Attributes:
+        payload_version_field (string): Name of the model field used as the object
+            version, it should be a datetime updated on each save.
+        dynamic_fields (list): Names of serializer fields to not cache.
+    """
+    payload_version_field = None
+    dynamic_fields = []
+
+    def get_payload_variants(self):
+        """
+        Return values from the request which change the payload and are not already
+        part of the cache key, like specific query parameters.
+
+        Returns:
+            list: Values to include in cache key.
+        """
+        return []
+
+    def get_payload_cache_key(self, instance):
+        """
+        Return the cache key for an object payload.
+
+        Arguments:
+            instance (django.db.models.Model): Object to serialize.
+
+        Returns:
+            string: Cache key.
+        """
+        version = getattr(instance, self.payload_version_field)
+
+        parts = [
+            version.isoformat() if version else "",
+            self.get_language_code(),
+            self.is_for_authenticated_user(),
+            self.get_requested_fields(),
+            self.get_requested_expansions(),
+            self.request.build_absolute_uri("/"),
+            *self.get_payload_variants(),
+        ]
+
+        return "lotus-api-{name}-{pk}-{parts}".format(
+            name=instance._meta.model_name,
+            pk=instance.pk,
+            parts=hashlib.md5(
+                "|".join([str(item) for item in parts]).encode("utf-8")
+            ).hexdigest(),
+        )
+
+    def prepare_retrieve(self, instance):
+        """
+        Prepare object before it is serialized when the payload is not cached,
+        commonly to prefetch its relations.
+        """
+        pass
+
+    def get_dynamic_payload(self, serializer, instance):
+        """
+        Serialize the dynamic fields.
+
+        Arguments:
+            serializer (rest_framework.serializers.Serializer): Serializer for
+                retrieve action.
+            instance (django.db.models.Model): Object to serialize.
+
+        Returns:
+            dict: Serialized dynamic fields which are part of serializer fields.
+        """
+        fields = serializer.fields
+
+        return {
+            name: fields[name].to_representation(fields[name].get_attribute(instance))
+            for name in self.dynamic_fields
+            if name in fields
+        }
+
+    def retrieve(self, request, *args, **kwargs):
+        instance = self.get_object()
+        serializer = self.get_serializer(instance)
+
+        if not settings.LOTUS_API_CACHE_TIMEOUT:
+            self.prepare_retrieve(instance)
+            return Response(serializer.data)
+
+        cache_key = self.get_payload_cache_key(instance)
+        cached = get_versioned(cache_key)
+
+        if cached is None:
+            self.prepare_retrieve(instance)
+            data = serializer.data
+            cached = {
+                "data": {
+                    name: value
+                    for name, value in data.items()
+                    if name not in self.dynamic_fields
+                },
+                "surrogate_keys": self.get_surrogate_keys(),
+                # Identify this payload build for the ETag
+                "build": uuid.uuid4().hex,
+            }
+
+            timeout = Article.objects.get_cache_timeout(
+                settings.LOTUS_API_CACHE_TIMEOUT
+            )
+            if timeout:
+                set_versioned(cache_key, cached, cached["surrogate_keys"], timeout)
+
+        self.surrogate_keys = cached["surrogate_keys"]
+
+        dynamic = self.get_dynamic_payload(serializer, instance)
+        etag = quote_etag(hashlib.md5(
+            (
+                cache_key + cached["build"] + json.dumps(dynamic, sort_keys=True)
+            ).encode("utf-8")
+        ).hexdigest())
+
+        not_modified = get_conditional_response(request, etag=etag)
+        if not_modified is not None:
+            not_modified["ETag"] = etag
+            return not_modified
+
+        # Restore the dynamic fields at their serializer position
+        data = {**cached["data"], **dynamic}
+        data = {name: data[name] for name in serializer.fields if name in data}
+
+        return Response(data, headers={"ETag": etag})
+
+
+class FastJSONViewSetMixin:
+    """
+    A mixin to render JSON with ``lotus.renderers.LotusJSONRenderer`` instead of the
+    DRF JSON renderer when setting ``LOTUS_API_FAST_JSON`` is enabled.
+
+    Other renderers from DRF settings or viewset are left unchanged.
+    """
+    def get_renderers(self):
+        renderers = super().get_renderers()
+
+        if not settings.LOTUS_API_FAST_JSON:
+            return renderers
+
+        return [
+            LotusJSONRenderer() if type(renderer) is JSONRenderer else renderer
+            for renderer in renderers
+        ]
+
+
+class ArticleFilterAbstractViewset(FastJSONViewSetMixin, SurrogateKeyViewSetMixin,
+                                   SparseFieldsetViewSetMixin, ArticleFilterMixin,
+                                   LanguageMixin):
     """
     A viewset abstract to gather mixins for including methods to apply publication
     criteria and language filter.
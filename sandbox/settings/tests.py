@@ -7,9 +7,21 @@ DATABASES = {
     "default": {
         "ENGINE": "django.db.backends.sqlite3",
         "NAME": ":memory:",
-    }
+    },
+    # A distinct database to test read replica routing, it is not used until a test
+    # enables it from setting LOTUS_READ_REPLICAS
+    "replica": {
+        "ENGINE": "django.db.backends.sqlite3",
+        "NAME": ":memory:",
+    },
 }
 
+DATABASE_ROUTERS = ["lotus.routers.LotusReplicaRouter"]
+
+MIDDLEWARE = MIDDLEWARE + [  # noqa: F405
+    "lotus.routers.LotusReplicaMiddleware",
+]
+
 # Media directory dedicated to tests to avoid polluting other environment
 # media directory
 MEDIA_ROOT = VAR_PATH / "media-tests"  # noqa: F405
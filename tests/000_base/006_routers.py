@@ -0,0 +1,136 @@
+import pytest
+
+from django.contrib.auth.models import User
+from django.urls import reverse
+
+from lotus.factories import ArticleFactory, CategoryFactory
+from lotus.models import Article, Category
+from lotus.routers import LotusReplicaRouter, get_replica_alias, replica_reads
+
+
+# Tests in this module use a second database alias as a read replica
+pytestmark = pytest.mark.django_db(databases=["default", "replica"])
+
+
+def test_router_routing(settings):
+    """
+    Router should only route reads on Lotus models when a replica is enabled and
+    always route writes to default database.
+    """
+    settings.LOTUS_READ_REPLICAS = ["replica"]
+    router = LotusReplicaRouter()
+
+    assert get_replica_alias() is None
+    assert router.db_for_read(Article) is None
+
+    with replica_reads() as alias:
+        assert alias == "replica"
+        assert router.db_for_read(Article) == "replica"
+        assert router.db_for_read(Category) == "replica"
+        # Not a Lotus model
+        assert router.db_for_read(User) is None
+        # Instance relations are left to Django
+        assert router.db_for_read(Article, instance=Article()) is None
+        assert router.db_for_write(Article) == "default"
+
+    assert get_replica_alias() is None
+
+
+def test_router_no_replica(settings):
+    """
+    Without any enabled replica, nothing should be routed.
+    """
+    settings.LOTUS_READ_REPLICAS = []
+
+    with replica_reads() as alias:
+        assert alias is None
+        assert Article.objects.all().db == "default"
+
+    assert Article.objects.using_replica().db == "default"
+
+
+def test_queryset_using_replica(settings):
+    """
+    Queryset hook should read from replica while writes stay on default database.
+    """
+    settings.LOTUS_READ_REPLICAS = ["replica"]
+
+    article = ArticleFactory()
+
+    assert Article.objects.using_replica().db == "replica"
+    assert Category.objects.using_replica().db == "replica"
+    assert Article.objects.using_replica().filter(pk=article.pk).exists() is False
+
+    # An object read from a replica is saved on default database
+    with replica_reads():
+        assert Article.objects.count() == 0
+        article.save()
+
+    assert Article.objects.filter(pk=article.pk).exists() is True
+
+
+def test_middleware_public_reads(settings, client, admin_client, enable_preview):
+    """
+    Public reads should go to the replica (which is empty here) except for preview
+    mode, admin and sticky clients.
+    """
+    settings.LOTUS_READ_REPLICAS = ["replica"]
+
+    category = CategoryFactory()
+    article = ArticleFactory(fill_categories=[category])
+
+    # Objects only exist in default database
+    response = client.get(article.get_absolute_url())
+    assert response.status_code == 404
+
+    response = client.get(category.get_absolute_url())
+    assert response.status_code == 404
+
+    response = client.get(
+        reverse("lotus-api:article-detail", kwargs={"pk": article.pk})
+    )
+    assert response.status_code == 404
+
+    # Admin reads from default database
+    response = admin_client.get(
+        reverse("admin:lotus_article_change", args=(article.pk,))
+    )
+    assert response.status_code == 200
+
+    # Form autocompletion reads from default database
+    response = admin_client.get(reverse("lotus:article-autocomplete"))
+    assert response.status_code == 200
+    assert response.json()["results"] != []
+
+    # Preview mode reads from default database
+    enable_preview(admin_client)
+    response = admin_client.get(article.get_absolute_url())
+    assert response.status_code == 200
+
+
+def test_middleware_stickiness(settings, client, admin_client):
+    """
+    A write request should mark client to read from default database for a while.
+    """
+    settings.LOTUS_READ_REPLICAS = ["replica"]
+
+    article = ArticleFactory()
+
+    response = admin_client.get(article.get_absolute_url())
+    assert response.status_code == 404
+    assert settings.LOTUS_REPLICA_STICKY_COOKIE not in response.cookies
+
+    response = admin_client.post(
+        reverse("admin:lotus_article_change", args=(article.pk,)),
+        {},
+    )
+    sticky_cookie = response.cookies[settings.LOTUS_REPLICA_STICKY_COOKIE]
+    assert sticky_cookie["max-age"] == settings.LOTUS_REPLICA_STICKINESS
+
+    response = admin_client.get(article.get_absolute_url())
+    assert response.status_code == 200
+
+    # Stickiness is disabled
+    settings.LOTUS_REPLICA_STICKINESS = 0
+    response = client.post(reverse("admin:login"), {})
+    assert settings.LOTUS_REPLICA_STICKY_COOKIE not in response.cookies
@@ -0,0 +1,157 @@
+import datetime
+import decimal
+import json
+import uuid
+from pathlib import Path
+
+import pytest
+
+from django.contrib.auth.models import AnonymousUser
+from django.utils.translation import gettext_lazy
+
+from rest_framework.renderers import JSONRenderer
+
+from lotus import renderers
+from lotus.factories import ArticleFactory, AuthorFactory, TagFactory
+from lotus.serializers import ArticleSerializer
+from lotus.utils.jsons import ExtendedJsonEncoder, TypeEncoderTable
+
+
+@pytest.fixture(params=["orjson", "python"])
+def json_backend(request, monkeypatch):
+    """
+    Run a test with and without orjson.
+    """
+    if request.param == "orjson":
+        if renderers.orjson is None:
+            pytest.skip("orjson is not installed")
+    else:
+        monkeypatch.setattr(renderers, "orjson", None)
+
+    return request.param
+
+
+def test_renderer_parity(json_backend):
+    """
+    Lotus renderer should output the same JSON than the DRF renderer.
+    """
+    utc = datetime.timezone.utc
+    data = {
+        "title": "Ping   pong é",
+        "date": datetime.date(2012, 10, 15),
+        "time": datetime.time(10, 30),
+        "datetime": datetime.datetime(2012, 10, 15, 10, 30, tzinfo=utc),
+        "precise": datetime.datetime(2012, 10, 15, 10, 30, 0, 123456, tzinfo=utc),
+        "naive": datetime.datetime(2012, 10, 15, 10, 30),
+        "duration": datetime.timedelta(minutes=2),
+        "price": decimal.Decimal("1.5"),
+        "uuid": uuid.UUID("12345678123456781234567812345678"),
+        "lazy": gettext_lazy("Foo"),
+        "items": [1, 2.5, None, True, {"nested": ["a"]}],
+    }
+
+    assert renderers.LotusJSONRenderer().render(data) == JSONRenderer().render(data)
+
+    # Indented output is delegated to the DRF renderer
+    assert renderers.LotusJSONRenderer().render(
+        data, renderer_context={"indent": 4}
+    ) == JSONRenderer().render(data, renderer_context={"indent": 4})
+
+    assert renderers.LotusJSONRenderer().render(None) == b""
+
+
+def test_renderer_parity_precision(json_backend):
+    """
+    Dates, decimals and UUIDs should be encoded by the DRF encoder, including
+    their precision and timezone offsets.
+    """
+    data = {
+        "offset": datetime.datetime(
+            2012, 10, 15, 10, 30, 0, 999999,
+            tzinfo=datetime.timezone(datetime.timedelta(hours=2)),
+        ),
+        "time": datetime.time(10, 30, 0, 123456),
+        "price": decimal.Decimal("1234567.10"),
+        "uuid": uuid.UUID("12345678123456781234567812345678"),
+        "keys": {1: "int key"},
+    }
+
+    assert renderers.LotusJSONRenderer().render(data) == JSONRenderer().render(data)
+
+
+def test_renderer_parity_payload(db, rf, json_backend):
+    """
+    Both renderers should output the same article payload.
+    """
+    article = ArticleFactory(fill_tags=[TagFactory()], fill_authors=[AuthorFactory()])
+    request = rf.get("/")
+    request.user = AnonymousUser()
+
+    data = ArticleSerializer(article, context={"request": request}).data
+
+    assert renderers.LotusJSONRenderer().render(data) == JSONRenderer().render(data)
+
+
+def test_renderer_extended_types(db, json_backend):
+    """
+    Lotus renderer should support the extended encoder types.
+    """
+    article = ArticleFactory(cover=None, image=None)
+
+    data = {
+        "path": Path("foo/bar.txt"),
+        "set": {"a"},
+        "bytes": b"foo",
+        "article": article,
+    }
+
+    assert json.loads(renderers.json_dumps(data)) == {
+        "path": "foo/bar.txt",
+        "set": ["a"],
+        "bytes": "foo",
+        "article": repr(article),
+    }
+    assert json.loads(renderers.json_dumps(data)) == json.loads(
+        json.dumps(data, cls=ExtendedJsonEncoder)
+    )
+
+    with pytest.raises(TypeError):
+        renderers.json_dumps({"foo": object()})
+
+
+def test_type_encoder_table():
+    """
+    Table should resolve subclasses from their nearest parent once.
+    """
+    class Base:
+        pass
+
+    class Child(Base):
+        pass
+
+    table = TypeEncoderTable({Base: lambda obj: "base", object: lambda obj: "obj"})
+
+    assert table.default(Child()) == "base"
+    assert table.get_encoder(int)(1) == "obj"
+    assert Child in table._resolved
+
+    table = TypeEncoderTable({Base: lambda obj: "base"}, fallback=lambda obj: "nope")
+    assert table.default(1) == "nope"
+
+    with pytest.raises(TypeError):
+        TypeEncoderTable({}).default(1)
+
+
+def test_viewset_renderer(db, settings, api_client):
+    """
+    Lotus viewsets should use the Lotus renderer only when enabled.
+    """
+    ArticleFactory(cover=None, image=None)
+
+    response = api_client.get("/api/article/", HTTP_ACCEPT="application/json")
+    assert type(response.accepted_renderer) is JSONRenderer
+
+    settings.LOTUS_API_FAST_JSON = True
+    response = api_client.get("/api/article/", HTTP_ACCEPT="application/json")
+    assert isinstance(response.accepted_renderer, renderers.LotusJSONRenderer)
+    assert response.json()["count"] == 1
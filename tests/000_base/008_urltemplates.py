@@ -0,0 +1,130 @@
+import datetime
+import sys
+import types
+
+import pytest
+
+from django.conf.urls.i18n import i18n_patterns
+from django.urls import (
+    NoReverseMatch, include, path, reverse, set_script_prefix, translate_url,
+)
+from django.utils import translation
+
+from lotus.factories import ArticleFactory, CategoryFactory
+from lotus.urltemplates import (
+    build_translated_url, compile_url_template, get_url_template,
+)
+
+
+def legacy_url(urlname, language, **kwargs):
+    """
+    Build an URL like the models did before URL templates.
+    """
+    return translate_url(reverse(urlname, kwargs=kwargs), language)
+
+
+@pytest.mark.parametrize("active", ["en", "fr"])
+def test_urltemplates_parity(db, settings, active):
+    """
+    URLs built from templates should be the same than the ones from ``reverse()`` and
+    ``translate_url()`` whatever the active language is.
+    """
+    settings.LANGUAGE_CODE = "en"
+
+    articles = [
+        ArticleFactory(
+            language=language,
+            slug="article-{}".format(language),
+            publish_date=publish_date,
+        )
+        for language, publish_date in [
+            ("en", datetime.date(2012, 1, 2)),
+            ("fr", datetime.date(2012, 10, 15)),
+            ("de", datetime.date(1999, 12, 31)),
+        ]
+    ]
+    categories = [
+        CategoryFactory(language=language, slug="category-{}".format(language))
+        for language in ["en", "fr", "de"]
+    ]
+
+    with translation.override(active):
+        for article in articles:
+            kwargs = {
+                "year": article.publish_date.year,
+                "month": article.publish_date.month,
+                "day": article.publish_date.day,
+                "slug": article.slug,
+            }
+            assert article.get_absolute_url() == legacy_url(
+                "lotus:article-detail", article.language, **kwargs
+            )
+            assert article.get_absolute_preview_url() == legacy_url(
+                "lotus:preview-article-detail", article.language, **kwargs
+            )
+
+        for category in categories:
+            assert category.get_absolute_url() == legacy_url(
+                "lotus:category-detail", category.language, slug=category.slug
+            )
+
+        # Values are quoted like reverse() does
+        for tag in ["science", "élan café", "100%"]:
+            assert build_translated_url("lotus:tag-detail", "fr", tag=tag) == (
+                legacy_url("lotus:tag-detail", "fr", tag=tag)
+            )
+
+    assert articles[1].get_absolute_url() == "/fr/2012/10/15/article-fr/"
+
+
+def test_urltemplates_script_prefix(db):
+    """
+    Templates should follow the script prefix.
+    """
+    category = CategoryFactory(language="fr", slug="foo")
+
+    assert category.get_absolute_url() == "/fr/categories/foo/"
+
+    set_script_prefix("/site/")
+    try:
+        assert category.get_absolute_url() == "/site/fr/categories/foo/"
+    finally:
+        set_script_prefix("/")
+
+    assert category.get_absolute_url() == "/fr/categories/foo/"
+
+
+def test_urltemplates_urlconf_reload(db, settings, monkeypatch):
+    """
+    Templates should be compiled again when URLconf is reloaded.
+    """
+    category = CategoryFactory(language="fr", slug="foo")
+    assert category.get_absolute_url() == "/fr/categories/foo/"
+
+    urlconf = types.ModuleType("lotus_tests_urlconf")
+    urlconf.urlpatterns = i18n_patterns(
+        path("blog/", include("lotus.urls")),
+    )
+    monkeypatch.setitem(sys.modules, urlconf.__name__, urlconf)
+
+    settings.ROOT_URLCONF = urlconf.__name__
+    assert category.get_absolute_url() == "/fr/blog/categories/foo/"
+
+
+def test_urltemplates_compile():
+    """
+    Template compilation should give up on unknown URL or arguments.
+    """
+    assert compile_url_template(
+        "lotus:category-detail", ("slug",), "de"
+    ) == "/de/categories/{slug}/"
+    assert get_url_template(
+        "lotus:category-detail", ("slug",), "de"
+    ) == "/de/categories/{slug}/"
+
+    assert compile_url_template("lotus:category-detail", ("pk",), "de") is None
+    assert compile_url_template("lotus:nope", (), "de") is None
+
+    # Without template, URL is built as usual so it may fail the same way
+    with pytest.raises(NoReverseMatch):
+        build_translated_url("lotus:category-detail", "de", pk=42)
@@ -312,3 +312,19 @@ def test_category_delete_tree(tests_settings, db):
     item_2 = Category.objects.get(slug="item-2")
     item_2.delete()
     assert Category.objects.count() == 1
+
+
+def test_category_model_translation_group(db):
+    """
+    Category siblings should be resolved from translation group.
+    """
+    created = multilingual_category(langs=["fr", "de"])
+    original = created["original"]
+
+    assert original.translation_group == original.pk
+    assert created["translations"]["de"].translation_group == original.pk
+    assert sorted(
+        Category.objects.get_siblings(created["translations"]["fr"]).values_list(
+            "language", flat=True
+        )
+    ) == ["de", "en"]
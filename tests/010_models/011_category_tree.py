@@ -285,6 +285,7 @@ def test_category_get_nested_tree_basic(tests_settings, db, django_assert_num_qu
             "depth": 1,
             "path": "0001",
             "active": False,
+            "articles": {"direct": 0, "subtree": 0},
         },
         {
             "data": {
@@ -303,6 +304,7 @@ def test_category_get_nested_tree_basic(tests_settings, db, django_assert_num_qu
             "depth": 1,
             "path": "0002",
             "active": False,
+            "articles": {"direct": 0, "subtree": 0},
             "children": [
                 {
                     "data": {
@@ -321,6 +323,7 @@ def test_category_get_nested_tree_basic(tests_settings, db, django_assert_num_qu
                     "depth": 2,
                     "path": "00020001",
                     "active": False,
+                    "articles": {"direct": 0, "subtree": 0},
                     "children": [
                         {
                             "data": {
@@ -339,6 +342,7 @@ def test_category_get_nested_tree_basic(tests_settings, db, django_assert_num_qu
                             "depth": 3,
                             "path": "000200010001",
                             "active": False,
+                            "articles": {"direct": 0, "subtree": 0},
                         }
                     ]
                 }
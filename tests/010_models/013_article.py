@@ -645,3 +645,47 @@ def test_article_model_get_related_default(db):
         "not yet published",
         "published yesterday",
     ]
+
+
+def test_article_model_translation_group(db):
+    """
+    Translation group should be maintained on save when original changes and allow to
+    get siblings for many articles at once.
+    """
+    beef = multilingual_article(slug="beef", langs=["fr", "de"])
+    cheese = multilingual_article(slug="cheese", langs=["fr"])
+    single = ArticleFactory(slug="single", language="fr")
+
+    assert beef["original"].translation_group == beef["original"].pk
+    assert beef["translations"]["fr"].translation_group == beef["original"].pk
+    assert Article.objects.get(pk=single.pk).translation_group == single.pk
+
+    # Siblings are resolved with the translation group
+    assert sorted(
+        Article.objects.get_siblings(beef["translations"]["fr"]).values_list(
+            "language", flat=True
+        )
+    ) == ["de", "en"]
+
+    # Change article original to another one
+    single.original = cheese["original"]
+    single.language = "de"
+    single.save()
+    assert Article.objects.get(pk=single.pk).translation_group == (
+        cheese["original"].pk
+    )
+    assert sorted(
+        Article.objects.get_siblings(cheese["original"]).values_list(
+            "language", flat=True
+        )
+    ) == ["de", "fr"]
+
+    # Translation groups for many articles in a single query
+    assert sorted(
+        Article.objects.get_translation_groups(
+            [beef["original"], cheese["translations"]["fr"]]
+        ).values_list("slug", "language")
+    ) == [
+        ("beef", "de"), ("beef", "en"), ("beef", "fr"),
+        ("cheese", "en"), ("cheese", "fr"), ("single", "de"),
+    ]
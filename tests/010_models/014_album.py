@@ -167,3 +167,24 @@ def test_album_model_file_purge(db):
 
     # File is deleted along its object
     assert Path(ping_path).exists() is False
+
+
+def test_album_modified_on_item_change(db):
+    """
+    Album modification date and so its cache key should change when an item is saved
+    or deleted.
+    """
+    album = AlbumFactory()
+    initial_key = album.get_cache_key("html")
+
+    item = AlbumItemFactory(album=album)
+    album.refresh_from_db()
+    saved_key = album.get_cache_key("html")
+    assert saved_key != initial_key
+
+    item.delete()
+    album.refresh_from_db()
+    assert album.get_cache_key("html") not in (initial_key, saved_key)
+
+    # Different parts lead to different keys
+    assert album.get_cache_key("html") != album.get_cache_key("api")
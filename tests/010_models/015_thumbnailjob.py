@@ -0,0 +1,159 @@
+import datetime
+
+from django.utils import timezone
+
+from lotus.choices import (
+    THUMBNAIL_JOB_DONE, THUMBNAIL_JOB_FAILED, THUMBNAIL_JOB_PENDING,
+)
+from lotus.factories import AlbumItemFactory, ArticleFactory, CategoryFactory
+from lotus.models import ThumbnailJob
+
+
+def test_thumbnailjob_disabled(db, settings):
+    """
+    No job should be enqueued when pre-generation is disabled.
+    """
+    settings.LOTUS_THUMBNAIL_PREGENERATION = False
+
+    ArticleFactory()
+    CategoryFactory()
+    AlbumItemFactory()
+
+    assert ThumbnailJob.objects.count() == 0
+
+
+def test_thumbnailjob_enqueue_on_save(db, settings):
+    """
+    Saving objects should enqueue a job for each filled media field.
+    """
+    settings.LOTUS_THUMBNAIL_PREGENERATION = True
+
+    article = ArticleFactory(image="")
+    category = CategoryFactory()
+    item = AlbumItemFactory()
+
+    assert sorted([
+        (job.model_label, job.object_id, job.field_name, job.status)
+        for job in ThumbnailJob.objects.all()
+    ]) == sorted([
+        ("lotus.albumitem", item.id, "media", THUMBNAIL_JOB_PENDING),
+        ("lotus.article", article.id, "cover", THUMBNAIL_JOB_PENDING),
+        ("lotus.category", category.id, "cover", THUMBNAIL_JOB_PENDING),
+    ])
+
+
+def test_thumbnailjob_no_duplicate(db, settings):
+    """
+    Saving an object again should not enqueue another job while the previous one is
+    still pending.
+    """
+    settings.LOTUS_THUMBNAIL_PREGENERATION = True
+
+    category = CategoryFactory()
+    category.save()
+    assert ThumbnailJob.objects.count() == 1
+
+    ThumbnailJob.objects.update(status=THUMBNAIL_JOB_DONE)
+    category.cover = "foo.png"
+    category.save()
+    assert ThumbnailJob.objects.filter(status=THUMBNAIL_JOB_PENDING).count() == 1
+
+
+def test_thumbnailjob_unchanged(db, settings):
+    """
+    Saving an object again should only enqueue jobs for the changed media fields.
+    """
+    settings.LOTUS_THUMBNAIL_PREGENERATION = True
+
+    article = ArticleFactory()
+    ThumbnailJob.objects.update(status=THUMBNAIL_JOB_DONE)
+
+    article.title = "Changed"
+    article.save()
+    assert ThumbnailJob.objects.filter(status=THUMBNAIL_JOB_PENDING).count() == 0
+
+    article.image = "foo.png"
+    article.save()
+    assert [
+        job.field_name
+        for job in ThumbnailJob.objects.filter(status=THUMBNAIL_JOB_PENDING)
+    ] == ["image"]
+
+
+def test_thumbnailjob_claim(db, settings):
+    """
+    Claimed jobs should be marked as running and not be claimed again.
+    """
+    settings.LOTUS_THUMBNAIL_PREGENERATION = True
+
+    CategoryFactory()
+    CategoryFactory()
+    CategoryFactory()
+
+    first = ThumbnailJob.objects.claim(limit=2)
+    second = ThumbnailJob.objects.claim(limit=2)
+
+    assert len(first) == 2
+    assert len(second) == 1
+    assert ThumbnailJob.objects.claim() == []
+
+
+def test_thumbnailjob_claim_abandoned(db, settings):
+    """
+    Running jobs should be claimed again once their timeout is over.
+    """
+    settings.LOTUS_THUMBNAIL_PREGENERATION = True
+    settings.LOTUS_THUMBNAIL_JOB_TIMEOUT = 600
+
+    CategoryFactory()
+    job = ThumbnailJob.objects.claim()[0]
+    assert ThumbnailJob.objects.claim() == []
+
+    # Still running since less than the timeout
+    ThumbnailJob.objects.filter(pk=job.pk).update(
+        processed=timezone.now() - datetime.timedelta(seconds=500)
+    )
+    assert ThumbnailJob.objects.claim() == []
+
+    ThumbnailJob.objects.filter(pk=job.pk).update(
+        processed=timezone.now() - datetime.timedelta(seconds=700)
+    )
+    assert ThumbnailJob.objects.claim() == [job]
+
+    # Excluded jobs are never claimed
+    ThumbnailJob.objects.filter(pk=job.pk).update(status=THUMBNAIL_JOB_PENDING)
+    assert ThumbnailJob.objects.claim(exclude=[job.pk]) == []
+
+
+def test_thumbnailjob_prune(db, settings):
+    """
+    Only done jobs older than retention should be deleted.
+    """
+    settings.LOTUS_THUMBNAIL_PREGENERATION = True
+    settings.LOTUS_THUMBNAIL_JOB_RETENTION = 3600
+
+    CategoryFactory()
+    CategoryFactory()
+    CategoryFactory()
+    old, recent, failed = ThumbnailJob.objects.order_by("id")
+
+    now = timezone.now()
+    ThumbnailJob.objects.filter(pk=old.pk).update(
+        status=THUMBNAIL_JOB_DONE,
+        processed=now - datetime.timedelta(seconds=4000),
+    )
+    ThumbnailJob.objects.filter(pk=recent.pk).update(
+        status=THUMBNAIL_JOB_DONE,
+        processed=now - datetime.timedelta(seconds=3000),
+    )
+    ThumbnailJob.objects.filter(pk=failed.pk).update(
+        status=THUMBNAIL_JOB_FAILED,
+        processed=now - datetime.timedelta(seconds=4000),
+    )
+
+    settings.LOTUS_THUMBNAIL_JOB_RETENTION = 0
+    assert ThumbnailJob.objects.prune() == 0
+
+    settings.LOTUS_THUMBNAIL_JOB_RETENTION = 3600
+    assert ThumbnailJob.objects.prune() == 1
+    assert list(ThumbnailJob.objects.order_by("id")) == [recent, failed]
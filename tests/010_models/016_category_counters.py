@@ -0,0 +1,256 @@
+import datetime
+
+from django.core.management import call_command
+
+from freezegun import freeze_time
+
+from lotus.choices import STATUS_DRAFT, STATUS_PUBLISHED
+from lotus.counters import COUNTER_FIELDS
+from lotus.factories import ArticleFactory, CategoryFactory
+from lotus.models import Category
+
+
+def get_counts(*categories):
+    """
+    Return counters of given categories from database as tuples in the
+    ``COUNTER_FIELDS`` order.
+    """
+    values = {
+        item["id"]: tuple(item[name] for name in COUNTER_FIELDS)
+        for item in Category.objects.filter(
+            pk__in=[category.pk for category in categories]
+        ).values("id", *COUNTER_FIELDS)
+    }
+
+    return [values[category.pk] for category in categories]
+
+
+def test_counters_relations(db):
+    """
+    Counters should follow article relation changes from both sides and count
+    articles once in subtree.
+    """
+    root = CategoryFactory(title="Root")
+    child = CategoryFactory(title="Child")
+    child.move_into(root)
+    child.refresh_from_db()
+    grandchild = CategoryFactory(title="Grandchild")
+    grandchild.move_into(child)
+
+    public = ArticleFactory(fill_categories=[child, grandchild])
+    private = ArticleFactory(private=True, fill_categories=[grandchild])
+    ArticleFactory(status=STATUS_DRAFT, fill_categories=[grandchild])
+
+    # direct, direct public, subtree, subtree public
+    assert get_counts(root, child, grandchild) == [
+        (0, 0, 2, 1),
+        (1, 1, 2, 1),
+        (2, 1, 2, 1),
+    ]
+
+    grandchild.articles.remove(private)
+    assert get_counts(root, grandchild) == [(0, 0, 1, 1), (1, 1, 1, 1)]
+
+    public.categories.clear()
+    assert get_counts(root, child, grandchild) == [
+        (0, 0, 0, 0),
+        (0, 0, 0, 0),
+        (0, 0, 0, 0),
+    ]
+
+    root.articles.add(private)
+    assert get_counts(root) == [(1, 0, 1, 0)]
+
+
+def test_counters_article_changes(db):
+    """
+    Counters should follow article status, privacy and deletion.
+    """
+    parent = CategoryFactory(title="Parent")
+    category = CategoryFactory(title="Category")
+    category.move_into(parent)
+
+    article = ArticleFactory(fill_categories=[category])
+    assert get_counts(parent, category) == [(0, 0, 1, 1), (1, 1, 1, 1)]
+
+    article.private = True
+    article.save()
+    assert get_counts(parent, category) == [(0, 0, 1, 0), (1, 0, 1, 0)]
+
+    article.status = STATUS_DRAFT
+    article.save()
+    assert get_counts(parent, category) == [(0, 0, 0, 0), (0, 0, 0, 0)]
+
+    article.status = STATUS_PUBLISHED
+    article.private = False
+    article.save()
+    assert get_counts(parent, category) == [(0, 0, 1, 1), (1, 1, 1, 1)]
+
+    article.delete()
+    assert get_counts(parent, category) == [(0, 0, 0, 0), (0, 0, 0, 0)]
+
+
+def test_counters_tree_changes(db):
+    """
+    Counters should follow category move and deletion.
+    """
+    first = CategoryFactory(title="First")
+    second = CategoryFactory(title="Second")
+    moved = CategoryFactory(title="Moved")
+    moved.move_into(first)
+    ArticleFactory(fill_categories=[moved])
+
+    assert get_counts(first, second) == [(0, 0, 1, 1), (0, 0, 0, 0)]
+
+    moved.refresh_from_db()
+    moved.move_into(second)
+    assert get_counts(first, second, moved) == [
+        (0, 0, 0, 0),
+        (0, 0, 1, 1),
+        (1, 1, 1, 1),
+    ]
+
+    Category.objects.get(pk=moved.pk).delete()
+    assert get_counts(second) == [(0, 0, 0, 0)]
+
+
+def test_counters_tree_move(db):
+    """
+    Counters should follow a move made with ``move()`` like the admin move form
+    does, including a move to the tree root.
+    """
+    first = CategoryFactory(title="First")
+    second = CategoryFactory(title="Second")
+    moved = CategoryFactory(title="Moved")
+    moved.move_into(first)
+    ArticleFactory(fill_categories=[moved])
+
+    Category.objects.get(pk=moved.pk).move(
+        Category.objects.get(pk=second.pk), pos="sorted-child"
+    )
+    assert get_counts(first, second) == [(0, 0, 0, 0), (0, 0, 1, 1)]
+
+    Category.objects.get(pk=moved.pk).move(
+        Category.objects.get(pk=first.pk), pos="sorted-sibling"
+    )
+    assert get_counts(first, second, moved) == [
+        (0, 0, 0, 0),
+        (0, 0, 0, 0),
+        (1, 1, 1, 1),
+    ]
+    assert Category.objects.get(pk=moved.pk).depth == 1
+
+
+def test_counters_language(db):
+    """
+    Only articles in the category language should be counted.
+    """
+    category = CategoryFactory(language="fr")
+    ArticleFactory(language="fr", fill_categories=[category])
+    ArticleFactory(language="en").categories.add(category)
+
+    assert get_counts(category) == [(1, 1, 1, 1)]
+
+
+def test_counters_nested_tree(db):
+    """
+    Tree nodes should expose counters for the privacy level and empty nodes can be
+    excluded.
+    """
+    root = CategoryFactory(title="Root")
+    child = CategoryFactory(title="Child")
+    child.move_into(root)
+    CategoryFactory(title="Empty")
+    ArticleFactory(private=True, fill_categories=[child])
+
+    tree = Category.get_nested_tree(private=True)
+    assert [(node["data"]["title"], node["articles"]) for node in tree] == [
+        ("Root", {"direct": 0, "subtree": 1}),
+        ("Empty", {"direct": 0, "subtree": 0}),
+    ]
+    assert tree[0]["children"][0]["articles"] == {"direct": 1, "subtree": 1}
+
+    tree = Category.get_nested_tree(private=True, exclude_empty=True)
+    assert [node["data"]["title"] for node in tree] == ["Root"]
+
+    assert Category.get_nested_tree(exclude_empty=True) == []
+
+
+def test_counters_rebuild(db):
+    """
+    Rebuild command should compute every counters.
+    """
+    parent = CategoryFactory(title="Parent")
+    category = CategoryFactory(title="Category")
+    category.move_into(parent)
+    ArticleFactory(fill_categories=[category])
+
+    Category.objects.update(**{name: 0 for name in COUNTER_FIELDS})
+
+    call_command("lotus_category_counts")
+    assert get_counts(parent, category) == [(0, 0, 1, 1), (1, 1, 1, 1)]
+
+
+@freeze_time("2012-10-15 10:00:00")
+def test_counters_publication_dates(db):
+    """
+    Counters should only count currently published articles and be computed again
+    when read after a publication start or end.
+    """
+    parent = CategoryFactory(title="Parent")
+    category = CategoryFactory(title="Category")
+    category.move_into(parent)
+    ArticleFactory(fill_categories=[category])
+    ArticleFactory(
+        publish_date=datetime.date(2012, 10, 15),
+        publish_time=datetime.time(10, 2),
+        fill_categories=[category],
+    )
+    ArticleFactory(
+        publish_end=datetime.datetime(
+            2012, 10, 15, 10, 5, tzinfo=datetime.timezone.utc
+        ),
+        fill_categories=[category],
+    )
+
+    assert get_counts(parent, category) == [(0, 0, 2, 2), (2, 2, 2, 2)]
+    category.refresh_from_db()
+    assert category.counts_expire == datetime.datetime(
+        2012, 10, 15, 10, 2, tzinfo=datetime.timezone.utc
+    )
+
+    with freeze_time("2012-10-15 10:03:00"):
+        # Stored counters are only computed again when read
+        assert get_counts(category) == [(2, 2, 2, 2)]
+        assert category.get_article_counts() == {"direct": 3, "subtree": 3}
+        assert get_counts(parent, category) == [(0, 0, 3, 3), (3, 3, 3, 3)]
+
+    with freeze_time("2012-10-15 10:06:00"):
+        tree = Category.get_nested_tree()
+        assert tree[0]["articles"] == {"direct": 0, "subtree": 2}
+        assert tree[0]["children"][0]["articles"] == {"direct": 2, "subtree": 2}
+        assert "counts_expire" not in tree[0]["data"]
+
+    assert get_counts(parent, category) == [(0, 0, 2, 2), (2, 2, 2, 2)]
+
+
+@freeze_time("2012-10-15 10:00:00")
+def test_counters_nested_tree_expired(db):
+    """
+    Nested tree without empty categories should include a category which only
+    article has been published since its counters were computed.
+    """
+    category = CategoryFactory(title="Category")
+    ArticleFactory(
+        publish_date=datetime.date(2012, 10, 15),
+        publish_time=datetime.time(10, 2),
+        fill_categories=[category],
+    )
+
+    assert Category.get_nested_tree(exclude_empty=True) == []
+
+    with freeze_time("2012-10-15 10:03:00"):
+        tree = Category.get_nested_tree(exclude_empty=True)
+        assert [(node["data"]["title"], node["articles"]) for node in tree] == [
+            ("Category", {"direct": 1, "subtree": 1}),
+        ]
@@ -1,4 +1,5 @@
 import datetime
+import pickle
 
 from freezegun import freeze_time
 
@@ -416,3 +417,262 @@ def test_article_managers_get_siblings(db):
     assert list(dieananas_siblings) == [
         "ananas", "pineapple",
     ]
+
+
+@freeze_time("2012-10-15 10:00:00")
+def test_article_managers_annotate_published(db):
+    """
+    Publication state annotation should match the publication state computed from
+    model method.
+    """
+    utc = ZoneInfo("UTC")
+    yesterday = datetime.datetime(2012, 10, 14, 10, 0).replace(tzinfo=utc)
+    tomorrow = datetime.datetime(2012, 10, 16, 10, 0).replace(tzinfo=utc)
+
+    ArticleFactory(slug="published")
+    ArticleFactory(slug="draft", status=STATUS_DRAFT)
+    ArticleFactory(
+        slug="notyet",
+        publish_date=tomorrow.date(),
+        publish_time=tomorrow.time(),
+    )
+    ArticleFactory(slug="passed", publish_end=yesterday)
+    ArticleFactory(slug="private", private=True)
+
+    articles = Article.objects.annotate_published().order_by("slug")
+
+    assert [(item.slug, item.published) for item in articles] == [
+        ("draft", False),
+        ("notyet", False),
+        ("passed", False),
+        ("private", True),
+        ("published", True),
+    ]
+    assert [item.published for item in articles] == [
+        item.is_published() for item in articles
+    ]
+
+    assert list(
+        Article.objects.annotate_published().filter(published=True).order_by(
+            "slug"
+        ).values_list("slug", flat=True)
+    ) == ["private", "published"]
+
+
+@freeze_time("2012-10-15 10:00:00")
+def test_article_managers_get_transitions(db):
+    """
+    Transitions should select articles which publication started or ended within
+    the period, start is excluded and end is included.
+    """
+    utc = ZoneInfo("UTC")
+    since = datetime.datetime(2012, 10, 14, 10, 0).replace(tzinfo=utc)
+    until = datetime.datetime(2012, 10, 15, 10, 0).replace(tzinfo=utc)
+
+    ArticleFactory(
+        slug="started",
+        publish_date=since.date(),
+        publish_time=datetime.time(12, 0),
+    )
+    ArticleFactory(
+        slug="started-at-since",
+        publish_date=since.date(),
+        publish_time=since.time(),
+    )
+    ArticleFactory(
+        slug="started-at-until",
+        publish_date=until.date(),
+        publish_time=until.time(),
+    )
+    ArticleFactory(
+        slug="started-before",
+        publish_date=datetime.date(2012, 10, 1),
+    )
+    ArticleFactory(
+        slug="not-started",
+        publish_date=datetime.date(2012, 10, 16),
+    )
+    ArticleFactory(
+        slug="ended",
+        publish_date=datetime.date(2012, 10, 1),
+        publish_end=datetime.datetime(2012, 10, 15, 8, 0).replace(tzinfo=utc),
+    )
+    ArticleFactory(
+        slug="not-ended",
+        publish_date=datetime.date(2012, 10, 1),
+        publish_end=datetime.datetime(2012, 10, 16, 8, 0).replace(tzinfo=utc),
+    )
+
+    assert sorted(
+        Article.objects.get_transitions(since, until=until).values_list(
+            "slug", flat=True
+        )
+    ) == ["ended", "started", "started-at-until"]
+
+    # Same period with an offset is compared in UTC
+    paris = ZoneInfo("Europe/Paris")
+    assert sorted(
+        Article.objects.get_transitions(
+            since.astimezone(paris), until=until.astimezone(paris)
+        ).values_list("slug", flat=True)
+    ) == ["ended", "started", "started-at-until"]
+
+
+def test_article_managers_get_for_category_tree(db, django_assert_num_queries):
+    """
+    Articles from a category and its descendants should be returned once each without
+    a DISTINCT clause.
+    """
+    root = CategoryFactory(title="Root")
+    child = CategoryFactory(title="Child")
+    child.move_into(root)
+    child.refresh_from_db()
+    grandchild = CategoryFactory(title="Grandchild")
+    grandchild.move_into(child)
+    other = CategoryFactory(title="Other")
+
+    ArticleFactory(slug="root", fill_categories=[root])
+    ArticleFactory(slug="both", fill_categories=[child, grandchild])
+    ArticleFactory(slug="deep", fill_categories=[grandchild])
+    ArticleFactory(slug="other", fill_categories=[other])
+    ArticleFactory(slug="orphan")
+
+    queryset = Article.objects.get_for_category_tree(root).order_by(
+        *Article.COMMON_ORDER_BY
+    )
+    assert "DISTINCT" not in str(queryset.query)
+
+    with django_assert_num_queries(1):
+        assert sorted(queryset.values_list("slug", flat=True)) == [
+            "both", "deep", "root",
+        ]
+
+    assert sorted(
+        Article.objects.get_for_category_tree(child).values_list("slug", flat=True)
+    ) == ["both", "deep"]
+
+    assert sorted(
+        Article.objects.get_for_category_tree(other).values_list("slug", flat=True)
+    ) == ["other"]
+
+
+@freeze_time("2012-10-15 10:00:00")
+def test_article_managers_get_next_transition(db):
+    """
+    Next transition should be the nearest publication start or end of published
+    articles.
+    """
+    utc = ZoneInfo("UTC")
+    now = datetime.datetime(2012, 10, 15, 10, 0).replace(tzinfo=utc)
+
+    assert Article.objects.get_next_transition() is None
+
+    ArticleFactory(publish_date=datetime.date(2012, 10, 1))
+    ArticleFactory(
+        status=STATUS_DRAFT,
+        publish_date=now.date(),
+        publish_time=datetime.time(10, 5),
+    )
+    assert Article.objects.get_next_transition() is None
+
+    ArticleFactory(publish_date=datetime.date(2012, 10, 16))
+    assert Article.objects.get_next_transition() == datetime.datetime(
+        2012, 10, 16, 10, 0
+    ).replace(tzinfo=utc)
+
+    ArticleFactory(
+        publish_date=datetime.date(2012, 10, 1),
+        publish_end=datetime.datetime(2012, 10, 15, 18, 0).replace(tzinfo=utc),
+    )
+    assert Article.objects.get_next_transition() == datetime.datetime(
+        2012, 10, 15, 18, 0
+    ).replace(tzinfo=utc)
+
+    ArticleFactory(publish_date=now.date(), publish_time=datetime.time(12, 30))
+    assert Article.objects.get_next_transition(target_date=now) == datetime.datetime(
+        2012, 10, 15, 12, 30
+    ).replace(tzinfo=utc)
+
+
+@freeze_time("2012-10-15 10:00:00")
+def test_article_managers_resolve_related(db, django_assert_num_queries):
+    """
+    Method should resolve the related articles of many articles with a query per
+    language and give the same results than ``Article.get_related``.
+    """
+    yesterday = datetime.date(2012, 10, 14)
+
+    shared = ArticleFactory(title="shared", publish_date=yesterday)
+    draft = ArticleFactory(title="draft", publish_date=yesterday, status=STATUS_DRAFT)
+    french = ArticleFactory(title="french", publish_date=yesterday, language="fr")
+    other_french = ArticleFactory(
+        title="other french", publish_date=yesterday, language="fr"
+    )
+
+    first = ArticleFactory(
+        title="first",
+        publish_date=yesterday,
+        fill_related=[shared, draft, french],
+    )
+    second = ArticleFactory(
+        title="second",
+        publish_date=yesterday,
+        fill_related=[shared],
+    )
+    alone = ArticleFactory(title="alone", publish_date=yesterday)
+    third = ArticleFactory(
+        title="third",
+        publish_date=yesterday,
+        language="fr",
+        fill_related=[other_french, first],
+    )
+
+    def published(queryset, language):
+        return queryset.get_published(language=language)
+
+    expected = {
+        article.title: [item.title for item in article.get_related(published)]
+        for article in [first, second, alone, third]
+    }
+    assert expected == {
+        "first": ["shared"],
+        "second": ["shared"],
+        "alone": [],
+        "third": ["other french"],
+    }
+
+    sources = list(
+        Article.objects.filter(pk__in=[first.pk, second.pk, alone.pk, third.pk])
+    )
+    # A query for each language
+    with django_assert_num_queries(2):
+        Article.objects.resolve_related(sources, filter_func=published)
+
+    with django_assert_num_queries(0):
+        assert {
+            article.title: [item.title for item in article.get_related()]
+            for article in sources
+        } == expected
+
+        # Same filtering function still uses the resolved articles
+        assert {
+            article.title: [item.title for item in article.get_related(published)]
+            for article in sources
+        } == expected
+
+    # Without filtering function only the language is filtered
+    Article.objects.resolve_related(sources)
+    source = [item for item in sources if item.pk == first.pk][0]
+    assert [item.title for item in source.get_related()] == ["draft", "shared"]
+
+    # Another filtering function is not ignored, related articles are queried
+    with django_assert_num_queries(1):
+        assert [item.title for item in source.get_related(published)] == ["shared"]
+
+    # Filtering function is not pickled with the object
+    Article.objects.resolve_related([source], filter_func=published)
+    restored = pickle.loads(pickle.dumps(source))
+    assert not hasattr(restored, "prefetched_related_filter")
+    assert [item.title for item in restored.get_related()] == ["shared"]
+
+    assert Article.objects.resolve_related([]) == []
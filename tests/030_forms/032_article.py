@@ -1,6 +1,7 @@
 from pathlib import Path
 
 from django.core.files.uploadedfile import SimpleUploadedFile
+from django.urls import reverse
 
 from lotus.factories import ArticleFactory, CategoryFactory
 from lotus.forms import ArticleAdminForm
@@ -410,7 +411,8 @@ def test_article_admin_category_change_validation(db):
 
 def test_article_preview_modelchoice_create_labels(db):
     """
-    Admin create form should have language name suffixes on each model choice option.
+    Admin create form should have language name suffixes on each model choice and
+    relation widgets should not render any choices since they are autocompleted.
     """
     # Create new objects
     CategoryFactory(title="garlic", language="en")
@@ -419,60 +421,77 @@ def test_article_preview_modelchoice_create_labels(db):
     ArticleFactory(title="egg", language="en")
     ArticleFactory(title="baguette", language="fr")
 
-    # Build form and get its simple HTML representation to parse it
     f = ArticleAdminForm()
-    content = f.as_p()
-    dom = html_pyquery(content)
 
-    originals = dom.find("#id_original option")
-    assert [item.text for item in originals] == [
-        f.fields["original"].empty_label,
+    def field_labels(name):
+        return [
+            f.fields[name].label_from_instance(item)
+            for item in f.fields[name].queryset
+        ]
+
+    assert field_labels("original") == [
         "baguette [Français]",
         "egg [English]",
     ]
-
-    relateds = dom.find("#id_related option")
-    assert [item.text for item in relateds] == [
+    assert field_labels("related") == [
         "baguette [Français]",
         "egg [English]",
     ]
-
-    categories = dom.find("#id_categories option")
-    assert [item.text for item in categories] == [
+    assert field_labels("categories") == [
         "ail [Français]",
         "garlic [English]",
     ]
 
+    # Build form and get its simple HTML representation to parse it
+    dom = html_pyquery(f.as_p())
+    assert [item.get("value") for item in dom.find("#id_original option")] == [""]
+    assert len(dom.find("#id_related option")) == 0
+    assert len(dom.find("#id_categories option")) == 0
+
 
 def test_article_preview_modelchoice_change_labels(db):
     """
-    Admin change form should have language names in model choices fields.
+    Admin change form should have language names in model choices fields and
+    relation widgets should only render the selected choices.
     """
     # Create new objects
     CategoryFactory(title="garlic", language="en")
-    CategoryFactory(title="ail", language="fr")
+    ail = CategoryFactory(title="ail", language="fr")
 
     ArticleFactory(title="egg", language="en")
-    obj_fr = ArticleFactory(title="baguette", language="fr")
+    obj_fr = ArticleFactory(title="baguette", language="fr", fill_categories=[ail])
     ArticleFactory(title="omelette", language="fr")
 
-    # Build form and get its simple HTML representation to parse it
     f = ArticleAdminForm({"tags": []}, instance=obj_fr)
-    content = f.as_p()
-    dom = html_pyquery(content)
 
-    originals = dom.find("#id_original option")
-    assert [item.text for item in originals] == [
-        f.fields["original"].empty_label,
+    def field_labels(name):
+        return [
+            f.fields[name].label_from_instance(item)
+            for item in f.fields[name].queryset
+        ]
+
+    assert field_labels("original") == [
         "egg [English]",
     ]
-
-    relateds = dom.find("#id_related option")
-    assert [item.text for item in relateds] == [
+    assert field_labels("related") == [
         "omelette [Français]",
     ]
+    assert field_labels("categories") == [
+        "ail [Français]",
+    ]
 
-    categories = dom.find("#id_categories option")
-    assert [item.text for item in categories] == [
+    # Build form and get its simple HTML representation to parse it
+    f = ArticleAdminForm(instance=obj_fr)
+    dom = html_pyquery(f.as_p())
+    assert [item.text for item in dom.find("#id_categories option")] == [
         "ail [Français]",
     ]
+    assert len(dom.find("#id_related option")) == 0
+
+    # Widgets forward the edited article to autocomplete views
+    assert dom.find("#id_original")[0].get("data-autocomplete-light-url") == (
+        reverse("lotus:article-autocomplete")
+    )
+    assert dom.find("#id_categories")[0].get("data-autocomplete-light-url") == (
+        reverse("lotus:category-autocomplete")
+    )
@@ -386,3 +386,64 @@ def test_tag_translation_siblings_html_category(db):
     dom = html_pyquery(rendered)
     items = dom.find(".sibling a")
     assert [item.text for item in items] == ["de", "fr"]
+
+
+def test_tag_prefetch_translation_siblings(db, settings, django_assert_num_queries):
+    """
+    Tag "prefetch_translation_siblings" should resolve siblings for many objects with
+    a single query and tag "translation_siblings" should then reuse them without any
+    query, with the same results than without prefetching.
+    """
+    utc = ZoneInfo("UTC")
+    now = datetime.datetime(2012, 10, 15, 10, 0).replace(tzinfo=utc)
+    tomorrow = datetime.datetime(2012, 10, 16, 10, 0).replace(tzinfo=utc)
+
+    articles = [
+        multilingual_article(
+            langs=["fr", "de"],
+            publish_date=now.date(),
+            publish_time=(now - datetime.timedelta(hours=1)).time(),
+            contents={
+                "de": {
+                    "publish_date": tomorrow.date(),
+                },
+            },
+        )["original"]
+        for i in range(3)
+    ]
+
+    context = Context({
+        "lotus_now": now,
+        settings.LOTUS_PREVIEW_VARNAME: False,
+    })
+    expected = [translation_siblings(context, item) for item in articles]
+
+    template = Template(
+        "{% load lotus %}"
+        "{% prefetch_translation_siblings articles %}"
+        "{% for article in articles %}"
+        "{% translation_siblings article as stats %}"
+        "{{ article.id }}:{% for item in stats.siblings %}{{ item.language }}"
+        "{% endfor %}:{{ stats.available_languages|join:',' }};"
+        "{% endfor %}"
+    )
+
+    with django_assert_num_queries(1):
+        rendered = template.render(Context({
+            "articles": articles,
+            "lotus_now": now,
+            settings.LOTUS_PREVIEW_VARNAME: False,
+        }))
+
+    assert rendered == "".join([
+        "{}:{}:{};".format(
+            item["source"].id,
+            "".join([sibling.language for sibling in item["siblings"]]),
+            ",".join(item["available_languages"]),
+        )
+        for item in expected
+    ])
+    assert "fr:de;" in rendered
+
+    # Siblings are always a list
+    assert isinstance(expected[0]["siblings"], list)
@@ -10,10 +10,11 @@ except ModuleNotFoundError:
     from backports.zoneinfo import ZoneInfo
 
 from django.contrib.auth.models import AnonymousUser
-from django.template import Context
+from django.template import Context, Template
 
 from lotus.choices import STATUS_DRAFT
 from lotus.factories import ArticleFactory
+from lotus.models import Article
 from lotus.templatetags.lotus import article_get_related
 from lotus.views.mixins import ArticleFilterAbstractView
 
@@ -84,3 +85,48 @@ def test_tag_get_related_render(db, settings, rf):
         article
     )
     assert sorted([item.title for item in relateds]) == ["published yesterday"]
+
+
+@freeze_time("2012-10-15 10:00:00")
+def test_tag_prefetch_article_related(db, settings, rf, django_assert_num_queries):
+    """
+    Tag "prefetch_article_related" should resolve related articles for many articles
+    at once so tag "article_get_related" does not perform queries anymore.
+    """
+    settings.LANGUAGE_CODE = "en"
+
+    filternator = ArticleFilterAbstractView()
+    filternator.request = rf.get("/")
+    filternator.request.user = AnonymousUser()
+
+    yesterday = datetime.date(2012, 10, 14)
+    published = ArticleFactory(title="published", publish_date=yesterday)
+    draft = ArticleFactory(title="draft", publish_date=yesterday, status=STATUS_DRAFT)
+
+    for index in range(3):
+        ArticleFactory(
+            title="source {}".format(index),
+            publish_date=yesterday,
+            fill_related=[published, draft],
+        )
+
+    articles = Article.objects.filter(title__startswith="source").order_by("title")
+    template = Template(
+        "{% load lotus %}"
+        "{% prefetch_article_related articles %}"
+        "{% for article in articles %}"
+        "{% article_get_related article as relateds %}"
+        "{{ article.title }}:{% for item in relateds %}{{ item.title }}{% endfor %};"
+        "{% endfor %}"
+    )
+
+    # Source articles and their related articles
+    with django_assert_num_queries(2):
+        rendered = template.render(Context({
+            "articles": articles,
+            "article_filter_func": filternator.apply_article_lookups,
+        }))
+
+    assert rendered == (
+        "source 0:published;source 1:published;source 2:published;"
+    )
@@ -1,14 +1,21 @@
+import datetime
 import json
 
 import pytest
+from freezegun import freeze_time
 
+from django.contrib.auth.models import AnonymousUser
 from django.template import Context, Template, TemplateSyntaxError
 from django.test.html import parse_html
 
+from lotus.choices import STATUS_DRAFT
 from lotus.models import Category
-from lotus.factories import CategoryFactory
-from lotus.templatetags.lotus import get_categories, get_category_tree_html
+from lotus.factories import ArticleFactory, CategoryFactory
+from lotus.templatetags.lotus import (
+    get_categories, get_category_articles, get_category_tree_html,
+)
 from lotus.utils.tests import html_pyquery
+from lotus.views.mixins import ArticleFilterAbstractView
 
 
 def test_languages(db, rf):
@@ -155,3 +162,49 @@ def test_tree_rendering(tests_settings, db, rf):
     )
 
     assert parse_html(rendered_template) == parse_html(expected)
+
+
+@freeze_time("2012-10-15 10:00:00")
+def test_get_category_articles(db, rf):
+    """
+    Tag should list category articles in category language, including articles
+    from descendants when required and publication filtering when a filtering
+    function is in context.
+    """
+    filternator = ArticleFilterAbstractView()
+    filternator.request = rf.get("/")
+    filternator.request.user = AnonymousUser()
+
+    picsou = CategoryFactory(title="Picsou", slug="picsou")
+    donald = CategoryFactory(title="Donald", slug="donald")
+    donald.move_into(picsou)
+
+    yesterday = datetime.date(2012, 10, 14)
+    ArticleFactory(slug="direct", publish_date=yesterday, fill_categories=[picsou])
+    ArticleFactory(slug="nested", publish_date=yesterday, fill_categories=[donald])
+    ArticleFactory(
+        slug="draft",
+        publish_date=yesterday,
+        status=STATUS_DRAFT,
+        fill_categories=[donald],
+    )
+    ArticleFactory(
+        slug="french",
+        publish_date=yesterday,
+        language="fr",
+    ).categories.add(donald)
+
+    def get_slugs(context, **kwargs):
+        return sorted([
+            item.slug for item in get_category_articles(context, picsou, **kwargs)
+        ])
+
+    assert get_slugs(Context()) == ["direct"]
+    assert get_slugs(Context(), descendants=True) == ["direct", "draft", "nested"]
+    assert get_slugs(
+        Context({"article_filter_func": filternator.apply_article_lookups}),
+        descendants=True,
+    ) == ["direct", "nested"]
+
+    with pytest.raises(TemplateSyntaxError):
+        get_category_articles(Context(), "picsou")
@@ -2,7 +2,7 @@ import pytest
 
 from django.template import TemplateSyntaxError
 
-from lotus.factories import AlbumFactory
+from lotus.factories import AlbumFactory, AlbumItemFactory
 from lotus.templatetags.lotus import get_album_html
 from lotus.utils.tests import html_pyquery
 
@@ -62,3 +62,40 @@ def test_album_render(db):
     ]
 
     assert rendered_items == expected_items
+
+
+def test_album_render_cache(db, settings, django_assert_num_queries):
+    """
+    Rendered album should be served from cache until album or its items change.
+    """
+    settings.LOTUS_ALBUM_CACHE_TIMEOUT = 60
+
+    album = AlbumFactory(fill_items=2)
+    album.refresh_from_db()
+
+    rendered = get_album_html({}, album)
+
+    with django_assert_num_queries(0):
+        assert get_album_html({}, album) == rendered
+
+    AlbumItemFactory(album=album, title="Added item")
+    album.refresh_from_db()
+
+    dom = html_pyquery(get_album_html({}, album))
+    assert len(dom.find(".albumitems .item")) == 3
+
+
+def test_album_render_nocache(db, settings):
+    """
+    Album cache can be disabled.
+    """
+    settings.LOTUS_ALBUM_CACHE_TIMEOUT = 0
+
+    album = AlbumFactory(fill_items=1)
+    get_album_html({}, album)
+
+    # Item added without refreshing album object is still rendered
+    AlbumItemFactory(album=album)
+
+    dom = html_pyquery(get_album_html({}, album))
+    assert len(dom.find(".albumitems .item")) == 2
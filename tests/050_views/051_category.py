@@ -10,6 +10,7 @@ from sorl.thumbnail.conf import settings as sorl_settings
 from lotus.choices import STATUS_DRAFT
 from lotus.factories import ArticleFactory, AuthorFactory, CategoryFactory
 from lotus.utils.tests import html_pyquery, decode_response_or_string
+from lotus.views import CategoryDetailView
 
 
 # Shortcuts for shorter variable names
@@ -390,6 +391,46 @@ def test_category_view_detail_pagination(db, client):
     assert len(items) == 1
 
 
+def test_category_view_detail_descendants(db, client, monkeypatch):
+    """
+    Category detail should list articles from its descendants only when enabled and
+    paginate them without duplicates.
+    """
+    picsou = CategoryFactory(title="Picsou", slug="picsou")
+    donald = CategoryFactory(title="Donald", slug="donald")
+    donald.move_into(picsou)
+    donald.refresh_from_db()
+    riri = CategoryFactory(title="Riri", slug="riri")
+    riri.move_into(donald)
+
+    ArticleFactory(title="Picsou article", fill_categories=[picsou])
+    ArticleFactory.create_batch(
+        settings.LOTUS_ARTICLE_PAGINATION,
+        fill_categories=[donald, riri],
+    )
+
+    def get_titles(url):
+        response = client.get(url)
+        assert response.status_code == 200
+        dom = html_pyquery(response)
+        return [
+            item.text.strip()
+            for item in dom.find(
+                "#lotus-content .category-detail .articles .article .title"
+            )
+        ]
+
+    assert get_titles(picsou.get_absolute_url()) == ["Picsou article"]
+
+    monkeypatch.setattr(CategoryDetailView, "include_descendants", True)
+
+    page_1 = get_titles(picsou.get_absolute_url())
+    page_2 = get_titles(picsou.get_absolute_url() + "?page=2")
+    assert len(page_1) == settings.LOTUS_ARTICLE_PAGINATION
+    assert len(page_2) == 1
+    assert len(set(page_1 + page_2)) == settings.LOTUS_ARTICLE_PAGINATION + 1
+
+
 def test_category_view_detail_metas(db, client):
     """
     Detail page should have the right metas content.
@@ -488,3 +529,57 @@ def test_category_view_detail_template(db, client):
     assert response.status_code == 200
 
     assert decode_response_or_string(response) == "<p>Dummy Category template</p>"
+
+
+def test_category_view_autocomplete(db, admin_client, client):
+    """
+    Autocomplete view should be only available for admins, returning list in JSON to
+    the requests.
+    """
+    user = AuthorFactory()
+
+    CategoryFactory(title="Science", language="en")
+    CategoryFactory(title="Sausage", language="fr")
+    CategoryFactory(title="Game", language="en")
+
+    url = reverse("lotus:category-autocomplete")
+
+    # Anonymous can not reach the view
+    response = client.get(url)
+    assert response.status_code == 302
+
+    # Simple logged in user can not reach the view
+    client.force_login(user)
+    response = client.get(url)
+    assert response.status_code == 403
+
+    # Simple get request return every categories labelled with their language
+    response = admin_client.get(url)
+    assert response.status_code == 200
+    assert sorted([item["text"] for item in response.json()["results"]]) == [
+        "Game [English]",
+        "Sausage [Français]",
+        "Science [English]",
+    ]
+
+    # POST request is forbidden
+    response = admin_client.post(url, {"q": "Game"}, HTTP_ACCEPT="application/json")
+    assert response.status_code == 400
+
+    # Queryset match is basically a "startswith"
+    response = admin_client.get(url, {"q": "S"}, HTTP_ACCEPT="application/json")
+    assert sorted([item["text"] for item in response.json()["results"]]) == [
+        "Sausage [Français]",
+        "Science [English]",
+    ]
+
+
+def test_category_view_autocomplete_slug(db, client):
+    """
+    A category slug should not collide with the autocomplete URL.
+    """
+    category = CategoryFactory(slug="autocomplete")
+
+    response = client.get(category.get_absolute_url())
+    assert response.status_code == 200
+    assert response.context["category_object"] == category
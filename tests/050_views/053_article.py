@@ -15,6 +15,8 @@ from sorl.thumbnail.conf import settings as sorl_settings
 
 from django.conf import settings
 from django.contrib.auth.models import AnonymousUser
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 
 from lotus.choices import STATUS_DRAFT
@@ -22,6 +24,7 @@ from lotus.factories import (
     AlbumFactory, ArticleFactory, AuthorFactory, CategoryFactory, TagFactory,
     multilingual_article,
 )
+from lotus.models import AlbumItem
 from lotus.utils.tests import (
     get_admin_change_url, html_pyquery, decode_response_or_string
 )
@@ -949,3 +952,108 @@ def test_article_view_detail_template(db, client):
     assert response.status_code == 200
 
     assert decode_response_or_string(response) == "<p>Dummy Article template</p>"
+
+
+def test_article_with_album_prefetch(db, settings, client):
+    """
+    Article detail should join album and only query its items when rendered album is
+    not cached.
+    """
+    settings.LOTUS_ALBUM_CACHE_TIMEOUT = 60
+
+    album = AlbumFactory(fill_items=3)
+    article = ArticleFactory(album=album)
+    item_table = AlbumItem._meta.db_table
+
+    with CaptureQueriesContext(connection) as captured:
+        response = client.get(article.get_absolute_url())
+    assert response.status_code == 200
+    assert any(item_table in query["sql"] for query in captured.captured_queries)
+
+    article_object = response.context["article_object"]
+    assert "album" in article_object._state.fields_cache
+    assert "albumitems" not in getattr(
+        article_object.album, "_prefetched_objects_cache", {}
+    )
+
+    # Rendered album comes from cache
+    with CaptureQueriesContext(connection) as captured:
+        response = client.get(article.get_absolute_url())
+    assert response.status_code == 200
+    assert not any(
+        item_table in query["sql"] for query in captured.captured_queries
+    )
+    assert len(html_pyquery(response).find(".album .albumitems .item")) == 3
+
+
+def test_article_view_detail_prefetch(db, client):
+    """
+    Article detail should perform the same number of queries whatever the number of
+    its categories, authors, tags, related articles and translations.
+    """
+    # Medias are left empty to avoid thumbnail queries
+    bare = ArticleFactory(
+        cover=None,
+        image=None,
+        fill_categories=[CategoryFactory()],
+        fill_authors=[AuthorFactory()],
+        fill_tags=[TagFactory()],
+        fill_related=[ArticleFactory()],
+    )
+    filled = multilingual_article(
+        langs=["fr", "de"],
+        cover=None,
+        image=None,
+        fill_categories=[CategoryFactory(), CategoryFactory(), CategoryFactory()],
+        fill_authors=[AuthorFactory(), AuthorFactory(), AuthorFactory()],
+        fill_tags=[TagFactory(), TagFactory(), TagFactory()],
+        fill_related=[ArticleFactory(), ArticleFactory(), ArticleFactory()],
+    )["original"]
+
+    # A first request to fill the site cache
+    client.get(bare.get_absolute_url())
+
+    with CaptureQueriesContext(connection) as bare_queries:
+        response = client.get(bare.get_absolute_url())
+    assert response.status_code == 200
+
+    with CaptureQueriesContext(connection) as filled_queries:
+        response = client.get(filled.get_absolute_url())
+    assert response.status_code == 200
+
+    assert len(bare_queries) == len(filled_queries)
+
+    dom = html_pyquery(response)
+    assert len(dom.find(".categories .list-group-item")) == 3
+    assert len(dom.find(".authors .list-group-item")) == 3
+    assert len(dom.find(".tags a")) == 3
+    assert len(dom.find(".relateds .list-group-item")) == 3
+    assert len(dom.find(".siblings .sibling")) == 2
+
+
+def test_article_view_autocomplete(db, admin_client, client):
+    """
+    Autocomplete view should be only available for admins, returning list in JSON to
+    the requests.
+    """
+    ArticleFactory(title="Egg", language="en")
+    ArticleFactory(title="Baguette", language="fr")
+    ArticleFactory(title="Bacon", language="en")
+
+    url = reverse("lotus:article-autocomplete")
+
+    # Anonymous can not reach the view
+    response = client.get(url)
+    assert response.status_code == 302
+
+    # POST request is forbidden
+    response = admin_client.post(url, {"q": "Egg"}, HTTP_ACCEPT="application/json")
+    assert response.status_code == 400
+
+    # Queryset match is basically a "startswith"
+    response = admin_client.get(url, {"q": "Ba"}, HTTP_ACCEPT="application/json")
+    assert response.status_code == 200
+    assert sorted([item["text"] for item in response.json()["results"]]) == [
+        "Bacon [English]",
+        "Baguette [Français]",
+    ]
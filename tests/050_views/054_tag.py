@@ -340,3 +340,18 @@ def test_tag_view_autocomplete(db, admin_client, client, enable_preview, setting
     assert [item["text"] for item in response.json()["results"]] == [
         "Ping", "Ping pong"
     ]
+
+
+def test_tag_view_index_disabled(db, client, settings):
+    """
+    Index view should respond with a 404 when disabled from settings, setting is read
+    on each request.
+    """
+    settings.LANGUAGE_CODE = "en"
+    url = reverse("lotus:tag-index")
+
+    settings.LOTUS_ENABLE_TAG_INDEX_VIEW = False
+    assert client.get(url).status_code == 404
+
+    settings.LOTUS_ENABLE_TAG_INDEX_VIEW = True
+    assert client.get(url).status_code == 200
@@ -0,0 +1,252 @@
+import logging
+
+from django.urls import reverse
+
+from lotus.factories import (
+    AlbumFactory, AlbumItemFactory, ArticleFactory, AuthorFactory, CategoryFactory,
+    TagFactory,
+)
+from lotus.surrogates import (
+    HTTPPurgeBackend, build_listing_key, build_surrogate_key, get_key_versions,
+    get_versioned, purge_keys, set_versioned,
+)
+
+
+def get_header_keys(response):
+    return response["Surrogate-Key"].split(" ")
+
+
+def test_surrogate_headers_article_detail(db, client):
+    """
+    Article detail should list the article and every rendered related objects.
+    """
+    category = CategoryFactory()
+    author = AuthorFactory()
+    tag = TagFactory()
+    album = AlbumFactory()
+    related = ArticleFactory(cover=None, image=None)
+    article = ArticleFactory(
+        cover=None,
+        image=None,
+        album=album,
+        fill_categories=[category],
+        fill_authors=[author],
+        fill_tags=[tag],
+        fill_related=[related],
+    )
+
+    response = client.get(article.get_absolute_url())
+    assert response.status_code == 200
+
+    assert sorted(get_header_keys(response)) == sorted([
+        "lotus-article-{}".format(article.id),
+        "lotus-article-{}".format(related.id),
+        "lotus-album-{}".format(album.id),
+        "lotus-author-{}".format(author.id),
+        "lotus-category-{}".format(category.id),
+        "lotus-tag-{}".format(tag.id),
+    ])
+    assert response["Cache-Tag"] == ",".join(get_header_keys(response))
+
+
+def test_surrogate_headers_lists(db, client):
+    """
+    List views should list their listing key, their object and listed objects.
+    """
+    category = CategoryFactory()
+    tag = TagFactory()
+    article = ArticleFactory(cover=None, image=None, fill_categories=[category],
+                             fill_tags=[tag])
+
+    response = client.get(reverse("lotus:article-index"))
+    assert get_header_keys(response) == [
+        "lotus-article-list",
+        "lotus-article-{}".format(article.id),
+    ]
+
+    response = client.get(reverse("lotus:category-index"))
+    assert get_header_keys(response) == [
+        "lotus-category-list",
+        "lotus-category-{}".format(category.id),
+    ]
+
+    response = client.get(category.get_absolute_url())
+    assert get_header_keys(response) == [
+        "lotus-article-list",
+        "lotus-category-{}".format(category.id),
+        "lotus-article-{}".format(article.id),
+    ]
+
+    response = client.get(reverse("lotus:tag-detail", kwargs={"tag": tag.slug}))
+    assert get_header_keys(response) == [
+        "lotus-article-list",
+        "lotus-tag-{}".format(tag.id),
+        "lotus-article-{}".format(article.id),
+    ]
+
+
+def test_surrogate_headers_api(db, client, settings):
+    """
+    Viewsets should list returned objects on successful responses only.
+    """
+    article = ArticleFactory(cover=None, image=None)
+
+    response = client.get(reverse("lotus-api:article-list"))
+    assert get_header_keys(response) == [
+        "lotus-article-list",
+        "lotus-article-{}".format(article.id),
+    ]
+
+    response = client.get(
+        reverse("lotus-api:article-detail", kwargs={"pk": article.id})
+    )
+    assert get_header_keys(response) == ["lotus-article-{}".format(article.id)]
+
+    response = client.get(reverse("lotus-api:article-detail", kwargs={"pk": 0}))
+    assert response.status_code == 404
+    assert "Surrogate-Key" not in response
+
+    # Headers can be disabled
+    settings.LOTUS_SURROGATE_KEY_HEADERS = {}
+    response = client.get(reverse("lotus-api:article-list"))
+    assert "Surrogate-Key" not in response
+
+
+def test_purge_signals(db, caplog, django_capture_on_commit_callbacks):
+    """
+    Object changes should purge their keys with the default logging backend once
+    transaction is committed.
+    """
+    caplog.set_level(logging.INFO, logger="lotus.purge")
+
+    category = CategoryFactory()
+    album = AlbumFactory()
+    article = ArticleFactory(cover=None, image=None)
+
+    def purged():
+        keys = [
+            record.getMessage().split(": ")[1].split(" ")
+            for record in caplog.records
+            if record.name == "lotus.purge"
+        ]
+        caplog.clear()
+        return keys
+
+    with django_capture_on_commit_callbacks(execute=True) as callbacks:
+        article.save()
+    assert len(callbacks) == 1
+    assert purged() == [
+        ["lotus-article-{}".format(article.id), "lotus-article-list"],
+    ]
+
+    # Category is also purged from its changed article counters
+    with django_capture_on_commit_callbacks(execute=True):
+        article.categories.add(category)
+    assert purged() == [
+        ["lotus-category-{}".format(category.id)],
+        [
+            "lotus-article-{}".format(article.id),
+            "lotus-category-{}".format(category.id),
+        ],
+    ]
+
+    with django_capture_on_commit_callbacks(execute=True):
+        category.articles.clear()
+    assert purged() == [
+        ["lotus-category-{}".format(category.id)],
+        ["lotus-category-{}".format(category.id), "lotus-article-list"],
+    ]
+
+    with django_capture_on_commit_callbacks(execute=True):
+        AlbumItemFactory(album=album)
+    assert ["lotus-album-{}".format(album.id)] in purged()
+
+    with django_capture_on_commit_callbacks(execute=True):
+        category_id = category.id
+        category.delete()
+    assert purged() == [
+        ["lotus-category-{}".format(category_id), "lotus-category-list"],
+    ]
+
+
+def test_purge_disabled(db, settings, caplog, django_capture_on_commit_callbacks):
+    """
+    Without a purge backend nothing should be purged but the key versions still
+    change.
+    """
+    caplog.set_level(logging.INFO, logger="lotus.purge")
+    settings.LOTUS_PURGE_BACKEND = None
+
+    key = build_listing_key(CategoryFactory())
+    versions = get_key_versions([key])
+
+    with django_capture_on_commit_callbacks(execute=True):
+        purge_keys([key])
+
+    assert caplog.records == []
+    assert get_key_versions([key]) != versions
+
+
+def test_versioned_cache(db):
+    """
+    Versioned cache entries should only be dropped when one of their keys is purged.
+    """
+    set_versioned("foo", "bar", ["lotus-article-1", "lotus-tag-2"], 60)
+    set_versioned("empty", "ping", [], 60)
+    assert get_versioned("foo") == "bar"
+
+    purge_keys(["lotus-article-3", "lotus-category-list"])
+    assert get_versioned("foo") == "bar"
+    assert get_versioned("empty") == "ping"
+
+    purge_keys(["lotus-tag-2"])
+    assert get_versioned("foo") is None
+    assert get_versioned("empty") == "ping"
+    assert get_versioned("nope") is None
+
+
+def test_purge_http_backend(monkeypatch):
+    """
+    HTTP backend should post keys as JSON and never fail on connection errors.
+    """
+    sent = []
+
+    class FakeResponse:
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *args):
+            return False
+
+    def fake_urlopen(request, timeout=None):
+        sent.append(request)
+        return FakeResponse()
+
+    monkeypatch.setattr("urllib.request.urlopen", fake_urlopen)
+
+    backend = HTTPPurgeBackend("http://cdn.local/purge", headers={"X-Token": "foo"})
+    backend.purge(["lotus-article-1", "lotus-article-list"])
+
+    assert sent[0].full_url == "http://cdn.local/purge"
+    assert sent[0].get_header("X-token") == "foo"
+    assert sent[0].data == (
+        b'{"surrogate_keys": ["lotus-article-1", "lotus-article-list"]}'
+    )
+
+    def failing_urlopen(request, timeout=None):
+        raise OSError("Connection refused")
+
+    monkeypatch.setattr("urllib.request.urlopen", failing_urlopen)
+    backend.purge(["lotus-article-1"])
+
+
+def test_build_surrogate_key(settings):
+    """
+    Keys should use the model name and the prefix setting.
+    """
+    from lotus.models import Article
+
+    assert build_surrogate_key(Article, 42) == "lotus-article-42"
+
+    settings.LOTUS_SURROGATE_KEY_PREFIX = "blog"
+    assert build_listing_key(Article) == "blog-article-list"
@@ -0,0 +1,178 @@
+import datetime
+from xml.etree import ElementTree
+
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from freezegun import freeze_time
+
+from lotus.choices import STATUS_DRAFT
+from lotus.factories import (
+    ArticleFactory, AuthorFactory, CategoryFactory, TagFactory,
+)
+
+
+def get_feed_titles(response):
+    """
+    Return item titles from a RSS or Atom feed response.
+    """
+    root = ElementTree.fromstring(response.content)
+    atom = "{http://www.w3.org/2005/Atom}"
+
+    return [
+        item.text
+        for item in (
+            root.findall("channel/item/title") +
+            root.findall("{atom}entry/{atom}title".format(atom=atom))
+        )
+    ]
+
+
+def test_feed_global(db, client):
+    """
+    Global feed should only list published public articles for current language.
+    """
+    ArticleFactory(title="Published", cover=None, image=None)
+    ArticleFactory(title="Private", private=True, cover=None, image=None)
+    ArticleFactory(title="Draft", status=STATUS_DRAFT, cover=None, image=None)
+    ArticleFactory(title="French", language="fr", cover=None, image=None)
+
+    with CaptureQueriesContext(connection) as captured:
+        response = client.get(reverse("lotus:article-feed-rss"))
+
+    assert response.status_code == 200
+    assert response["Content-Type"].startswith("application/rss+xml")
+    assert get_feed_titles(response) == ["Published"]
+    assert response["Surrogate-Key"] == "lotus-article-list"
+    assert "Last-Modified" in response
+
+    # Projection does not load article content, other article queries are the next
+    # publication start and end which bound the cache timeout
+    article_queries = [
+        item["sql"] for item in captured.captured_queries
+        if 'FROM "lotus_article"' in item["sql"]
+        and '"lotus_article"."title"' in item["sql"]
+    ]
+    assert len(article_queries) == 1
+    assert '"lotus_article"."content"' not in article_queries[0]
+
+    response = client.get(reverse("lotus:article-feed-atom"))
+    assert response["Content-Type"].startswith("application/atom+xml")
+    assert get_feed_titles(response) == ["Published"]
+
+
+def test_feed_sources(db, client):
+    """
+    Category, tag and author feeds should only list their articles.
+    """
+    category = CategoryFactory(slug="cat")
+    tag = TagFactory(slug="tag")
+    author = AuthorFactory(username="writer")
+    ArticleFactory(
+        title="Related",
+        fill_categories=[category],
+        fill_tags=[tag],
+        fill_authors=[author],
+        cover=None,
+        image=None,
+    )
+    ArticleFactory(title="Other", cover=None, image=None)
+
+    for urlname, kwargs in (
+        ("lotus:category-feed-rss", {"slug": "cat"}),
+        ("lotus:category-feed-atom", {"slug": "cat"}),
+        ("lotus:tag-feed-rss", {"tag": "tag"}),
+        ("lotus:tag-feed-atom", {"tag": "tag"}),
+        ("lotus:author-feed-rss", {"username": "writer"}),
+        ("lotus:author-feed-atom", {"username": "writer"}),
+    ):
+        response = client.get(reverse(urlname, kwargs=kwargs))
+        assert response.status_code == 200
+        assert get_feed_titles(response) == ["Related"]
+
+    response = client.get(
+        reverse("lotus:category-feed-rss", kwargs={"slug": "nope"})
+    )
+    assert response.status_code == 404
+
+
+def test_feed_cache(db, client, django_capture_on_commit_callbacks):
+    """
+    Feed output should be cached until content changes.
+    """
+    article = ArticleFactory(title="Foo", cover=None, image=None)
+    url = reverse("lotus:article-feed-rss")
+
+    response = client.get(url)
+    assert get_feed_titles(response) == ["Foo"]
+
+    with CaptureQueriesContext(connection) as captured:
+        response = client.get(url)
+    assert len(captured.captured_queries) == 0
+    assert get_feed_titles(response) == ["Foo"]
+
+    with django_capture_on_commit_callbacks(execute=True):
+        article.title = "Bar"
+        article.save()
+
+    response = client.get(url)
+    assert get_feed_titles(response) == ["Bar"]
+
+
+def test_feed_cache_query_parameters(db, client):
+    """
+    Query parameters a feed does not read should not create new cache entries.
+    """
+    ArticleFactory(title="Foo", cover=None, image=None)
+    url = reverse("lotus:article-feed-rss")
+
+    client.get(url)
+
+    with CaptureQueriesContext(connection) as captured:
+        response = client.get(url, {"utm_source": "foo", "page": "2"})
+    assert len(captured.captured_queries) == 0
+    assert get_feed_titles(response) == ["Foo"]
+
+
+@freeze_time("2012-10-15 10:00:00")
+def test_feed_cache_scheduled(db, client):
+    """
+    A scheduled article should appear in cached feed as soon as it is published.
+    """
+    ArticleFactory(
+        title="Scheduled",
+        publish_date=datetime.date(2012, 10, 15),
+        publish_time=datetime.time(10, 2),
+        cover=None,
+        image=None,
+    )
+    url = reverse("lotus:article-feed-rss")
+
+    response = client.get(url)
+    assert get_feed_titles(response) == []
+
+    with freeze_time("2012-10-15 10:03:00"):
+        response = client.get(url)
+        assert get_feed_titles(response) == ["Scheduled"]
+
+
+def test_feed_conditional(db, client):
+    """
+    Feed should respond with a 304 when not modified since the newest article
+    update.
+    """
+    ArticleFactory(cover=None, image=None)
+    url = reverse("lotus:article-feed-rss")
+
+    response = client.get(url)
+    last_modified = response["Last-Modified"]
+
+    response = client.get(url, HTTP_IF_MODIFIED_SINCE=last_modified)
+    assert response.status_code == 304
+
+    response = client.get(
+        url,
+        HTTP_IF_MODIFIED_SINCE="Mon, 01 Jan 2001 00:00:00 GMT"
+    )
+    assert response.status_code == 200
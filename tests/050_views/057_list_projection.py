@@ -0,0 +1,125 @@
+import datetime
+
+import pytest
+from freezegun import freeze_time
+
+from django.urls import reverse
+
+from lotus.factories import (
+    ArticleFactory, AuthorFactory, CategoryFactory, TagFactory,
+)
+from lotus.models import Article
+from lotus.utils.tests import forbid_deferred_loading
+from lotus.views import CategoryDetailView
+
+try:
+    import rest_framework  # noqa: F401
+except ModuleNotFoundError:
+    API_AVAILABLE = False
+else:
+    API_AVAILABLE = True
+
+
+@pytest.fixture
+def listed_contents(db):
+    """
+    Published articles with every relations used in lists.
+    """
+    yesterday = datetime.date(2012, 10, 14)
+
+    author = AuthorFactory(username="picsou")
+    parent = CategoryFactory(title="Parent", slug="parent")
+    category = CategoryFactory(title="Child", slug="child")
+    category.move_into(parent)
+    tag = TagFactory(name="Pizza", slug="pizza")
+
+    related = ArticleFactory(
+        slug="related",
+        publish_date=yesterday,
+        fill_categories=[category],
+        fill_authors=[author],
+        fill_tags=[tag],
+    )
+    article = ArticleFactory(
+        slug="article",
+        publish_date=yesterday,
+        fill_categories=[category],
+        fill_authors=[author],
+        fill_tags=[tag],
+        fill_related=[related],
+    )
+    ArticleFactory(
+        slug="translation",
+        language="fr",
+        publish_date=yesterday,
+        original=article,
+    )
+
+    return {
+        "article": article,
+        "author": author,
+        "category": category,
+        "parent": parent,
+        "tag": tag,
+    }
+
+
+def test_list_projection_queryset(db):
+    """
+    List projection should defer the declared fields except the kept ones.
+    """
+    queryset = Article.objects.list_projection()
+    assert queryset.query.deferred_loading == (
+        frozenset(Article.LIST_DEFERRED_FIELDS), True
+    )
+
+    queryset = Article.objects.list_projection("lead")
+    assert "lead" not in queryset.query.deferred_loading[0]
+
+
+@freeze_time("2012-10-15 10:00:00")
+def test_list_projection_views(client, monkeypatch, listed_contents):
+    """
+    List views and sitemaps should never load a deferred article field.
+    """
+    monkeypatch.setattr(CategoryDetailView, "include_descendants", True)
+
+    urls = [
+        reverse("lotus:article-index"),
+        listed_contents["category"].get_absolute_url(),
+        listed_contents["parent"].get_absolute_url(),
+        reverse("lotus:tag-detail", kwargs={"tag": listed_contents["tag"].slug}),
+        listed_contents["author"].get_absolute_url(),
+        listed_contents["article"].get_absolute_url(),
+        "/sitemap-lotus-article.xml",
+    ]
+
+    with forbid_deferred_loading(Article):
+        for url in urls:
+            response = client.get(url)
+            assert response.status_code == 200, url
+
+
+@pytest.mark.skipif(
+    not API_AVAILABLE,
+    reason="Django REST is not available, API is disabled"
+)
+@freeze_time("2012-10-15 10:00:00")
+def test_list_projection_api(settings, api_client, listed_contents):
+    """
+    API lists and nested article lists should never load a deferred article field.
+    """
+    settings.LOTUS_API_CACHE_TIMEOUT = 0
+
+    urls = [
+        reverse("lotus-api:article-list"),
+        reverse("lotus-api:article-list") + "?expand=related,translations",
+        listed_contents["article"].get_absolute_api_url(),
+        listed_contents["parent"].get_absolute_api_url() + "?descendants=true",
+        listed_contents["author"].get_absolute_api_url(),
+    ]
+
+    with forbid_deferred_loading(Article):
+        for url in urls:
+            response = api_client.get(url)
+            assert response.status_code == 200, url
@@ -0,0 +1,136 @@
+import datetime
+
+import pytest
+from freezegun import freeze_time
+
+from django.core.cache import cache
+from django.urls import reverse
+
+from lotus.factories import ArticleFactory, AuthorFactory, CategoryFactory
+from lotus.middleware import PageCacheMiddleware
+
+
+@pytest.fixture
+def page_cache(settings):
+    """
+    Enable page cache middleware.
+    """
+    settings.MIDDLEWARE = settings.MIDDLEWARE + ["lotus.middleware.PageCacheMiddleware"]
+    settings.LOTUS_PAGE_CACHE_TIMEOUT = 600
+
+
+@freeze_time("2012-10-15 10:00:00")
+def test_page_cache_anonymous(db, client, page_cache, django_assert_num_queries):
+    """
+    Pages should be cached for anonymous users and dropped on content changes.
+    """
+    category = CategoryFactory(title="Picsou", slug="picsou")
+    ArticleFactory(
+        title="Donald",
+        publish_date=datetime.date(2012, 10, 14),
+        fill_categories=[category],
+    )
+    url = category.get_absolute_url()
+
+    response = client.get(url)
+    assert response.status_code == 200
+    assert response["X-Lotus-Page-Cache"] == "miss"
+    assert "Surrogate-Key" in response
+
+    with django_assert_num_queries(0):
+        cached = client.get(url)
+
+    assert cached["X-Lotus-Page-Cache"] == "hit"
+    assert cached.content == response.content
+    assert cached["Content-Type"] == response["Content-Type"]
+    assert cached["Surrogate-Key"] == response["Surrogate-Key"]
+
+    # Language is part of key
+    assert client.get(
+        url, HTTP_ACCEPT_LANGUAGE="fr"
+    )["X-Lotus-Page-Cache"] == "hit"
+    assert client.get(url + "?page=1")["X-Lotus-Page-Cache"] == "miss"
+
+    # Content changes drop cached pages
+    category.title = "Balthazar"
+    category.save()
+    response = client.get(url)
+    assert response["X-Lotus-Page-Cache"] == "miss"
+    assert "Balthazar" in response.content.decode()
+
+
+@freeze_time("2012-10-15 10:00:00")
+def test_page_cache_bypass(db, client, page_cache, settings):
+    """
+    Authenticated users, preview mode and other namespaces should not use cache.
+    """
+    url = reverse("lotus:article-index")
+
+    assert client.get(url)["X-Lotus-Page-Cache"] == "miss"
+    assert client.get(url)["X-Lotus-Page-Cache"] == "hit"
+
+    # Views out of Lotus namespace are not cached
+    assert "X-Lotus-Page-Cache" not in client.get("/sitemap.xml")
+
+    # Anonymous session with preview keyword is not cached
+    session = client.session
+    session[settings.LOTUS_PREVIEW_KEYWORD] = True
+    session.save()
+    assert "X-Lotus-Page-Cache" not in client.get(url)
+
+    client.logout()
+
+    # Authenticated user never use cache
+    client.force_login(AuthorFactory(is_staff=True))
+    assert "X-Lotus-Page-Cache" not in client.get(url)
+
+    # Disabled from setting
+    client.logout()
+    settings.LOTUS_PAGE_CACHE_TIMEOUT = 0
+    assert "X-Lotus-Page-Cache" not in client.get(url)
+
+
+def test_page_cache_timeout(db, settings):
+    """
+    Timeout should end on the next publication transition.
+    """
+    settings.LOTUS_PAGE_CACHE_TIMEOUT = 600
+    middleware = PageCacheMiddleware(lambda request: None)
+
+    with freeze_time("2012-10-15 10:00:00"):
+        assert middleware.get_timeout() == 600
+
+        ArticleFactory(
+            publish_date=datetime.date(2012, 10, 15),
+            publish_time=datetime.time(10, 2),
+        )
+        assert middleware.get_timeout() == 120
+
+    with freeze_time("2012-10-15 10:01:59.500"):
+        assert middleware.get_timeout() == 0
+
+
+@freeze_time("2012-10-15 10:00:00")
+def test_page_cache_scheduled(db, client, page_cache):
+    """
+    A scheduled article should appear as soon as it is published.
+    """
+    url = reverse("lotus:article-index")
+    ArticleFactory(
+        title="Scheduled",
+        publish_date=datetime.date(2012, 10, 15),
+        publish_time=datetime.time(10, 2),
+    )
+
+    response = client.get(url)
+    assert response["X-Lotus-Page-Cache"] == "miss"
+    assert "Scheduled" not in response.content.decode()
+
+    cache_key = PageCacheMiddleware(None).get_cache_key(response.wsgi_request)
+    assert cache.get(cache_key) is not None
+
+    with freeze_time("2012-10-15 10:03:00"):
+        # Cache entry is expired in locmem once the transition is reached
+        assert cache.get(cache_key) is None
+        response = client.get(url)
+        assert "Scheduled" in response.content.decode()
@@ -0,0 +1,109 @@
+import datetime
+
+import pytest
+from freezegun import freeze_time
+
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from lotus.exceptions import PrefetchProfileError
+from lotus.factories import (
+    ArticleFactory, AuthorFactory, CategoryFactory, TagFactory,
+)
+from lotus.models import Article
+from lotus.prefetches import get_list_prefetches
+from lotus.utils.tests import html_pyquery
+
+
+def test_get_list_prefetches(db, django_assert_num_queries):
+    """
+    Prefetches should be built for known relation names only and article methods
+    should use them.
+    """
+    assert get_list_prefetches([]) == []
+
+    with pytest.raises(PrefetchProfileError):
+        get_list_prefetches(["categories", "nope"])
+
+    category = CategoryFactory(title="Zoo")
+    other = CategoryFactory(title="Art")
+    french = CategoryFactory(title="French", language="fr")
+    author = AuthorFactory()
+    tag = TagFactory()
+    ArticleFactory(
+        fill_categories=[category, other, french],
+        fill_authors=[author],
+        fill_tags=[tag],
+    )
+
+    # One query for articles and one for each relation
+    with django_assert_num_queries(4):
+        article = Article.objects.prefetch_related(
+            *get_list_prefetches(["categories", "authors", "tags"], language="en")
+        ).get()
+
+    with django_assert_num_queries(0):
+        assert article.get_categories() == [other, category]
+        assert list(article.get_authors()) == [author]
+        assert list(article.get_tags()) == [tag]
+
+
+@freeze_time("2012-10-15 10:00:00")
+@pytest.mark.parametrize("staff", [False, True])
+def test_list_views_prefetch_profile(db, settings, client, admin_user, staff):
+    """
+    List views should render their article cards with a number of queries which does
+    not depend on the number of articles.
+    """
+    settings.LANGUAGE_CODE = "en"
+    if staff:
+        client.force_login(admin_user)
+
+    yesterday = datetime.date(2012, 10, 14)
+    author = AuthorFactory(username="picsou")
+    category = CategoryFactory(slug="science")
+    tag = TagFactory(slug="pizza")
+
+    def create_articles(length):
+        ArticleFactory.create_batch(
+            length,
+            cover=None,
+            image=None,
+            publish_date=yesterday,
+            fill_categories=[category, CategoryFactory()],
+            fill_authors=[author],
+            fill_tags=[tag],
+        )
+
+    urls = [
+        reverse("lotus:article-index"),
+        reverse("lotus:category-detail", kwargs={"slug": category.slug}),
+        reverse("lotus:author-detail", kwargs={"username": author.username}),
+        reverse("lotus:tag-detail", kwargs={"tag": tag.slug}),
+    ]
+
+    def count_queries():
+        counts = []
+        for url in urls:
+            with CaptureQueriesContext(connection) as context:
+                response = client.get(url)
+            assert response.status_code == 200
+            counts.append(len(context.captured_queries))
+
+        return counts
+
+    create_articles(1)
+    # First requests fill the site and session caches
+    count_queries()
+    few = count_queries()
+
+    create_articles(4)
+    many = count_queries()
+
+    assert few == many
+
+    # Cards still render their categories in the article language
+    response = client.get(urls[0])
+    dom = html_pyquery(response)
+    assert len(dom.find(".article .category")) == 10
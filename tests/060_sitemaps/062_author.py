@@ -156,3 +156,31 @@ def test_authorsitemap_xml(db, client):
     ]
 
     assert found_urls == expected_urls
+
+
+def test_authorsitemap_grouped_items(db, django_assert_num_queries):
+    """
+    Author sitemap items should be retrieved with a single query grouped on author
+    and article language.
+    """
+    carl_barks = AuthorFactory(first_name="Carl", last_name="Barks")
+    jules_verne = AuthorFactory(first_name="Jules", last_name="Verne")
+
+    ArticleFactory(language="en", fill_authors=[carl_barks, jules_verne])
+    ArticleFactory(language="en", fill_authors=[carl_barks])
+    ArticleFactory(language="fr", fill_authors=[jules_verne])
+    ArticleFactory(language="de", private=True, fill_authors=[jules_verne])
+
+    sitemap = AuthorSitemap()
+
+    with django_assert_num_queries(1):
+        items = [
+            (item.id, item.article_language)
+            for item in sitemap.items()
+        ]
+
+    assert items == [
+        (carl_barks.id, "en"),
+        (jules_verne.id, "en"),
+        (jules_verne.id, "fr"),
+    ]
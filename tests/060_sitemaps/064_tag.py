@@ -176,3 +176,42 @@ def test_tagsitemap_xml(db, client):
     ]
 
     assert found_urls == expected_urls
+
+
+def test_tagsitemap_grouped_items(db, django_assert_num_queries):
+    """
+    Tag sitemap items should be retrieved with a single query grouped on tag and
+    article language, with a latest update from published articles only.
+    """
+    utc = ZoneInfo("UTC")
+    older = datetime.datetime(2012, 10, 10, 10, 0).replace(tzinfo=utc)
+
+    cheese = TagFactory(name="Cheese", slug="cheese")
+    bread = TagFactory(name="Bread", slug="bread")
+
+    first = ArticleFactory(language="en", fill_tags=[cheese, bread])
+    ArticleFactory(language="en", fill_tags=[cheese])
+    ArticleFactory(language="fr", fill_tags=[cheese])
+    ArticleFactory(language="fr", status=STATUS_DRAFT, fill_tags=[bread])
+
+    # Make an article older to check latest update
+    ArticleFactory._meta.model.objects.filter(pk=first.pk).update(last_update=older)
+
+    sitemap = TagSitemap()
+
+    with django_assert_num_queries(1):
+        items = [
+            (item.slug, item.article_language, item.article_latest_update)
+            for item in sitemap.items()
+        ]
+
+    assert [item[:2] for item in items] == [
+        ("bread", "en"),
+        ("cheese", "en"),
+        ("cheese", "fr"),
+    ]
+    assert items[0][2] == older
+    assert items[1][2] > older
+
+    # Paginator count the grouped rows
+    assert sitemap.paginator.count == 3
@@ -252,3 +252,70 @@ def test_category_admin_form_parent_select(settings, tests_settings, db, admin_c
         "└── Item 1.1 [English]",
         "Item 2 [English]"
     ]
+
+
+def test_category_admin_form_parent_select_language(settings, tests_settings, db,
+                                                    admin_client,
+                                                    django_assert_num_queries):
+    """
+    Parent choices should be built from a single query and be limited to the edited
+    category language when setting 'LOTUS_CATEGORY_PARENT_SAME_LANGUAGE' is enabled.
+    """
+    settings.LANGUAGE_CODE = "en"
+    settings.LOTUS_CATEGORY_PARENT_SAME_LANGUAGE = True
+
+    sample = json.loads(
+        (tests_settings.fixtures_path / "category_tree.json").read_text()
+    )
+    Category.load_bulk(sample["tree"])
+
+    item_1 = Category.objects.get(slug="item-1")
+
+    with django_assert_num_queries(1):
+        choices = CategoryAdminForm.mk_dropdown_tree(Category, for_node=item_1)
+
+    assert [str(label) for pk, label in choices] == [
+        CategoryAdminForm.PARENT_EMPTY_LABEL,
+        "Item 2 [English]",
+        "Item 3 [English]",
+        "└── Item 3.1 [English]",
+        "&nbsp;&nbsp;&nbsp;&nbsp;&nbsp;&nbsp;&nbsp;&nbsp;└── Item 3.1.1 [English]",
+        "&nbsp;&nbsp;&nbsp;&nbsp;&nbsp;&nbsp;&nbsp;&nbsp;└── Item 3.1.2 [English]",
+        "&nbsp;&nbsp;&nbsp;&nbsp;&nbsp;&nbsp;&nbsp;&nbsp;└── Item 3.1.3 [English]",
+        "└── Item 3.2 [English]"
+    ]
+
+    # Creation form has no language to restrict on
+    choices = CategoryAdminForm.mk_dropdown_tree(Category)
+    assert len(choices) == 11
+
+
+def test_category_admin_form_add_subtree(settings, tests_settings, db):
+    """
+    Compatibility method 'add_subtree' should add the options of a node subtree
+    without the excluded ones and nothing for the edited node.
+    """
+    settings.LANGUAGE_CODE = "en"
+
+    sample = json.loads(
+        (tests_settings.fixtures_path / "category_tree.json").read_text()
+    )
+    Category.load_bulk(sample["tree"])
+
+    item_3 = Category.objects.get(slug="item-3")
+    item_3_1 = Category.objects.get(slug="item-3-1")
+
+    options = []
+    CategoryAdminForm.add_subtree(None, item_3, options, excluded=[item_3_1.pk])
+    assert [str(label) for pk, label in options] == [
+        "Item 3 [English]",
+        "&nbsp;&nbsp;&nbsp;&nbsp;&nbsp;&nbsp;&nbsp;&nbsp;└── Item 3.1.1 [English]",
+        "&nbsp;&nbsp;&nbsp;&nbsp;&nbsp;&nbsp;&nbsp;&nbsp;└── Item 3.1.2 [English]",
+        "&nbsp;&nbsp;&nbsp;&nbsp;&nbsp;&nbsp;&nbsp;&nbsp;└── Item 3.1.3 [English]",
+        "&nbsp;&nbsp;&nbsp;&nbsp;&nbsp;&nbsp;&nbsp;&nbsp;└── Item 3.1.4 [Français]",
+        "└── Item 3.2 [English]",
+    ]
+
+    options = []
+    CategoryAdminForm.add_subtree(item_3, item_3, options)
+    assert options == []
@@ -1,4 +1,5 @@
 import datetime
+import json
 
 from freezegun import freeze_time
 
@@ -9,6 +10,8 @@ try:
 except ModuleNotFoundError:
     from backports.zoneinfo import ZoneInfo
 
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 
 from lotus.choices import STATUS_DRAFT
@@ -181,7 +184,7 @@ def test_article_admin_list_is_published(db, admin_client):
 
 def test_article_admin_original_choices(db, admin_client):
     """
-    Choices should be limited to some constraints:
+    Choices from autocomplete views should be limited to some constraints:
 
     * 'original' field should not list items in same language, not the
       article itself and only original articles;
@@ -210,29 +213,42 @@ def test_article_admin_original_choices(db, admin_client):
     cat_en = CategoryFactory(language="en")
     CategoryFactory(language="fr")
 
-    # Get the obj detail page
-    url = get_admin_change_url(obj)
-    response = admin_client.get(url)
-
+    # The change page should not render any unselected choices
+    response = admin_client.get(get_admin_change_url(obj))
     assert response.status_code == 200
 
     dom = html_pyquery(response)
-
-    # Get available 'original' choice ids from their values
-    options = dom.find("#id_original option")
-    option_ids = [int(item.get("value")) for item in options if item.get("value")]
-
-    assert sorted(option_ids) == sorted([item.id for item in fillers_langs])
-
-    # Get available 'related' choice ids from their values
-    options = dom.find("#id_related option")
-    option_ids = [int(item.get("value")) for item in options if item.get("value")]
-
-    assert sorted(option_ids) == sorted([item.id for item in fillers_en])
-
-    # Get available 'categories' choice ids from their values
-    options = dom.find("#id_categories option")
-    option_ids = [cat_en.id]
+    assert [item.get("value") for item in dom.find("#id_original option")] == [""]
+    assert len(dom.find("#id_related option")) == 0
+    assert len(dom.find("#id_categories option")) == 0
+
+    def autocomplete_ids(urlname, forwarded):
+        response = admin_client.get(
+            reverse(urlname),
+            {"forward": json.dumps(forwarded)},
+            HTTP_ACCEPT="application/json",
+        )
+        assert response.status_code == 200
+
+        return sorted([int(item["id"]) for item in response.json()["results"]])
+
+    # Get available 'original' choice ids from autocomplete
+    assert autocomplete_ids(
+        "lotus:article-autocomplete",
+        {"article": obj.id, "relation": "original"},
+    ) == sorted([item.id for item in fillers_langs])
+
+    # Get available 'related' choice ids from autocomplete
+    assert autocomplete_ids(
+        "lotus:article-autocomplete",
+        {"article": obj.id, "relation": "related"},
+    ) == sorted([item.id for item in fillers_en])
+
+    # Get available 'categories' choice ids from autocomplete
+    assert autocomplete_ids(
+        "lotus:category-autocomplete",
+        {"article": obj.id},
+    ) == [cat_en.id]
 
 
 def test_article_admin_translate_button_empty(db, admin_client):
@@ -349,3 +365,62 @@ def test_article_admin_translate_button_expected(db, admin_client):
     original_id = dom.find("#lotus-translate-original-form input[name='original']")
     assert len(original_id) == 1
     assert int(original_id[0].get("value")) == created_beef["original"].id
+
+
+def test_article_admin_list_queries(db, admin_client):
+    """
+    Article model admin list view should not perform queries for each row.
+    """
+    originals = [ArticleFactory() for i in range(2)]
+    url = get_admin_list_url(Article)
+
+    # A first request to fill the caches
+    admin_client.get(url)
+
+    # Count queries for a list of two originals
+    with CaptureQueriesContext(connection) as base_queries:
+        response = admin_client.get(url)
+    assert response.status_code == 200
+
+    # Add more translations and articles
+    for original in originals:
+        ArticleFactory(original=original, language="fr")
+    ArticleFactory()
+
+    with CaptureQueriesContext(connection) as more_queries:
+        response = admin_client.get(url)
+    assert response.status_code == 200
+
+    assert len(base_queries) == len(more_queries)
+
+    # Articles can be ordered on publication state
+    response = admin_client.get(url, {"o": "2"})
+    assert response.status_code == 200
+
+
+def test_article_admin_list_category_filter(db, admin_client):
+    """
+    Article model admin list view should filter articles on category from the
+    autocomplete filter and only load the selected category.
+    """
+    picked = CategoryFactory(title="Picked")
+    CategoryFactory(title="Other")
+    expected = ArticleFactory(fill_categories=[picked])
+    ArticleFactory()
+
+    url = get_admin_list_url(Article)
+    response = admin_client.get(url, {"category": picked.id})
+    assert response.status_code == 200
+
+    dom = html_pyquery(response)
+    ids = [
+        int(item.get("value"))
+        for item in dom.find("#result_list td.action-checkbox input.action-select")
+    ]
+    assert ids == [expected.id]
+
+    options = dom.find(".lotus-autocomplete-filter select option[selected]")
+    assert [item.text for item in options] == ["Picked [English]"]
+    assert dom.find(".lotus-autocomplete-filter select")[0].get(
+        "data-autocomplete-light-url"
+    ) == reverse("lotus:category-autocomplete")
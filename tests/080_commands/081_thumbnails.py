@@ -0,0 +1,143 @@
+import datetime
+
+import pytest
+
+from django.core.management import CommandError, call_command
+from django.utils import timezone
+
+from sorl.thumbnail import default as sorl_default
+from sorl.thumbnail.images import ImageFile
+
+from lotus.choices import THUMBNAIL_JOB_DONE, THUMBNAIL_JOB_FAILED
+from lotus.factories import AlbumItemFactory, ArticleFactory, CategoryFactory
+from lotus.models import ThumbnailJob
+from lotus.thumbnailing import generate_thumbnails
+
+
+def test_backfill(db, settings):
+    """
+    Backfill should enqueue a job for every filled media of existing objects.
+    """
+    settings.LOTUS_THUMBNAIL_PREGENERATION = False
+
+    ArticleFactory()
+    ArticleFactory(image="")
+    CategoryFactory(cover="")
+    AlbumItemFactory()
+
+    call_command("lotus_thumbnail_backfill")
+    assert ThumbnailJob.objects.count() == 4
+
+    # Running it again won't duplicate pending jobs
+    call_command("lotus_thumbnail_backfill")
+    assert ThumbnailJob.objects.count() == 4
+
+    ThumbnailJob.objects.all().delete()
+    call_command("lotus_thumbnail_backfill", model=["lotus.albumitem"])
+    assert ThumbnailJob.objects.count() == 1
+
+
+def test_backfill_unknown_model(db):
+    """
+    Backfill should refuse model labels without thumbnail sizes.
+    """
+    with pytest.raises(CommandError):
+        call_command("lotus_thumbnail_backfill", model=["lotus.author"])
+
+
+def test_worker(db, settings):
+    """
+    Worker should process every pending jobs and thumbnails should exist in Sorl
+    key value store.
+    """
+    settings.LOTUS_THUMBNAIL_PREGENERATION = True
+
+    item = AlbumItemFactory()
+    category = CategoryFactory()
+    category_id = category.id
+    category.delete()
+
+    call_command("lotus_thumbnail_worker", workers=1)
+
+    assert [job.status for job in ThumbnailJob.objects.all()] == [
+        THUMBNAIL_JOB_DONE,
+        THUMBNAIL_JOB_DONE,
+    ]
+    assert ThumbnailJob.objects.filter(
+        model_label="lotus.category",
+        object_id=category_id,
+    ).count() == 1
+
+    thumb = generate_thumbnails(item, "media")[0]
+    assert sorl_default.kvstore.get(ImageFile(thumb.name)) is not None
+
+
+def test_worker_failure(db, settings):
+    """
+    A failing job should be marked as failed with its error.
+    """
+    settings.LOTUS_THUMBNAIL_PREGENERATION = True
+    settings.LOTUS_THUMBNAIL_SIZES = {
+        "lotus.albumitem": {
+            "media": [("300x200", {"format": "NOPE"})],
+        },
+    }
+
+    AlbumItemFactory()
+
+    call_command("lotus_thumbnail_worker", workers=1)
+
+    job = ThumbnailJob.objects.get()
+    assert job.status == THUMBNAIL_JOB_FAILED
+    assert job.attempts == 1
+    assert job.error.startswith("InvalidFormatError")
+
+
+def test_worker_retry_failed_ends(db, settings):
+    """
+    A job which always fails should be processed once for a run with retried failed
+    jobs and not be claimed anymore once it has reached the maximum attempts.
+    """
+    settings.LOTUS_THUMBNAIL_PREGENERATION = True
+    settings.LOTUS_THUMBNAIL_MAX_ATTEMPTS = 2
+    settings.LOTUS_THUMBNAIL_SIZES = {
+        "lotus.albumitem": {
+            "media": [("300x200", {"format": "NOPE"})],
+        },
+    }
+
+    AlbumItemFactory()
+
+    call_command("lotus_thumbnail_worker", workers=1, retry_failed=True)
+    job = ThumbnailJob.objects.get()
+    assert job.status == THUMBNAIL_JOB_FAILED
+    assert job.attempts == 1
+
+    call_command("lotus_thumbnail_worker", workers=1, retry_failed=True)
+    job.refresh_from_db()
+    assert job.attempts == 2
+
+    # Maximum attempts is reached
+    call_command("lotus_thumbnail_worker", workers=1, retry_failed=True)
+    job.refresh_from_db()
+    assert job.attempts == 2
+
+
+def test_worker_prune(db, settings):
+    """
+    Worker should delete the done jobs older than retention once queue is empty.
+    """
+    settings.LOTUS_THUMBNAIL_PREGENERATION = True
+    settings.LOTUS_THUMBNAIL_JOB_RETENTION = 3600
+
+    CategoryFactory()
+
+    call_command("lotus_thumbnail_worker", workers=1)
+    assert ThumbnailJob.objects.filter(status=THUMBNAIL_JOB_DONE).count() == 1
+
+    ThumbnailJob.objects.update(
+        processed=timezone.now() - datetime.timedelta(seconds=4000)
+    )
+
+    call_command("lotus_thumbnail_worker", workers=1)
+    assert ThumbnailJob.objects.count() == 0
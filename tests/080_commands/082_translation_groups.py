@@ -0,0 +1,36 @@
+import pytest
+
+from django.core.management import CommandError, call_command
+
+from lotus.factories import ArticleFactory, CategoryFactory, multilingual_article
+from lotus.models import Article, Category
+
+
+def test_translation_groups_check(db):
+    """
+    Command should detect inconsistent translation groups and only update them with
+    option 'fix'.
+    """
+    created = multilingual_article(langs=["fr"])
+    single = ArticleFactory()
+    category = CategoryFactory()
+
+    call_command("lotus_translation_groups")
+
+    translation = created["translations"]["fr"]
+    Article.objects.filter(pk=translation.pk).update(translation_group=single.pk)
+    Article.objects.filter(pk=single.pk).update(translation_group=None)
+    Category.objects.filter(pk=category.pk).update(translation_group=None)
+
+    with pytest.raises(CommandError):
+        call_command("lotus_translation_groups")
+
+    call_command("lotus_translation_groups", fix=True)
+
+    assert Article.objects.get(pk=translation.pk).translation_group == (
+        created["original"].pk
+    )
+    assert Article.objects.get(pk=single.pk).translation_group == single.pk
+    assert Category.objects.get(pk=category.pk).translation_group == category.pk
+
+    call_command("lotus_translation_groups")
@@ -0,0 +1,29 @@
+import pytest
+
+from django.core.management import CommandError, call_command
+
+from lotus.factories import ArticleFactory, CategoryFactory, TagFactory
+
+
+def test_json_benchmark(db, capsys):
+    """
+    Benchmark should output a measure for each encoder.
+    """
+    ArticleFactory(fill_categories=[CategoryFactory()], fill_tags=[TagFactory()])
+    ArticleFactory()
+
+    call_command("lotus_json_benchmark", iterations=2, host="testserver")
+
+    out = capsys.readouterr().out
+    assert "Encoding 2 article(s) 2 time(s)" in out
+    assert "* DRF JSONRenderer: " in out
+    assert "* LotusJSONRenderer (pure Python): " in out
+    assert "* ExtendedJsonEncoder: " in out
+
+
+def test_json_benchmark_empty(db):
+    """
+    Benchmark needs articles.
+    """
+    with pytest.raises(CommandError):
+        call_command("lotus_json_benchmark", host="testserver")
@@ -0,0 +1,100 @@
+import datetime
+
+import pytest
+from freezegun import freeze_time
+
+from django.contrib.sites.models import Site
+from django.core.management import CommandError, call_command
+
+from lotus.factories import (
+    ArticleFactory, AuthorFactory, CategoryFactory, TagFactory,
+)
+from lotus.views import ArticleIndexView
+
+
+@freeze_time("2012-10-15 10:00:00")
+def test_warmup(db, monkeypatch, capsys):
+    """
+    Command should request index pages for each language, detail pages from sitemaps
+    and list pages up to the given depth.
+    """
+    monkeypatch.setattr(ArticleIndexView, "paginate_by", 1)
+
+    category = CategoryFactory(slug="picsou")
+    CategoryFactory(slug="donald", language="fr")
+    ArticleFactory.create_batch(
+        2,
+        publish_date=datetime.date(2012, 10, 14),
+        fill_categories=[category],
+        fill_authors=[AuthorFactory()],
+        fill_tags=[TagFactory()],
+    )
+
+    call_command(
+        "lotus_warmup",
+        workers=1,
+        pages=3,
+        host="testserver",
+        urls=["/sitemap.xml"],
+    )
+
+    out = capsys.readouterr().out
+    # 12 index pages, 2 articles, 2 categories, 1 author, 1 tag and the sitemap
+    assert "Warming up 19 URL(s)" in out
+    # Two pages and the missing third one for English, one page and the missing
+    # second one for other languages
+    assert "* lotus:article-index: 7 request(s)" in out
+    assert "* lotus:category-index: 6 request(s)" in out
+    assert "* lotus:article-detail: 2 request(s)" in out
+    assert "* lotus:category-detail: 4 request(s)" in out
+    assert "* lotus:author-detail: 2 request(s)" in out
+    assert "* lotus:tag-detail: 2 request(s)" in out
+    assert "* django.contrib.sitemaps.views.index: 1 request(s)" in out
+    assert "with 0 failure(s)" in out
+
+
+def test_warmup_languages(db, capsys):
+    """
+    Index pages should only be requested for the given languages.
+    """
+    call_command("lotus_warmup", workers=1, languages="fr", host="testserver")
+
+    out = capsys.readouterr().out
+    assert "Warming up 4 URL(s)" in out
+
+    with pytest.raises(CommandError):
+        call_command("lotus_warmup", languages="fr,zz", host="testserver")
+
+    with pytest.raises(CommandError):
+        call_command("lotus_warmup", workers=0, host="testserver")
+
+
+def test_warmup_host(db, capsys):
+    """
+    Requests should be made for the current Site domain by default.
+    """
+    site = Site.objects.get_current()
+    site.domain = "lotus.example.com"
+    site.save()
+
+    call_command("lotus_warmup", workers=1, languages="fr")
+
+    out = capsys.readouterr().out
+    assert "Warming up 4 URL(s) for host 'lotus.example.com'" in out
+    assert "with 0 failure(s)" in out
+
+    call_command("lotus_warmup", workers=1, languages="fr", host="testserver")
+
+    out = capsys.readouterr().out
+    assert "Warming up 4 URL(s) for host 'testserver'" in out
+
+
+def test_warmup_threads(transactional_db, capsys):
+    """
+    Requests can be made from a pool of threads.
+    """
+    call_command("lotus_warmup", workers=2, host="testserver")
+
+    out = capsys.readouterr().out
+    assert "* lotus:category-index: 3 request(s)" in out
+    assert "with 0 failure(s)" in out
@@ -0,0 +1,68 @@
+import pytest
+
+from django.core.management import CommandError, call_command
+
+from lotus.management.commands.lotus_import_benchmark import (
+    SETUP_MARKER, Command, parse_importtime,
+)
+
+
+def test_parse_importtime():
+    """
+    Parser should split Django setup from the entry point imports and sum self times
+    per top level package.
+    """
+    output = "\n".join([
+        "import time: self [us] | cumulative | imported package",
+        "import time:       100 |        300 | django",
+        "import time:       200 |        200 |   django.apps",
+        SETUP_MARKER,
+        "import time:        50 |         50 |     dal.autocomplete",
+        "import time:        20 |         70 |   lotus.views",
+        "import time:        10 |         80 | lotus.urls",
+        "import time:         5 |          5 | lotus.templatetags",
+        "Some other error output",
+    ])
+
+    assert parse_importtime(output) == {
+        "setup": 300,
+        "total": 85,
+        "modules": 4,
+        "packages": {"dal": 50, "lotus": 35},
+    }
+
+
+@pytest.mark.parametrize("entry_point", ["lotus.urls", "lotus.api_urls"])
+def test_import_benchmark_without_admin(entry_point):
+    """
+    Public entry points should not import the admin only libraries when admin is not
+    enabled.
+    """
+    measures = Command().measure(entry_point, ["django.contrib.admin"])
+
+    assert measures["total"] > 0
+    assert "lotus" in measures["packages"]
+    assert "dal" not in measures["packages"]
+    assert "ckeditor" not in measures["packages"]
+    assert "ckeditor_uploader" not in measures["packages"]
+
+
+def test_import_benchmark_command(capsys):
+    """
+    Command should report each entry point and fail when one is over budget.
+    """
+    call_command("lotus_import_benchmark", "lotus.templatetags.lotus", top=1)
+
+    out = capsys.readouterr().out
+    assert out.startswith("* lotus.templatetags.lotus: ")
+    assert len(out.strip().splitlines()) == 2
+
+    with pytest.raises(CommandError) as excinfo:
+        call_command("lotus_import_benchmark", "lotus.templatetags.lotus", budget=0.0)
+
+    assert str(excinfo.value) == (
+        "Import time budget of 0.0ms exceeded by: lotus.templatetags.lotus"
+    )
+
+    with pytest.raises(CommandError):
+        call_command("lotus_import_benchmark", "lotus.nope")
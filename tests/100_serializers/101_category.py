@@ -194,6 +194,7 @@ def test_category_categoryserializer(db, settings, api_client):
         "cover": "http://testserver" + ping.cover.url,
         "cover_alt_text": ping.cover_alt_text,
         "description": ping.description,
+        "article_counts": {"direct": 0, "subtree": 0},
         "depth": ping.depth,
         "template": get_category_template_default(),
     }
@@ -266,6 +267,7 @@ def test_category_categoryserializer(db, settings, api_client):
         "cover": "http://testserver" + ping.cover.url,
         "cover_alt_text": ping.cover_alt_text,
         "description": ping.description,
+        "article_counts": {"direct": 0, "subtree": 0},
         "depth": ping.depth,
         "template": get_category_template_default(),
     }
@@ -315,6 +317,7 @@ def test_category_resume_serializer(db, api_client):
         "lead": ping.lead,
         "cover": "http://testserver" + ping.cover.url,
         "description": ping.description,
+        "article_counts": {"direct": 0, "subtree": 0},
     }
 
 
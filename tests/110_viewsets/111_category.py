@@ -3,7 +3,9 @@ from freezegun import freeze_time
 
 from django.urls import reverse
 
-from lotus.factories import CategoryFactory, multilingual_category
+from lotus.factories import (
+    ArticleFactory, AuthorFactory, CategoryFactory, multilingual_category,
+)
 
 try:
     import rest_framework  # noqa: F401
@@ -43,6 +45,7 @@ def test_category_viewset_list_payload(db, settings, api_client):
         "lead": category.lead,
         "cover": "http://testserver" + category.cover.url,
         "description": category.description,
+        "article_counts": {"direct": 0, "subtree": 0},
     }
 
 
@@ -177,3 +180,56 @@ def test_category_viewset_allow_language_safe_disabled(db, settings, api_client)
     # French category is still reachable with english language
     response = api_client.get(oeuf.get_absolute_api_url(), HTTP_ACCEPT_LANGUAGE="en")
     assert response.status_code == 404
+
+
+def test_category_viewset_article_counts(db, api_client):
+    """
+    Private articles should only be counted for authenticated users.
+    """
+    category = CategoryFactory()
+    ArticleFactory(fill_categories=[category])
+    ArticleFactory(private=True, fill_categories=[category])
+
+    url = category.get_absolute_api_url()
+
+    response = api_client.get(url)
+    assert response.status_code == 200
+    assert response.json()["article_counts"] == {"direct": 1, "subtree": 1}
+
+    api_client.force_login(AuthorFactory())
+    response = api_client.get(url)
+    assert response.status_code == 200
+    assert response.json()["article_counts"] == {"direct": 2, "subtree": 2}
+
+
+def test_category_viewset_detail_descendants(db, settings, api_client):
+    """
+    Detail articles should include descendant articles once each when required from
+    query parameter or setting.
+    """
+    parent = CategoryFactory()
+    child = CategoryFactory()
+    child.move_into(parent)
+    child.refresh_from_db()
+    grandchild = CategoryFactory()
+    grandchild.move_into(child)
+
+    direct = ArticleFactory(fill_categories=[parent])
+    nested = ArticleFactory(fill_categories=[child, grandchild])
+
+    url = parent.get_absolute_api_url()
+
+    def get_article_urls(url):
+        response = api_client.get(url)
+        assert response.status_code == 200
+        return sorted([item["detail_url"] for item in response.json()["articles"]])
+
+    both = sorted([direct.get_absolute_url(), nested.get_absolute_url()])
+
+    assert get_article_urls(url) == [direct.get_absolute_url()]
+    assert get_article_urls(url + "?descendants=true") == both
+    assert get_article_urls(url + "?descendants=false") == [direct.get_absolute_url()]
+
+    settings.LOTUS_CATEGORY_INCLUDE_DESCENDANTS = True
+    assert get_article_urls(url) == both
+    assert get_article_urls(url + "?descendants=0") == [direct.get_absolute_url()]
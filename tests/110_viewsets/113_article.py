@@ -11,12 +11,16 @@ except ModuleNotFoundError:
     from backports.zoneinfo import ZoneInfo
 
 from django.conf import settings
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 
 from lotus.choices import STATUS_DRAFT
 from lotus.factories import (
-    ArticleFactory, AuthorFactory, CategoryFactory, TagFactory, multilingual_article,
+    AlbumFactory, AlbumItemFactory, ArticleFactory, AuthorFactory, CategoryFactory,
+    TagFactory, multilingual_article,
 )
+from lotus.models import AlbumItem
 
 try:
     import rest_framework  # noqa: F401
@@ -465,3 +469,97 @@ def test_article_viewset_allow_language_safe_disabled(db, settings, api_client):
 
     response = api_client.get(salut.get_absolute_api_url(), HTTP_ACCEPT_LANGUAGE="en")
     assert response.status_code == 404
+
+
+def test_article_viewset_detail_album(db, settings, api_client):
+    """
+    Detail payload should include album items and the album payload should be renewed
+    once an item is added.
+    """
+    settings.LOTUS_ALBUM_CACHE_TIMEOUT = 60
+
+    album = AlbumFactory(fill_items=2)
+    article = ArticleFactory(album=album)
+
+    response = api_client.get(article.get_absolute_api_url())
+    assert response.status_code == 200
+    assert len(response.json()["album"]["items"]) == 2
+
+    AlbumItemFactory(album=album)
+
+    response = api_client.get(article.get_absolute_api_url())
+    assert response.status_code == 200
+    assert len(response.json()["album"]["items"]) == 3
+
+
+def test_article_viewset_detail_album_cache(db, settings, api_client):
+    """
+    Album items should not be queried when album payload comes from cache.
+    """
+    settings.LOTUS_ALBUM_CACHE_TIMEOUT = 60
+    # Article payload cache would hide the album one
+    settings.LOTUS_API_CACHE_TIMEOUT = 0
+
+    album = AlbumFactory(fill_items=2)
+    article = ArticleFactory(album=album)
+    item_table = AlbumItem._meta.db_table
+
+    with CaptureQueriesContext(connection) as captured:
+        response = api_client.get(article.get_absolute_api_url())
+    assert response.status_code == 200
+    assert any(item_table in query["sql"] for query in captured.captured_queries)
+
+    with CaptureQueriesContext(connection) as captured:
+        response = api_client.get(article.get_absolute_api_url())
+    assert response.status_code == 200
+    assert not any(
+        item_table in query["sql"] for query in captured.captured_queries
+    )
+    assert len(response.json()["album"]["items"]) == 2
+
+
+def test_article_viewset_detail_prefetch(db, settings, api_client):
+    """
+    Detail payload should be built with the same number of queries whatever the
+    number of article relations.
+    """
+    # Payload cache would hide the serialization queries
+    settings.LOTUS_API_CACHE_TIMEOUT = 0
+
+    bare = ArticleFactory(
+        cover=None,
+        image=None,
+        fill_categories=[CategoryFactory()],
+        fill_authors=[AuthorFactory()],
+        fill_tags=[TagFactory()],
+        fill_related=[ArticleFactory()],
+    )
+    filled = multilingual_article(
+        langs=["fr", "de"],
+        cover=None,
+        image=None,
+        fill_categories=[CategoryFactory(), CategoryFactory(), CategoryFactory()],
+        fill_authors=[AuthorFactory(), AuthorFactory(), AuthorFactory()],
+        fill_tags=[TagFactory(), TagFactory(), TagFactory()],
+        fill_related=[ArticleFactory(), ArticleFactory(), ArticleFactory()],
+    )["original"]
+
+    # A first request to fill the site cache
+    api_client.get(bare.get_absolute_api_url())
+
+    with CaptureQueriesContext(connection) as bare_queries:
+        response = api_client.get(bare.get_absolute_api_url())
+    assert response.status_code == 200
+
+    with CaptureQueriesContext(connection) as filled_queries:
+        response = api_client.get(filled.get_absolute_api_url())
+    assert response.status_code == 200
+
+    assert len(bare_queries) == len(filled_queries)
+
+    payload = response.json()
+    assert len(payload["categories"]) == 3
+    assert len(payload["authors"]) == 3
+    assert len(payload["tags"]) == 3
+    assert len(payload["related"]) == 3
+    assert len(payload["translations"]) == 2
@@ -0,0 +1,183 @@
+import pytest
+
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from lotus.factories import (
+    ArticleFactory, AuthorFactory, CategoryFactory, TagFactory,
+)
+
+try:
+    import rest_framework  # noqa: F401
+except ModuleNotFoundError:
+    API_AVAILABLE = False
+else:
+    API_AVAILABLE = True
+
+
+pytestmark = pytest.mark.skipif(
+    not API_AVAILABLE,
+    reason="Django REST is not available, API is disabled"
+)
+
+
+def test_article_viewset_fields(db, api_client):
+    """
+    Only requested fields should be serialized and loaded, relations which are not
+    requested are not queried.
+    """
+    author = AuthorFactory()
+    category = CategoryFactory()
+    for i in range(3):
+        ArticleFactory(
+            cover=None,
+            image=None,
+            fill_authors=[author],
+            fill_categories=[category],
+            fill_tags=[TagFactory()],
+        )
+
+    url = reverse("lotus-api:article-list")
+
+    # Warmup request to fill the site cache
+    api_client.get(url)
+
+    with CaptureQueriesContext(connection) as captured:
+        response = api_client.get(url, {"fields": "url,title,detail_url,unknown"})
+    assert response.status_code == 200
+
+    items = response.json()["results"]
+    assert len(items) == 3
+    assert list(items[0].keys()) == ["detail_url", "title", "url"]
+
+    # Count query and article list query only
+    sqls = [item["sql"] for item in captured.captured_queries]
+    assert len(sqls) == 2
+    assert '"lotus_article"."content"' not in sqls[1]
+    assert '"lotus_article"."introduction"' not in sqls[1]
+
+    # Default shape prefetches its relations so the number of queries is fixed
+    with CaptureQueriesContext(connection) as captured:
+        response = api_client.get(url)
+    items = response.json()["results"]
+    assert len(items[0]["authors"]) == 1
+    assert len(items[0]["categories"]) == 1
+    assert len(items[0]["tags"]) == 1
+    assert len(captured.captured_queries) == 5
+
+
+def test_article_viewset_expand(db, api_client):
+    """
+    Expansions should add allowed fields only.
+    """
+    related = ArticleFactory(cover=None, image=None)
+    article = ArticleFactory(cover=None, image=None, fill_related=[related])
+
+    url = reverse("lotus-api:article-list")
+
+    response = api_client.get(url, {"expand": "related,content"})
+    items = {item["title"]: item for item in response.json()["results"]}
+    assert "content" not in items[article.title]
+    assert [item["title"] for item in items[article.title]["related"]] == [
+        related.title
+    ]
+
+    response = api_client.get(url, {"fields": "title,related", "expand": "related"})
+    item = response.json()["results"][0]
+    assert sorted(item.keys()) == ["related", "title"]
+
+
+def test_article_viewset_detail_fields(db, api_client):
+    """
+    Detail should be restricted to requested fields without relations queries.
+    """
+    article = ArticleFactory(
+        cover=None,
+        image=None,
+        fill_categories=[CategoryFactory()],
+        fill_authors=[AuthorFactory()],
+    )
+
+    url = reverse("lotus-api:article-detail", kwargs={"pk": article.id})
+    api_client.get(url)
+
+    with CaptureQueriesContext(connection) as captured:
+        response = api_client.get(url, {"fields": "title,states"})
+    assert response.status_code == 200
+    assert response.json() == {"states": ["available"], "title": article.title}
+    # The article and the next publication start and end which bound the payload
+    # cache timeout
+    assert len(captured.captured_queries) == 3
+
+    response = api_client.get(url, {"fields": "title,categories"})
+    assert len(response.json()["categories"]) == 1
+
+
+def test_category_author_viewsets_sparse(db, api_client):
+    """
+    Category and author viewsets should support fields and expansions.
+    """
+    category = CategoryFactory()
+    author = AuthorFactory(username="writer")
+    ArticleFactory(
+        cover=None,
+        image=None,
+        fill_categories=[category],
+        fill_authors=[author],
+    )
+
+    response = api_client.get(
+        reverse("lotus-api:category-detail", kwargs={"pk": category.id}),
+        {"fields": "title,detail_url"},
+    )
+    assert response.json() == {
+        "detail_url": category.get_absolute_url(),
+        "title": category.title,
+    }
+
+    response = api_client.get(
+        reverse("lotus-api:category-list"),
+        {"fields": "title,articles", "expand": "articles"},
+    )
+    item = response.json()["results"][0]
+    assert sorted(item.keys()) == ["articles", "title"]
+    assert len(item["articles"]) == 1
+
+    response = api_client.get(
+        reverse("lotus-api:author-list"),
+        {"expand": "username"},
+    )
+    item = response.json()["results"][0]
+    assert item["username"] == "writer"
+    assert "articles" not in item
+
+
+def test_article_viewset_expand_related_queries(db, api_client):
+    """
+    Expanded related articles should be resolved for the whole page with a constant
+    number of queries.
+    """
+    url = reverse("lotus-api:article-list")
+    related = ArticleFactory(cover=None, image=None)
+
+    def count_queries():
+        with CaptureQueriesContext(connection) as context:
+            response = api_client.get(
+                url,
+                {"fields": "title,related", "expand": "related"},
+            )
+        assert response.status_code == 200
+
+        return len(context.captured_queries), response.json()["results"]
+
+    ArticleFactory(cover=None, image=None, fill_related=[related])
+    # First request fills the site cache
+    count_queries()
+    few, results = count_queries()
+
+    ArticleFactory.create_batch(3, cover=None, image=None, fill_related=[related])
+    many, results = count_queries()
+
+    assert few == many
+    assert sorted(len(item["related"]) for item in results) == [0, 1, 1, 1, 1]
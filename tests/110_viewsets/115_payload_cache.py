@@ -0,0 +1,179 @@
+import datetime
+
+import pytest
+
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+
+from lotus.factories import (
+    ArticleFactory, AuthorFactory, CategoryFactory, TagFactory,
+)
+from lotus.models import Article
+
+try:
+    import rest_framework  # noqa: F401
+except ModuleNotFoundError:
+    API_AVAILABLE = False
+else:
+    API_AVAILABLE = True
+
+
+pytestmark = pytest.mark.skipif(
+    not API_AVAILABLE,
+    reason="Django REST is not available, API is disabled"
+)
+
+
+def test_article_payload_cache_hit(db, api_client):
+    """
+    A cached detail payload should be returned without serialization queries and
+    with the same content and headers.
+    """
+    article = ArticleFactory(
+        cover=None,
+        image=None,
+        fill_categories=[CategoryFactory()],
+        fill_authors=[AuthorFactory()],
+        fill_tags=[TagFactory()],
+    )
+    url = reverse("lotus-api:article-detail", kwargs={"pk": article.id})
+
+    with CaptureQueriesContext(connection) as captured:
+        first = api_client.get(url)
+    assert first.status_code == 200
+    assert len(captured.captured_queries) > 1
+
+    with CaptureQueriesContext(connection) as captured:
+        second = api_client.get(url)
+    assert second.status_code == 200
+    # Only the article query is left
+    assert len(captured.captured_queries) == 1
+
+    assert second.json() == first.json()
+    assert list(second.json().keys()) == list(first.json().keys())
+    assert second["ETag"] == first["ETag"]
+    assert second["Surrogate-Key"] == first["Surrogate-Key"]
+
+    # Requested fields have their own payload
+    response = api_client.get(url, {"fields": "title"})
+    assert response.json() == {"title": article.title}
+    assert response["ETag"] != first["ETag"]
+
+
+def test_article_payload_cache_conditional(db, api_client):
+    """
+    Detail should respond with a 304 when the ETag matches.
+    """
+    article = ArticleFactory(cover=None, image=None)
+    url = reverse("lotus-api:article-detail", kwargs={"pk": article.id})
+
+    etag = api_client.get(url)["ETag"]
+
+    response = api_client.get(url, HTTP_IF_NONE_MATCH=etag)
+    assert response.status_code == 304
+    assert response["ETag"] == etag
+
+    response = api_client.get(url, HTTP_IF_NONE_MATCH='"nope"')
+    assert response.status_code == 200
+
+
+def test_article_payload_cache_states(db, monkeypatch, api_client):
+    """
+    Publication states should never be cached and they change the ETag.
+    """
+    now = timezone.now()
+    article = ArticleFactory(
+        cover=None,
+        image=None,
+        publish_date=(now - datetime.timedelta(days=1)).date(),
+        publish_end=now + datetime.timedelta(hours=1),
+    )
+    url = reverse("lotus-api:article-detail", kwargs={"pk": article.id})
+
+    response = api_client.get(url)
+    assert response.json()["states"] == ["available"]
+    etag = response["ETag"]
+
+    # Simulate a state change that does not involve any object change
+    monkeypatch.setattr(
+        Article,
+        "get_states",
+        lambda self, now=None: ["available", "pinned"],
+    )
+
+    with CaptureQueriesContext(connection) as captured:
+        response = api_client.get(url, HTTP_IF_NONE_MATCH=etag)
+    assert len(captured.captured_queries) == 1
+
+    assert response.status_code == 200
+    assert response.json()["states"] == ["available", "pinned"]
+    assert response["ETag"] != etag
+
+
+def test_article_payload_cache_invalidation(db, api_client):
+    """
+    Payload cache should be dropped when the article or a relation changes.
+    """
+    category = CategoryFactory(title="Foo")
+    article = ArticleFactory(
+        title="Bar",
+        cover=None,
+        image=None,
+        fill_categories=[category],
+    )
+    url = reverse("lotus-api:article-detail", kwargs={"pk": article.id})
+
+    response = api_client.get(url)
+    assert response.json()["title"] == "Bar"
+    assert response.json()["categories"][0]["title"] == "Foo"
+
+    article.title = "Ping"
+    article.save()
+    assert api_client.get(url).json()["title"] == "Ping"
+
+    category.title = "Pong"
+    category.save()
+    assert api_client.get(url).json()["categories"][0]["title"] == "Pong"
+
+    article.categories.clear()
+    assert api_client.get(url).json()["categories"] == []
+
+
+def test_article_payload_cache_disabled(db, settings, api_client):
+    """
+    Without a cache timeout, detail is always serialized.
+    """
+    settings.LOTUS_API_CACHE_TIMEOUT = 0
+
+    article = ArticleFactory(cover=None, image=None)
+    url = reverse("lotus-api:article-detail", kwargs={"pk": article.id})
+
+    response = api_client.get(url)
+    assert response.status_code == 200
+    assert "ETag" not in response
+
+    with CaptureQueriesContext(connection) as captured:
+        api_client.get(url)
+    assert len(captured.captured_queries) > 1
+
+
+def test_category_payload_cache(db, api_client):
+    """
+    Category detail payload should be cached until category changes.
+    """
+    category = CategoryFactory(title="Foo")
+    url = reverse("lotus-api:category-detail", kwargs={"pk": category.id})
+
+    first = api_client.get(url)
+    assert first.json()["title"] == "Foo"
+
+    with CaptureQueriesContext(connection) as captured:
+        second = api_client.get(url)
+    assert len(captured.captured_queries) == 1
+    assert second.json() == first.json()
+
+    category.title = "Bar"
+    category.save()
+    assert api_client.get(url).json()["title"] == "Bar"
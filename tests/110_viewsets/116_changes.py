@@ -0,0 +1,322 @@
+import datetime
+import json
+
+import pytest
+from freezegun import freeze_time
+
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+
+from lotus.choices import STATUS_DRAFT
+from lotus.factories import ArticleFactory, CategoryFactory
+from lotus.models import DeletionLog
+
+try:
+    import rest_framework  # noqa: F401
+except ModuleNotFoundError:
+    API_AVAILABLE = False
+else:
+    API_AVAILABLE = True
+
+
+pytestmark = pytest.mark.skipif(
+    not API_AVAILABLE,
+    reason="Django REST is not available, API is disabled"
+)
+
+
+@pytest.fixture(autouse=True)
+def no_safety_margin(settings):
+    """
+    Objects created just before a request would be out of the feed with the
+    watermark safety margin.
+    """
+    settings.LOTUS_CHANGEFEED_SAFETY_MARGIN = 0
+
+
+def get_events(response):
+    """
+    Return decoded event lines from a streamed change feed response.
+    """
+    content = b"".join(response.streaming_content).decode("utf-8")
+
+    return [json.loads(line) for line in content.splitlines()]
+
+
+def summarize(events):
+    return [(item["type"], item["action"], item["id"]) for item in events[:-1]]
+
+
+def test_changes_snapshot(db, api_client):
+    """
+    Without watermark the feed should list available objects only and end with the
+    watermark.
+    """
+    article = ArticleFactory(cover=None, image=None)
+    ArticleFactory(cover=None, image=None, status=STATUS_DRAFT)
+    ArticleFactory(cover=None, image=None, private=True)
+    category = CategoryFactory(cover=None)
+
+    response = api_client.get(reverse("lotus-api:changes-list"))
+    assert response.status_code == 200
+    assert response["Content-Type"] == "application/x-ndjson"
+
+    events = get_events(response)
+    assert summarize(events) == [
+        ("article", "update", article.id),
+        ("category", "update", category.id),
+    ]
+    assert events[0]["data"]["title"] == article.title
+    assert events[0]["data"]["states"] == ["available"]
+    assert events[1]["data"]["title"] == category.title
+    assert events[-1]["type"] == "watermark"
+
+
+def test_changes_since(db, api_client):
+    """
+    With a watermark, feed should list changes, removals and deletions which
+    happened after it.
+    """
+    with freeze_time("2012-10-14 10:00:00"):
+        ArticleFactory(cover=None, image=None)
+        edited = ArticleFactory(cover=None, image=None)
+        unpublished = ArticleFactory(cover=None, image=None)
+        deleted = ArticleFactory(cover=None, image=None)
+        category = CategoryFactory(cover=None)
+        CategoryFactory(cover=None)
+
+    with freeze_time("2012-10-15 10:00:00"):
+        edited.title = "Edited"
+        edited.save()
+        unpublished.status = STATUS_DRAFT
+        unpublished.save()
+        deleted_id = deleted.id
+        deleted.delete()
+        category.delete()
+        # Never exposed so the client can not know about it
+        ArticleFactory(cover=None, image=None, status=STATUS_DRAFT)
+
+    with freeze_time("2012-10-16 10:00:00"):
+        response = api_client.get(
+            reverse("lotus-api:changes-list"),
+            {"since": "2012-10-15T00:00:00+00:00"},
+        )
+        events = get_events(response)
+
+    assert summarize(events) == [
+        ("article", "update", edited.id),
+        ("article", "remove", unpublished.id),
+        ("article", "delete", deleted_id),
+        ("category", "delete", category.id),
+    ]
+    assert events[0]["data"]["title"] == "Edited"
+    assert "data" not in events[1]
+    assert events[-1] == {
+        "type": "watermark",
+        "date": "2012-10-16T10:00:00Z",
+    }
+
+    # Next request from the watermark has nothing to report
+    with freeze_time("2012-10-16 11:00:00"):
+        response = api_client.get(
+            reverse("lotus-api:changes-list"),
+            {"since": events[-1]["date"]},
+        )
+        assert summarize(get_events(response)) == []
+
+
+def test_changes_transitions(db, api_client):
+    """
+    Articles which publication started or ended after the watermark should be
+    listed even without any edition.
+    """
+    now = timezone.now()
+
+    with freeze_time(now - datetime.timedelta(days=2)):
+        started = ArticleFactory(
+            cover=None,
+            image=None,
+            publish_date=(now - datetime.timedelta(hours=1)).date(),
+            publish_time=(now - datetime.timedelta(hours=1)).time(),
+        )
+        ended = ArticleFactory(
+            cover=None,
+            image=None,
+            publish_date=(now - datetime.timedelta(days=3)).date(),
+            publish_end=now - datetime.timedelta(hours=1),
+        )
+
+    response = api_client.get(
+        reverse("lotus-api:changes-list"),
+        {"since": (now - datetime.timedelta(days=1)).isoformat()},
+    )
+    events = get_events(response)
+
+    assert sorted(summarize(events)) == sorted([
+        ("article", "update", started.id),
+        ("article", "remove", ended.id),
+    ])
+
+
+def test_changes_since_offset(db, api_client):
+    """
+    Watermark with a timezone offset should be compared in UTC to the publication
+    dates.
+    """
+    with freeze_time("2012-10-14 10:00:00"):
+        started = ArticleFactory(
+            cover=None,
+            image=None,
+            publish_date=datetime.date(2012, 10, 15),
+            publish_time=datetime.time(9, 30),
+        )
+        ended = ArticleFactory(
+            cover=None,
+            image=None,
+            publish_end=datetime.datetime(
+                2012, 10, 15, 9, 0, tzinfo=datetime.timezone.utc
+            ),
+        )
+        # Publication started before the watermark, nothing to report
+        ArticleFactory(
+            cover=None,
+            image=None,
+            publish_date=datetime.date(2012, 10, 15),
+            publish_time=datetime.time(7, 30),
+        )
+
+    with freeze_time("2012-10-16 10:00:00"):
+        # Watermark is 2012-10-15 08:00 in UTC
+        response = api_client.get(
+            reverse("lotus-api:changes-list"),
+            {"since": "2012-10-15T10:00:00+02:00"},
+        )
+        events = get_events(response)
+
+    assert sorted(summarize(events)) == sorted([
+        ("article", "update", started.id),
+        ("article", "remove", ended.id),
+    ])
+
+
+def test_changes_private(db, api_client, admin_client):
+    """
+    Private articles should be listed for authenticated users and never reported to
+    anonymous, neither their removal or deletion.
+    """
+    with freeze_time("2012-10-14 10:00:00"):
+        article = ArticleFactory(cover=None, image=None)
+        deleted = ArticleFactory(cover=None, image=None, private=True)
+
+    with freeze_time("2012-10-15 10:00:00"):
+        article.private = True
+        article.save()
+        created = ArticleFactory(cover=None, image=None, private=True)
+        deleted_id = deleted.id
+        deleted.delete()
+
+    since = "2012-10-15T00:00:00+00:00"
+    url = reverse("lotus-api:changes-list")
+
+    with freeze_time("2012-10-16 10:00:00"):
+        events = get_events(api_client.get(url, {"since": since}))
+        assert summarize(events) == []
+
+        events = get_events(admin_client.get(url, {"since": since}))
+        assert summarize(events) == [
+            ("article", "update", article.id),
+            ("article", "update", created.id),
+            ("article", "delete", deleted_id),
+        ]
+
+
+def test_changes_safety_margin(db, settings, api_client):
+    """
+    Watermark should be before the request date from the safety margin, objects
+    saved within the margin are left to the next request.
+    """
+    settings.LOTUS_CHANGEFEED_SAFETY_MARGIN = 5
+
+    with freeze_time("2012-10-15 10:00:00"):
+        article = ArticleFactory(cover=None, image=None)
+
+    with freeze_time("2012-10-15 10:00:03"):
+        events = get_events(api_client.get(reverse("lotus-api:changes-list")))
+
+    assert summarize(events) == []
+    assert events[-1]["date"] == "2012-10-15T09:59:58Z"
+
+    with freeze_time("2012-10-15 10:00:10"):
+        events = get_events(api_client.get(
+            reverse("lotus-api:changes-list"),
+            {"since": events[-1]["date"]},
+        ))
+
+    assert summarize(events) == [("article", "update", article.id)]
+    assert events[-1]["date"] == "2012-10-15T10:00:05Z"
+
+
+def test_changes_language(db, api_client):
+    """
+    Feed can be filtered on a language.
+    """
+    ArticleFactory(cover=None, image=None, language="en")
+    french = ArticleFactory(cover=None, image=None, language="fr")
+
+    events = get_events(
+        api_client.get(reverse("lotus-api:changes-list"), {"language": "fr"})
+    )
+    assert summarize(events) == [("article", "update", french.id)]
+
+
+def test_changes_queries(db, api_client):
+    """
+    Number of queries should not depend on the number of changes.
+    """
+    for i in range(5):
+        ArticleFactory(cover=None, image=None)
+        CategoryFactory(cover=None)
+
+    # Warmup request to fill the site cache
+    get_events(api_client.get(reverse("lotus-api:changes-list")))
+
+    with CaptureQueriesContext(connection) as captured:
+        events = get_events(api_client.get(reverse("lotus-api:changes-list")))
+
+    assert len(events) == 11
+    assert len(captured.captured_queries) == 2
+
+
+def test_changes_invalid_since(db, api_client):
+    """
+    An invalid watermark should be refused.
+    """
+    response = api_client.get(
+        reverse("lotus-api:changes-list"),
+        {"since": "yesterday"},
+    )
+    assert response.status_code == 400
+    assert "since" in response.json()
+
+
+def test_deletion_log(db):
+    """
+    Deleting articles and categories should record them, including cascaded
+    translations.
+    """
+    original = ArticleFactory(cover=None, image=None)
+    translation = ArticleFactory(
+        cover=None, image=None, language="fr", original=original,
+    )
+    original_id = original.id
+    original.delete()
+
+    assert sorted([
+        (item.model_label, item.object_id, item.language)
+        for item in DeletionLog.objects.all()
+    ]) == [
+        ("lotus.article", original_id, "en"),
+        ("lotus.article", translation.id, "fr"),
+    ]
@@ -7,6 +7,8 @@ import pytest
 
 from PIL import ImageFont
 
+from django.core.cache import cache
+
 import lotus
 
 
@@ -72,6 +74,16 @@ def tests_settings():
     return FixturesSettingsTestMixin()
 
 
+@pytest.fixture(autouse=True)
+def clear_cache():
+    """
+    Clear the default cache after each test so cached payloads never leak between
+    tests since object IDs and dates may be reused.
+    """
+    yield
+    cache.clear()
+
+
 @pytest.fixture(scope="function")
 def enable_preview(settings):
     """